@@ -1,5 +1,6 @@
 import os
 import atexit
+import cv2
 from flask import Flask
 from appdirs import user_data_dir
 
@@ -83,6 +84,9 @@ def create_app(config_overrides=None):
         db.create_all()
         # Only initialize cameras and threads if not disabled
         if app.config.get("CAMERA_THREADS_ENABLED", True):
+            opencv_threads = app.config.get("OPENCV_NUM_THREADS", 1)
+            if opencv_threads > 0:
+                cv2.setNumThreads(opencv_threads)
             genicam_setting = db.session.get(Setting, "genicam_cti_path")
             cti_path = genicam_setting.value if genicam_setting else ""
             GenICamDriver.initialize(cti_path)
@@ -14,11 +14,16 @@ from app.calibration_utils import generate_chessboard_pdf, generate_charuco_boar
 import cv2
 import io
 import numpy as np
+from functools import lru_cache
 from . import calibration
 
 
+@lru_cache(maxsize=8)
 def create_error_image(message, width=640, height=480):
-    """Creates a black image with white text for error display."""
+    """Creates a black image with white text for error display.
+
+    Only a handful of fixed messages are used, so each rendered JPEG is cached.
+    """
     img = np.zeros((height, width, 3), np.uint8)
     font = cv2.FONT_HERSHEY_SIMPLEX
     text_size = cv2.getTextSize(message, font, 1, 2)[0]
@@ -16,8 +16,41 @@ class CalibrationManager:
     def __init__(self):
         """Initializes the CalibrationManager."""
         self._sessions = {}
+        self._listeners = {}
         self._lock = threading.Lock()
 
+    def register_listener(self, camera_id, callback):
+        """
+        Registers a callback for session start/end on a camera.
+
+        The callback is called with True when a session starts and False when it
+        ends, and is called once immediately with the current state.
+
+        Args:
+            camera_id (int): The camera to watch.
+            callback (callable): Function taking a single bool argument.
+        """
+        with self._lock:
+            self._listeners.setdefault(camera_id, []).append(callback)
+            active = camera_id in self._sessions
+        callback(active)
+
+    def unregister_listener(self, camera_id, callback):
+        """Removes a callback previously passed to register_listener."""
+        with self._lock:
+            callbacks = self._listeners.get(camera_id)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._listeners[camera_id]
+
+    def _notify_listeners(self, camera_id, active):
+        # Called outside the lock so callbacks may query the manager
+        with self._lock:
+            callbacks = list(self._listeners.get(camera_id, ()))
+        for callback in callbacks:
+            callback(active)
+
     def start_session(self, camera_id, pattern_type, pattern_params):
         """
         Initializes a new calibration session for a specified camera.
@@ -53,6 +86,7 @@ class CalibrationManager:
 
             self._sessions[camera_id] = session
             print(f"Started {pattern_type} calibration session for camera {camera_id}")
+        self._notify_listeners(camera_id, True)
 
     def get_session(self, camera_id):
         """Retrieves the active calibration session for a given camera."""
@@ -62,9 +96,10 @@ class CalibrationManager:
     def end_session(self, camera_id):
         """Ends a camera's calibration session and discards its data."""
         with self._lock:
-            if camera_id in self._sessions:
-                del self._sessions[camera_id]
-                print(f"Ended calibration session for camera {camera_id}")
+            ended = self._sessions.pop(camera_id, None) is not None
+        if ended:
+            print(f"Ended calibration session for camera {camera_id}")
+            self._notify_listeners(camera_id, False)
 
     def capture_points(self, camera_id, frame):
         """
@@ -85,7 +120,10 @@ class CalibrationManager:
             if session["frame_shape"] is None:
                 session["frame_shape"] = frame.shape[:2]
 
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Mono cameras deliver single-channel frames already
+            gray = (
+                frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            )
             p = session["pattern_params"]
 
             if session["pattern_type"] == "Chessboard":
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .drivers.usb_driver import USBDriver
 from .drivers.genicam_driver import GenICamDriver
 from .drivers.oakd_driver import OAKDDriver
@@ -5,6 +7,17 @@ from .drivers.realsense_driver import RealSenseDriver
 
 
 # --- Driver Factory ---
+# Read-only map of Camera.camera_type to driver class, built once at import
+DRIVER_REGISTRY = MappingProxyType(
+    {
+        "USB": USBDriver,
+        "GenICam": GenICamDriver,
+        "OAK-D": OAKDDriver,
+        "RealSense": RealSenseDriver,
+    }
+)
+
+
 def get_driver(camera_data):
     """
     Factory function to get the correct driver instance.
@@ -19,16 +32,10 @@ def get_driver(camera_data):
         # ORM object
         camera_type = camera_data.camera_type
 
-    if camera_type == "USB":
-        return USBDriver(camera_data)
-    elif camera_type == "GenICam":
-        return GenICamDriver(camera_data)
-    elif camera_type == "OAK-D":
-        return OAKDDriver(camera_data)
-    elif camera_type == "RealSense":
-        return RealSenseDriver(camera_data)
-    else:
+    driver_class = DRIVER_REGISTRY.get(camera_type)
+    if driver_class is None:
         raise ValueError(f"Unknown camera type: {camera_type}")
+    return driver_class(camera_data)
 
 
 # --- Camera Discovery ---
@@ -1,10 +1,14 @@
 import threading
-import queue
+from types import MappingProxyType
 from typing import List, TypedDict, Optional
 from sqlalchemy.orm import joinedload
 
 from .models import Camera
-from .camera_threads import CameraAcquisitionThread, VisionProcessingThread
+from .camera_threads import (
+    CameraAcquisitionThread,
+    FrameQueue,
+    VisionProcessingThread,
+)
 
 
 class PipelineThreadConfig(TypedDict):
@@ -63,8 +67,58 @@ def build_camera_thread_config(camera: Camera) -> CameraThreadConfig:
 
 
 # --- Globals & Threading Primitives ---
+# Processed previews are shown as dashboard tiles, so they are downscaled to this
+# width before JPEG encoding. Pipelines still run on full-resolution frames.
+PROCESSED_STREAM_MAX_WIDTH = 640
+# Live camera feeds are downscaled so their longer side fits this before the FPS
+# overlay and JPEG encode; pipelines and calibration still see full frames.
+DISPLAY_STREAM_MAX_DIM = 1280
+# Browsers gain nothing from live feeds faster than this, so higher-rate cameras
+# only prepare a display frame this many times per second.
+DISPLAY_STREAM_MAX_FPS = 30
+# Pipelines get a single "latest frame" slot: the acquisition thread replaces an
+# unconsumed frame with the newer one, so a busy pipeline always picks up the
+# freshest frame instead of working through a backlog.
+PIPELINE_QUEUE_SIZE = 1
+
+# Mutations (and multi-step read-modify-write sequences) take the lock and end
+# with _publish_camera_threads(), which swaps in a read-only copy of the whole
+# registry. Readers that do not mutate use that snapshot, via
+# get_active_camera_threads(), without taking the lock.
 active_camera_threads = {}
 active_camera_threads_lock = threading.Lock()
+_camera_threads_snapshot = MappingProxyType({})
+
+
+def _publish_camera_threads():
+    """Publishes a read-only snapshot of active_camera_threads.
+
+    Must be called with active_camera_threads_lock held, after every change to
+    the registry or to a thread group.
+    """
+    global _camera_threads_snapshot
+    _camera_threads_snapshot = MappingProxyType(
+        {
+            identifier: MappingProxyType(
+                {
+                    **group,
+                    "processing_threads": MappingProxyType(
+                        dict(group["processing_threads"])
+                    ),
+                }
+            )
+            for identifier, group in active_camera_threads.items()
+        }
+    )
+
+
+def get_active_camera_threads():
+    """Returns the latest read-only snapshot of the running camera thread groups.
+
+    The snapshot never changes once published, so it can be iterated without
+    holding active_camera_threads_lock.
+    """
+    return _camera_threads_snapshot
 
 
 # --- Centralized Thread Management ---
@@ -91,6 +145,8 @@ def start_camera_thread(camera_config: CameraThreadConfig, app):
                 exposure_value=camera_config["exposure_value"],
                 gain_mode=camera_config["gain_mode"],
                 gain_value=camera_config["gain_value"],
+                display_max_dim=DISPLAY_STREAM_MAX_DIM,
+                display_max_fps=DISPLAY_STREAM_MAX_FPS,
             )
 
             # Pipelines are loaded via the relationship
@@ -98,7 +154,7 @@ def start_camera_thread(camera_config: CameraThreadConfig, app):
 
             processing_threads = {}
             for pipeline in pipelines:
-                frame_queue = queue.Queue(maxsize=2)
+                frame_queue = FrameQueue(maxsize=PIPELINE_QUEUE_SIZE)
                 # Pass primitive values instead of ORM objects
                 # Pipeline frames use lower quality (75) to save CPU
                 proc_thread = VisionProcessingThread(
@@ -110,6 +166,7 @@ def start_camera_thread(camera_config: CameraThreadConfig, app):
                     dist_coeffs_json=camera_config["dist_coeffs_json"],
                     frame_queue=frame_queue,
                     jpeg_quality=75,
+                    display_width=PROCESSED_STREAM_MAX_WIDTH,
                 )
 
                 acq_thread.add_pipeline_queue(pipeline["id"], frame_queue)
@@ -119,6 +176,7 @@ def start_camera_thread(camera_config: CameraThreadConfig, app):
                 "acquisition": acq_thread,
                 "processing_threads": processing_threads,
             }
+            _publish_camera_threads()
 
             acq_thread.start()
             for proc_thread in processing_threads.values():
@@ -127,19 +185,32 @@ def start_camera_thread(camera_config: CameraThreadConfig, app):
 
 def stop_camera_thread(identifier):
     """Stops all threads for a single camera."""
+    threads = _signal_stop(identifier)
+    if threads is not None:
+        _await_stop(identifier, *threads)
+
+
+def _signal_stop(identifier):
+    """Marks a camera as stopping and signals its threads to stop.
+
+    Returns:
+        tuple: (acquisition thread, [(pipeline_id, processing thread), ...]), or
+        None if the camera is not running or is already being stopped.
+    """
     # Step 1: Mark camera as stopping and copy thread references under lock
     with active_camera_threads_lock:
         if identifier not in active_camera_threads:
-            return
+            return None
 
         thread_group = active_camera_threads[identifier]
 
         # Mark as stopping to prevent concurrent access issues
         if thread_group.get("stopping", False):
             print(f"Camera {identifier} is already being stopped")
-            return
+            return None
 
         thread_group["stopping"] = True
+        _publish_camera_threads()
         print(f"Stopping threads for camera {identifier}")
 
         # Copy thread references while holding lock to avoid TOCTOU race condition
@@ -150,7 +221,11 @@ def stop_camera_thread(identifier):
     for pipeline_id, proc_thread in proc_threads_list:
         proc_thread.stop()
     acq_thread.stop()
+    return acq_thread, proc_threads_list
+
 
+def _await_stop(identifier, acq_thread, proc_threads_list):
+    """Joins threads signalled by _signal_stop and unregisters the camera."""
     # Step 3: Wait for threads to terminate with timeout
     acq_thread.join(timeout=5)
 
@@ -170,6 +245,7 @@ def stop_camera_thread(identifier):
     with active_camera_threads_lock:
         if identifier in active_camera_threads:
             active_camera_threads.pop(identifier)
+            _publish_camera_threads()
             print(f"Successfully stopped and removed threads for camera {identifier}")
 
 
@@ -209,7 +285,7 @@ def add_pipeline_to_camera(
 
         if pipeline_id not in thread_group["processing_threads"]:
             print(f"Dynamically adding pipeline {pipeline_id} to camera {identifier}")
-            frame_queue = queue.Queue(maxsize=2)
+            frame_queue = FrameQueue(maxsize=PIPELINE_QUEUE_SIZE)
             # Pass primitive values instead of ORM objects
             # Pipeline frames use lower quality (75) to save CPU
             proc_thread = VisionProcessingThread(
@@ -221,9 +297,11 @@ def add_pipeline_to_camera(
                 dist_coeffs_json=dist_coeffs_json,
                 frame_queue=frame_queue,
                 jpeg_quality=75,
+                display_width=PROCESSED_STREAM_MAX_WIDTH,
             )
             thread_group["acquisition"].add_pipeline_queue(pipeline_id, frame_queue)
             thread_group["processing_threads"][pipeline_id] = proc_thread
+            _publish_camera_threads()
             proc_thread.start()
 
 
@@ -251,6 +329,7 @@ def remove_pipeline_from_camera(identifier, pipeline_id):
                 f"Dynamically removing pipeline {pipeline_id} from camera {identifier}"
             )
             proc_thread = thread_group["processing_threads"].pop(pipeline_id)
+            _publish_camera_threads()
 
             proc_thread.stop()
             thread_group["acquisition"].remove_pipeline_queue(pipeline_id)
@@ -297,13 +376,14 @@ def update_pipeline_in_camera(
         if pipeline_id in thread_group["processing_threads"]:
             print(f"Stopping old pipeline thread {pipeline_id} for update.")
             old_proc_thread = thread_group["processing_threads"].pop(pipeline_id)
+            _publish_camera_threads()
             old_proc_thread.stop()
             thread_group["acquisition"].remove_pipeline_queue(pipeline_id)
             old_proc_thread.join(timeout=2)  # Wait for it to terminate
 
         # 2. Start a new thread with the updated pipeline config
         print(f"Starting new pipeline thread {pipeline_id} with updated config.")
-        frame_queue = queue.Queue(maxsize=2)
+        frame_queue = FrameQueue(maxsize=PIPELINE_QUEUE_SIZE)
         # Pass primitive values instead of ORM objects
         # Pipeline frames use lower quality (75) to save CPU
         new_proc_thread = VisionProcessingThread(
@@ -315,10 +395,12 @@ def update_pipeline_in_camera(
             dist_coeffs_json=dist_coeffs_json,
             frame_queue=frame_queue,
             jpeg_quality=75,
+            display_width=PROCESSED_STREAM_MAX_WIDTH,
         )
 
         thread_group["acquisition"].add_pipeline_queue(pipeline_id, frame_queue)
         thread_group["processing_threads"][pipeline_id] = new_proc_thread
+        _publish_camera_threads()
         new_proc_thread.start()
 
 
@@ -340,36 +422,42 @@ def stop_all_camera_threads():
     with active_camera_threads_lock:
         identifiers_to_stop = list(active_camera_threads.keys())
 
+    # Every camera is signalled before any is joined, so their shutdowns overlap
+    # and the total wait is that of the slowest camera rather than the sum
+    stopping = []
     for identifier in identifiers_to_stop:
-        stop_camera_thread(identifier)
+        threads = _signal_stop(identifier)
+        if threads is not None:
+            stopping.append((identifier, threads))
+
+    for identifier, threads in stopping:
+        _await_stop(identifier, *threads)
 
     print("All camera threads stopped.")
 
 
 def get_camera_pipeline_results(identifier):
     """Gets the latest results from all pipelines for a given camera."""
-    with active_camera_threads_lock:
-        thread_group = active_camera_threads.get(identifier)
-        if not thread_group:
-            return None
+    thread_group = get_active_camera_threads().get(identifier)
+    if not thread_group:
+        return None
 
-        results = {}
-        for pipeline_id, proc_thread in thread_group["processing_threads"].items():
-            results[pipeline_id] = proc_thread.get_latest_results()
+    results = {}
+    for pipeline_id, proc_thread in thread_group["processing_threads"].items():
+        results[pipeline_id] = proc_thread.get_latest_results()
 
-        return results
+    return results
 
 
 def is_camera_thread_running(identifier):
     """Checks if a camera's acquisition thread is active."""
-    with active_camera_threads_lock:
-        thread_group = active_camera_threads.get(identifier)
-        if not thread_group:
-            return False
-        # Don't report as running if it's being stopped
-        if thread_group.get("stopping", False):
-            return False
-        return thread_group["acquisition"].is_alive()
+    thread_group = get_active_camera_threads().get(identifier)
+    if not thread_group:
+        return False
+    # Don't report as running if it's being stopped
+    if thread_group.get("stopping", False):
+        return False
+    return thread_group["acquisition"].is_alive()
 
 
 def notify_camera_config_update(identifier, new_orientation):
@@ -1,6 +1,10 @@
-import time
-import cv2
-from .camera_manager import active_camera_threads, active_camera_threads_lock
+from .camera_manager import get_active_camera_threads
+
+# Multipart framing around each JPEG. The parts are yielded as separate chunks so
+# the encoded frame, which is shared by every client, is written out as-is
+# instead of being concatenated into a new bytes object per client per frame.
+_MJPEG_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_PART_TRAILER = b"\r\n"
 
 
 # --- Web Streaming & Camera Utilities ---
@@ -12,8 +16,7 @@ def get_camera_feed(camera):
     """
     identifier = camera.identifier
 
-    with active_camera_threads_lock:
-        thread_group = active_camera_threads.get(identifier)
+    thread_group = get_active_camera_threads().get(identifier)
 
     if not thread_group or not thread_group["acquisition"].is_alive():
         print(
@@ -23,36 +26,34 @@ def get_camera_feed(camera):
 
     acq_thread = thread_group["acquisition"]
     last_frame_seq = -1
+    # Display frames are only prepared while a client is connected
+    acq_thread.add_viewer()
 
     try:
         while True:
-            frame_bytes = None
-            with acq_thread.frame_lock:
-                current_frame_seq = getattr(acq_thread, "display_frame_seq", -1)
-                latest_frame = acq_thread.latest_display_frame_raw
-                if latest_frame is not None and current_frame_seq != last_frame_seq:
-                    ret, buffer = cv2.imencode(
-                        ".jpg",
-                        latest_frame,
-                        [cv2.IMWRITE_JPEG_QUALITY, acq_thread.jpeg_quality],
-                    )
-                    if ret:
-                        frame_bytes = buffer.tobytes()
-                        last_frame_seq = current_frame_seq
-
-            if frame_bytes is not None:
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n"
-                )
-                continue
+            # Sleeps until the acquisition thread publishes a new display frame;
+            # the timeout only bounds how long a dead thread goes unnoticed
+            current_frame_seq = acq_thread.wait_for_display_frame(
+                last_frame_seq, timeout=1.0
+            )
+            if current_frame_seq != last_frame_seq:
+                # Mark the sequence handled even without a frame so a cleared
+                # display frame is not retried in a tight loop
+                last_frame_seq = current_frame_seq
+                frame_bytes = acq_thread.get_display_frame()
+                if frame_bytes is not None:
+                    yield _MJPEG_PART_HEADER
+                    yield frame_bytes
+                    yield _MJPEG_PART_TRAILER
+                    continue
 
             if not acq_thread.is_alive():
                 print(f"Stopping feed for {identifier} as acquisition thread has died.")
                 break
-            time.sleep(0.001)
     except GeneratorExit:
         print(f"Client disconnected from camera feed {identifier}.")
+    finally:
+        acq_thread.remove_viewer()
 
 
 def get_processed_camera_feed(pipeline_id):
@@ -62,11 +63,11 @@ def get_processed_camera_feed(pipeline_id):
     avoiding wasteful encoding when no clients are connected.
     """
     proc_thread = None
-    with active_camera_threads_lock:
-        for thread_group in active_camera_threads.values():
-            if pipeline_id in thread_group["processing_threads"]:
-                proc_thread = thread_group["processing_threads"][pipeline_id]
-                break
+    # Read-only snapshot; iterating it needs no lock
+    for thread_group in get_active_camera_threads().values():
+        proc_thread = thread_group["processing_threads"].get(pipeline_id)
+        if proc_thread is not None:
+            break
 
     if not proc_thread or not proc_thread.is_alive():
         print(
@@ -75,51 +76,51 @@ def get_processed_camera_feed(pipeline_id):
         return
 
     last_frame_seq = -1
+    # Processed frames are only annotated while a client is connected
+    proc_thread.add_viewer()
 
     try:
         while True:
-            frame_bytes = None
-            with proc_thread.processed_frame_lock:
-                current_frame_seq = getattr(proc_thread, "processed_frame_seq", -1)
-                latest_frame = proc_thread.latest_processed_frame_raw
-                if latest_frame is not None and current_frame_seq != last_frame_seq:
-                    ret, buffer = cv2.imencode(
-                        ".jpg",
-                        latest_frame,
-                        [cv2.IMWRITE_JPEG_QUALITY, proc_thread.jpeg_quality],
-                    )
-                    if ret:
-                        frame_bytes = buffer.tobytes()
-                        last_frame_seq = current_frame_seq
-
-            if frame_bytes is not None:
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n"
-                )
-                continue
+            # Sleeps until the processing thread publishes a new frame; the
+            # timeout only bounds how long a dead thread goes unnoticed
+            current_frame_seq = proc_thread.wait_for_processed_frame(
+                last_frame_seq, timeout=1.0
+            )
+            if current_frame_seq != last_frame_seq:
+                last_frame_seq = current_frame_seq
+                # The thread owns encoding so it can downscale into its own buffer
+                frame_bytes = proc_thread.get_processed_frame()
+                if frame_bytes is not None:
+                    yield _MJPEG_PART_HEADER
+                    yield frame_bytes
+                    yield _MJPEG_PART_TRAILER
+                    continue
 
             if not proc_thread.is_alive():
                 print(
                     f"Stopping processed feed for {pipeline_id} as its thread has died."
                 )
                 break
-            time.sleep(0.001)
     except GeneratorExit:
         print(f"Client disconnected from processed feed {pipeline_id}.")
+    finally:
+        proc_thread.remove_viewer()
 
 
 def get_latest_raw_frame(identifier):
     """Gets the latest raw, unprocessed frame from a camera's acquisition thread."""
-    with active_camera_threads_lock:
-        thread_group = active_camera_threads.get(identifier)
+    thread_group = get_active_camera_threads().get(identifier)
 
     if not thread_group or not thread_group["acquisition"].is_alive():
         return None
 
     acq_thread = thread_group["acquisition"]
-    with acq_thread.raw_frame_lock:
-        if acq_thread.latest_raw_frame is not None:
-            # latest_raw_frame is now a RefCountedFrame, get a writable copy
-            return acq_thread.latest_raw_frame.get_writable_copy()
-    return None
+    raw_frame = acq_thread.latest_raw_frame
+    # The acquisition thread swaps this reference without a lock, so take our own
+    # reference before copying; this fails if the frame was already recycled.
+    if raw_frame is None or not raw_frame.try_acquire():
+        return None
+    try:
+        return raw_frame.get_writable_copy()
+    finally:
+        raw_frame.release()
@@ -2,6 +2,7 @@ import cv2
 import threading
 import time
 import queue
+from collections import deque
 import numpy as np
 import json
 import logging
@@ -14,6 +15,8 @@ from .pipelines.coloured_shape_pipeline import ColouredShapePipeline
 from .pipelines.object_detection_ml_pipeline import ObjectDetectionMLPipeline
 from .camera_discovery import get_driver
 from .metrics import metrics_registry
+from .jpeg_encoder import JpegEncoder
+from .hw.accel import _has_opencl
 from .pipeline_validators import (
     get_default_config,
     recommended_apriltag_threads,
@@ -21,6 +24,63 @@ from .pipeline_validators import (
 
 logger = logging.getLogger(__name__)
 
+# FPS overlay text style for the display stream
+_FPS_TEXT_ORIGIN = (10, 30)
+_FPS_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_FPS_FONT_SCALE = 0.7
+_FPS_COLOR = (0, 255, 0)
+# BT.601 luma of _FPS_COLOR (BGR), used to draw the text on single-channel frames
+_FPS_LUMA = round(0.114 * _FPS_COLOR[0] + 0.587 * _FPS_COLOR[1] + 0.299 * _FPS_COLOR[2])
+_FPS_THICKNESS = 2
+_FPS_LABEL = "FPS: "
+_format_fps = "{:.2f}".format
+
+# cv2.rotate codes by camera orientation in degrees; anything else is unrotated
+_ROTATE_CODES = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+
+def _build_fps_glyph_atlas():
+    """Pre-renders the FPS label and digit glyphs used by the display overlay.
+
+    Returns:
+        tuple: (glyphs, text height, padding) where ``glyphs`` maps each string to
+        its (uint8 coverage, x advance). Glyphs composed at their advances match
+        cv2.putText of the whole string pixel for pixel.
+    """
+    pad = _FPS_THICKNESS
+    (_, text_h), baseline = cv2.getTextSize(
+        _FPS_LABEL + "0123456789.", _FPS_FONT, _FPS_FONT_SCALE, _FPS_THICKNESS
+    )
+
+    def text_width(text):
+        return cv2.getTextSize(text, _FPS_FONT, _FPS_FONT_SCALE, _FPS_THICKNESS)[0][0]
+
+    glyphs = {}
+    for text in [_FPS_LABEL] + list("0123456789."):
+        coverage = np.zeros(
+            (text_h + baseline + 2 * pad, text_width(text) + 2 * pad), dtype=np.uint8
+        )
+        cv2.putText(
+            coverage,
+            text,
+            (pad, pad + text_h),
+            _FPS_FONT,
+            _FPS_FONT_SCALE,
+            255,
+            _FPS_THICKNESS,
+        )
+        # The pen advance excludes the stroke overhang included in the text width
+        advance = sum(text_width(ch * 2) - text_width(ch) for ch in text)
+        glyphs[text] = (coverage, advance)
+    return glyphs, text_h, pad
+
+
+_FPS_GLYPHS, _FPS_TEXT_HEIGHT, _FPS_PAD = _build_fps_glyph_atlas()
+
 
 def _coerce_real(value) -> Optional[float]:
     """Return float(value) when possible, otherwise None."""
@@ -56,12 +116,43 @@ class RefCountedFrame:
         self._lock = threading.Lock()
         self._created_time = time.perf_counter()
         self._enqueue_times: Dict[int, float] = {}
+        # Set by RefCountedFramePool; called with this wrapper once released
+        self._recycle = None
+
+    def _rebind(self, frame_buffer, release_callback, depth_buffer, depth_release_callback):
+        """Points a released wrapper at a new frame. Only called by its pool."""
+        self.frame_buffer = frame_buffer
+        self.depth_buffer = depth_buffer
+        self._release_callback = release_callback
+        self._depth_release_callback = depth_release_callback
+        self._created_time = time.perf_counter()
+        self._enqueue_times.clear()
 
     def acquire(self):
         """Increments the reference count."""
         with self._lock:
             self._ref_count += 1
 
+    def acquire_n(self, n):
+        """Increments the reference count by ``n`` in a single locked update."""
+        with self._lock:
+            self._ref_count += n
+
+    def try_acquire(self):
+        """Increments the reference count unless the frame was already released.
+
+        Used by readers that pick up a published frame without holding a lock: a
+        frame whose count already reached zero has been returned to its pool.
+
+        Returns:
+            bool: True if a reference was taken.
+        """
+        with self._lock:
+            if self._ref_count == 0:
+                return False
+            self._ref_count += 1
+            return True
+
     def release(self):
         """Decrements the reference count and calls the release callback if the count is zero."""
         with self._lock:
@@ -72,6 +163,8 @@ class RefCountedFrame:
                         self._release_callback(self.frame_buffer)
                     if self._depth_release_callback and self.depth_buffer is not None:
                         self._depth_release_callback(self.depth_buffer)
+                    if self._recycle is not None:
+                        self._recycle(self)
 
     @property
     def data(self):
@@ -118,13 +211,113 @@ class RefCountedFrame:
     ) -> None:
         """Record when the frame was enqueued for a specific pipeline."""
         ts = time.perf_counter() if timestamp is None else timestamp
-        with self._lock:
-            self._enqueue_times[pipeline_id] = ts
+        # A single dict store or pop is atomic, and each pipeline touches only its
+        # own key, so the timestamps do not need the reference count lock
+        self._enqueue_times[pipeline_id] = ts
 
     def pop_enqueue_timestamp(self, pipeline_id: int) -> Optional[float]:
         """Return and clear the stored enqueue timestamp for a pipeline."""
-        with self._lock:
-            return self._enqueue_times.pop(pipeline_id, None)
+        return self._enqueue_times.pop(pipeline_id, None)
+
+
+class RefCountedFramePool:
+    """Recycles RefCountedFrame wrappers for a capture loop.
+
+    Wrapping each captured frame would otherwise allocate a wrapper, a lock and a
+    timestamp dict per frame. Wrappers come back when their count reaches zero,
+    so nothing may use a wrapper after its last release. Lock-free readers of a
+    published frame go through ``try_acquire``: on a recycled wrapper that either
+    fails or pins the newer frame it now holds, which latest-frame readers accept.
+    """
+
+    def __init__(self, max_free=32):
+        # deque append/pop are atomic, so wrappers can be returned from any thread
+        self._free = deque(maxlen=max_free)
+
+    def wrap(
+        self,
+        frame_buffer,
+        release_callback,
+        depth_buffer=None,
+        depth_release_callback=None,
+    ):
+        """Returns a wrapper with a zero count around the given buffers."""
+        try:
+            frame = self._free.pop()
+        except IndexError:
+            frame = RefCountedFrame(
+                frame_buffer, release_callback, depth_buffer, depth_release_callback
+            )
+            frame._recycle = self._free.append
+            return frame
+        frame._rebind(
+            frame_buffer, release_callback, depth_buffer, depth_release_callback
+        )
+        return frame
+
+
+class FrameQueue(queue.Queue):
+    """A bounded frame queue with single-lock bulk operations.
+
+    Behaves like ``queue.Queue`` for consumers, and adds helpers for operations
+    that would otherwise take several lock round trips: replacing the oldest
+    frame when full, draining several frames at once, and reading the remaining
+    depth together with a dequeued frame.
+    """
+
+    def get_with_depth(self, timeout=None):
+        """Like ``get()``, also returning how many items remain after the pop.
+
+        Raises:
+            queue.Empty: If no item arrives within ``timeout`` seconds.
+
+        Returns:
+            tuple: (item, remaining queue size)
+        """
+        with self.not_empty:
+            if timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            else:
+                endtime = time.monotonic() + timeout
+                while not self._qsize():
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    self.not_empty.wait(remaining)
+            item = self._get()
+            self.not_full.notify()
+            return item, self._qsize()
+
+    def put_latest(self, item):
+        """Enqueues an item, evicting the oldest one if the queue is full.
+
+        Returns:
+            The evicted item, or None if there was room.
+        """
+        with self.mutex:
+            dropped = None
+            if 0 < self.maxsize <= self._qsize():
+                dropped = self._get()
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return dropped
+
+    def drain(self, max_items=None):
+        """Removes up to ``max_items`` of the oldest items (all when None).
+
+        Returns:
+            list: The removed items, oldest first.
+        """
+        with self.mutex:
+            count = self._qsize()
+            if max_items is not None:
+                count = min(count, max_items)
+            items = [self._get() for _ in range(count)]
+            if items:
+                self.not_full.notify(len(items))
+            return items
 
 
 class FrameBufferPool:
@@ -147,8 +340,11 @@ class FrameBufferPool:
         shrink_idle_seconds=10.0,
         enable_depth=False,
     ):
-        self._pool = queue.Queue()
-        self._depth_pool = queue.Queue() if enable_depth else None
+        # Plain deques: the pool never blocks, and append()/pop() are atomic, so
+        # checkout and return need no lock or condition signalling. Popping the
+        # most recently returned buffer also hands out the cache-warmest one.
+        self._pool = deque()
+        self._depth_pool = deque() if enable_depth else None
         self._buffer_shape = None
         self._buffer_dtype = None
         self._depth_buffer_shape = None
@@ -164,13 +360,19 @@ class FrameBufferPool:
         self._lock = threading.Lock()
         self._last_allocation_time = None
         self._shrink_check_counter = 0
+        # Frames refused because the pool was at max_buffers; the log line is
+        # rate-limited so a stalled consumer does not flood the console
+        self.exhausted_count = 0
+        self._last_exhausted_log = None
 
     def initialize(self, frame, num_buffers=None, depth_frame=None):
         """Initializes the pool with buffers matching the shape and type of a sample frame.
 
         Args:
             frame: Sample color frame to determine buffer shape
-            num_buffers: Number of buffers to pre-allocate (default: initial_buffers)
+            num_buffers: Number of buffers to pre-allocate (default: initial_buffers).
+                A larger value also raises the size the pool shrinks back to, so a
+                pool pre-sized to the steady-state working set stays that size.
             depth_frame: Optional sample depth frame for depth-capable cameras
         """
 
@@ -186,13 +388,15 @@ class FrameBufferPool:
         # If shape is different, we need to re-initialize.
         if num_buffers is None:
             num_buffers = self._initial_buffers
+        num_buffers = min(num_buffers, self._max_buffers)
+        self._initial_buffers = max(self._initial_buffers, num_buffers)
 
         print(f"[{self._name}] Initializing buffer pool for shape {frame.shape}...")
-        self._pool = queue.Queue()
+        self._pool = deque()
         self._buffer_shape = frame.shape
         self._buffer_dtype = frame.dtype
         for _ in range(num_buffers):
-            self._pool.put(np.empty(self._buffer_shape, dtype=self._buffer_dtype))
+            self._pool.append(np.empty(self._buffer_shape, dtype=self._buffer_dtype))
         self._allocated = num_buffers
         self._last_allocation_time = None
         self._shrink_check_counter = 0
@@ -203,11 +407,11 @@ class FrameBufferPool:
         # Initialize depth pool if enabled and depth frame provided
         if self._enable_depth and depth_frame is not None:
             print(f"[{self._name}] Initializing depth buffer pool for shape {depth_frame.shape}...")
-            self._depth_pool = queue.Queue()
+            self._depth_pool = deque()
             self._depth_buffer_shape = depth_frame.shape
             self._depth_buffer_dtype = depth_frame.dtype
             for _ in range(num_buffers):
-                self._depth_pool.put(np.empty(self._depth_buffer_shape, dtype=self._depth_buffer_dtype))
+                self._depth_pool.append(np.empty(self._depth_buffer_shape, dtype=self._depth_buffer_dtype))
             self._depth_allocated = num_buffers
             print(
                 f"[{self._name}] Depth buffer pool initialized with {num_buffers} buffers."
@@ -222,22 +426,20 @@ class FrameBufferPool:
         """
         # Get color buffer
         try:
-            color_buffer = self._pool.get_nowait()
-        except queue.Empty:
+            color_buffer = self._pool.pop()
+        except IndexError:
             if self._buffer_shape is not None:
                 with self._lock:
                     if self._allocated < self._max_buffers:
                         self._allocated += 1
-                        self._last_allocation_time = time.time()
+                        self._last_allocation_time = time.monotonic()
                         print(
                             f"[{self._name}] Pool empty, allocating new buffer. Total allocated: {self._allocated}"
                         )
                         color_buffer = np.empty(self._buffer_shape, dtype=self._buffer_dtype)
                     else:
                         # Max buffers reached - drop frame to prevent memory leak
-                        print(
-                            f"[{self._name}] Max buffer limit ({self._max_buffers}) reached. Dropping frame."
-                        )
+                        self._record_exhausted("buffer")
                         return (None, None) if self._enable_depth else None
             else:
                 return (None, None) if self._enable_depth else None
@@ -245,8 +447,8 @@ class FrameBufferPool:
         # Get depth buffer if enabled
         if self._enable_depth:
             try:
-                depth_buffer = self._depth_pool.get_nowait()
-            except queue.Empty:
+                depth_buffer = self._depth_pool.pop()
+            except IndexError:
                 if self._depth_buffer_shape is not None:
                     with self._lock:
                         if self._depth_allocated < self._max_buffers:
@@ -257,11 +459,9 @@ class FrameBufferPool:
                             depth_buffer = np.empty(self._depth_buffer_shape, dtype=self._depth_buffer_dtype)
                         else:
                             # Max depth buffers reached
-                            print(
-                                f"[{self._name}] Max depth buffer limit ({self._max_buffers}) reached. Dropping frame."
-                            )
+                            self._record_exhausted("depth buffer")
                             # Return color buffer to pool and fail
-                            self._pool.put(color_buffer)
+                            self._pool.append(color_buffer)
                             return (None, None)
                 else:
                     # Depth pool not initialized yet
@@ -270,6 +470,20 @@ class FrameBufferPool:
         else:
             return color_buffer
 
+    def _record_exhausted(self, kind):
+        """Counts a frame dropped at the buffer limit, logging at most once a second.
+
+        Must be called with ``self._lock`` held.
+        """
+        self.exhausted_count += 1
+        now = time.monotonic()
+        if self._last_exhausted_log is None or now - self._last_exhausted_log >= 1.0:
+            self._last_exhausted_log = now
+            print(
+                f"[{self._name}] Max {kind} limit ({self._max_buffers}) reached. "
+                f"Dropping frame ({self.exhausted_count} dropped in total)."
+            )
+
     def release_buffer(self, buffer, depth_buffer=None):
         """Returns buffer(s) to the pool for reuse.
 
@@ -280,9 +494,9 @@ class FrameBufferPool:
             buffer: Color buffer to return to pool
             depth_buffer: Optional depth buffer to return to depth pool
         """
-        self._pool.put(buffer)
-        if depth_buffer is not None and self._depth_pool is not None:
-            self._depth_pool.put(depth_buffer)
+        self._pool.append(buffer)
+        if depth_buffer is not None:
+            self.release_depth_buffer(depth_buffer)
 
         # Check for shrinking periodically (every N releases) to avoid overhead
         self._shrink_check_counter += 1
@@ -290,6 +504,11 @@ class FrameBufferPool:
             self._shrink_check_counter = 0
             self._try_shrink_pool()
 
+    def release_depth_buffer(self, depth_buffer):
+        """Returns a depth buffer to the depth pool for reuse."""
+        if self._depth_pool is not None:
+            self._depth_pool.append(depth_buffer)
+
     def _try_shrink_pool(self):
         """Attempts to shrink the pool if conditions are met.
 
@@ -309,12 +528,12 @@ class FrameBufferPool:
 
             # Check if pool has been idle (no new allocations recently)
             if self._last_allocation_time is not None:
-                idle_time = time.time() - self._last_allocation_time
+                idle_time = time.monotonic() - self._last_allocation_time
                 if idle_time < self._shrink_idle_seconds:
                     return
 
             # Check if pool is currently full (indicates low demand)
-            current_pool_size = self._pool.qsize()
+            current_pool_size = len(self._pool)
             if current_pool_size < self._allocated:
                 # Buffers are still in use, don't shrink
                 return
@@ -324,9 +543,9 @@ class FrameBufferPool:
             removed = 0
             for _ in range(buffers_to_remove):
                 try:
-                    self._pool.get_nowait()
+                    self._pool.popleft()
                     removed += 1
-                except queue.Empty:
+                except IndexError:
                     break
 
             if removed > 0:
@@ -342,9 +561,9 @@ class FrameBufferPool:
                 depth_removed = 0
                 for _ in range(depth_buffers_to_remove):
                     try:
-                        self._depth_pool.get_nowait()
+                        self._depth_pool.popleft()
                         depth_removed += 1
-                    except queue.Empty:
+                    except IndexError:
                         break
 
                 if depth_removed > 0:
@@ -368,6 +587,7 @@ class VisionProcessingThread(threading.Thread):
         dist_coeffs_json,
         frame_queue,
         jpeg_quality=75,
+        display_width=None,
     ):
         super().__init__()
         self.daemon = True
@@ -375,14 +595,36 @@ class VisionProcessingThread(threading.Thread):
         self.pipeline_id = pipeline_id
         self.pipeline_type = pipeline_type
         self.frame_queue = frame_queue
+        # maxsize is fixed once a queue is created, so resolve it once here
+        self._queue_max_size = _coerce_int(getattr(frame_queue, "maxsize", 0)) or 0
         self.stop_event = threading.Event()
         self.results_lock = threading.Lock()
         self.latest_results = {"status": "Starting..."}
         self.latest_processed_frame_raw = None  # Raw annotated frame for lazy encoding
         self.processed_frame_lock = threading.Lock()
+        # Notified on every processed frame so feed clients can block instead of polling
+        self._processed_cond = threading.Condition(self.processed_frame_lock)
         self.jpeg_quality = jpeg_quality
         self.processed_frame_seq = 0
         self.latest_processed_frame_timestamp = 0.0
+        # (processed_frame_seq, source frame, jpeg_bytes) so concurrent clients
+        # of the processed feed share one encode and one bytes object per frame
+        self._cached_jpeg = (-1, None, None)
+        # Only used under processed_frame_lock, which serializes encodes
+        self._jpeg_encoder = JpegEncoder()
+
+        # Two reusable annotation buffers: one is published as the processed
+        # frame while the next frame is drawn into the other
+        self._annotated_bufs = [None, None]
+        self._annotated_idx = 0
+        # Processed feed clients; frames are only annotated while any are connected
+        self._viewer_count = 0
+        self._viewer_lock = threading.Lock()
+
+        # Optional downscale applied before encoding the processed stream
+        self.display_width = display_width
+        self._resize_buf = None
+        self._resize_src_shape = None
 
         # Initialize the pipeline object
         self.pipeline_instance = None
@@ -504,9 +746,9 @@ class VisionProcessingThread(threading.Thread):
             camera_identifier=self.identifier,
             pipeline_id=self.pipeline_id,
             pipeline_type=self.pipeline_type,
-            queue_max_size=getattr(frame_queue, "maxsize", 0),
+            queue_max_size=self._queue_max_size,
         )
-        self._latency_log_state = {"last_warn": 0.0, "last_latency_ms": 0.0}
+        self._latency_log_state = {"last_warn": float("-inf"), "last_latency_ms": 0.0}
 
     def run(self):
         """The main loop for the vision processing thread."""
@@ -529,22 +771,30 @@ class VisionProcessingThread(threading.Thread):
         while not self.stop_event.is_set():
             ref_counted_frame = None
             try:
-                ref_counted_frame = self.frame_queue.get(timeout=1)
+                if isinstance(self.frame_queue, FrameQueue):
+                    # Pop and read the remaining depth under one lock acquisition
+                    ref_counted_frame, queue_depth_after_pop = (
+                        self.frame_queue.get_with_depth(timeout=1)
+                    )
+                else:
+                    ref_counted_frame = self.frame_queue.get(timeout=1)
+                    queue_depth_after_pop = _coerce_int(self.frame_queue.qsize())
                 dequeue_timestamp = time.perf_counter()
                 raw_frame = ref_counted_frame.data
-                queue_depth_after_pop = _coerce_int(self.frame_queue.qsize())
-                queue_max_size = _coerce_int(getattr(self.frame_queue, "maxsize", 0))
+                queue_max_size = self._queue_max_size
                 if queue_depth_after_pop is not None:
                     metrics_registry.record_queue_depth(
                         camera_identifier=self.identifier,
                         pipeline_id=self.pipeline_id,
                         queue_size=queue_depth_after_pop,
-                        queue_max_size=queue_max_size or 0,
+                        queue_max_size=queue_max_size,
                     )
+                # Utilization is the backlog left behind: with one-slot queues a
+                # pipeline that keeps up always finds the slot empty after a pop
                 queue_util_pct = 0.0
                 if queue_depth_after_pop is not None and queue_max_size:
                     queue_util_pct = min(
-                        ((queue_depth_after_pop + 1) / queue_max_size) * 100.0, 100.0
+                        (queue_depth_after_pop / queue_max_size) * 100.0, 100.0
                     )
 
                 enqueue_timestamp = ref_counted_frame.pop_enqueue_timestamp(
@@ -560,8 +810,14 @@ class VisionProcessingThread(threading.Thread):
 
                 processing_start = time.perf_counter()
 
-                # Delegate processing to the pipeline object
-                annotated_frame = raw_frame.copy()  # Always make a copy to draw on
+                # Delegate processing to the pipeline object. Overlays are drawn
+                # on a copy, since the pooled frame goes back to the camera, and
+                # only while a client watches the processed feed.
+                annotated_frame = (
+                    self._next_annotation_buffer(raw_frame)
+                    if self._viewer_count
+                    else None
+                )
                 detections = []
                 current_results = {}
 
@@ -600,7 +856,7 @@ class VisionProcessingThread(threading.Thread):
                     }
                     if "multi_tag" in result:
                         current_results["multi_tag"] = result.get("multi_tag")
-                    if overlays:
+                    if overlays and annotated_frame is not None:
                         self._draw_3d_box_on_frame(annotated_frame, overlays)
 
                 elif self.pipeline_type == "Object Detection (ML)":
@@ -608,7 +864,7 @@ class VisionProcessingThread(threading.Thread):
                     detections = self._call_pipeline_process_frame(
                         raw_frame, ref_counted_frame, self.cam_matrix
                     )
-                    for det in detections:
+                    for det in detections if annotated_frame is not None else ():
                         box = det["box"]
                         label = f"{det['label']}: {det['confidence']:.2f}"
                         cv2.rectangle(
@@ -659,10 +915,20 @@ class VisionProcessingThread(threading.Thread):
                     self.latest_results = current_results
 
                 # --- Store Processed Frame (raw, for lazy encoding) ---
-                with self.processed_frame_lock:
-                    self.latest_processed_frame_raw = annotated_frame
-                    self.processed_frame_seq += 1
-                    self.latest_processed_frame_timestamp = time.perf_counter()
+                if annotated_frame is not None:
+                    with self.processed_frame_lock:
+                        self.latest_processed_frame_raw = annotated_frame
+                        self.processed_frame_seq += 1
+                        self.latest_processed_frame_timestamp = time.perf_counter()
+                        self._processed_cond.notify_all()
+                    # Readers only touch the published buffer under the lock, so
+                    # the other one is free for the next frame
+                    self._annotated_idx ^= 1
+                elif self.latest_processed_frame_raw is not None:
+                    # Last viewer left: drop the stale frame so a new client
+                    # waits for a fresh one
+                    with self.processed_frame_lock:
+                        self.latest_processed_frame_raw = None
 
                 metrics_registry.record_latencies(
                     camera_identifier=self.identifier,
@@ -755,22 +1021,97 @@ class VisionProcessingThread(threading.Thread):
 
         This performs lazy encoding - JPEG compression only happens when a client
         requests the frame, avoiding wasteful encoding when no clients are connected.
+        Frames wider than ``display_width`` are downscaled before encoding. The
+        result is cached until a new frame is published.
 
         Returns:
             bytes: JPEG-encoded frame, or None if no frame is available
         """
         with self.processed_frame_lock:
-            if self.latest_processed_frame_raw is None:
+            raw = self.latest_processed_frame_raw
+            if raw is None:
                 return None
+            seq = self.processed_frame_seq
+            cached_seq, cached_raw, cached_jpeg = self._cached_jpeg
+            if cached_seq == seq and cached_raw is raw:
+                return cached_jpeg
+
+            frame = self._downscale_for_display(raw)
+            jpeg = self._jpeg_encoder.encode(frame, self.jpeg_quality)
+            if jpeg is not None:
+                self._cached_jpeg = (seq, raw, jpeg)
+            return jpeg
+
+    def wait_for_processed_frame(self, last_seq, timeout=None):
+        """Blocks until a processed frame newer than ``last_seq`` is published.
+
+        Args:
+            last_seq (int): The processed_frame_seq the caller last handled.
+            timeout (float): Maximum time to wait in seconds.
 
-            ret, buffer = cv2.imencode(
-                ".jpg",
-                self.latest_processed_frame_raw,
-                [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality],
+        Returns:
+            int: The current processed_frame_seq, equal to ``last_seq`` on timeout.
+        """
+        with self._processed_cond:
+            self._processed_cond.wait_for(
+                lambda: self.processed_frame_seq != last_seq, timeout
             )
-            if ret:
-                return buffer.tobytes()
-            return None
+            return self.processed_frame_seq
+
+    def add_viewer(self):
+        """Registers a processed feed client; frames are annotated while any are connected."""
+        with self._viewer_lock:
+            self._viewer_count += 1
+
+    def remove_viewer(self):
+        """Unregisters a processed feed client added with add_viewer()."""
+        with self._viewer_lock:
+            self._viewer_count = max(0, self._viewer_count - 1)
+
+    def _next_annotation_buffer(self, raw_frame):
+        """Copies the frame into the unpublished annotation buffer and returns it.
+
+        Buffers are allocated on first use and re-allocated only when the frame
+        shape or dtype changes. Single-channel frames from mono cameras are
+        expanded to BGR here, in place of the copy, so overlays keep their colour.
+        """
+        shape = raw_frame.shape + (3,) if raw_frame.ndim == 2 else raw_frame.shape
+        buf = self._annotated_bufs[self._annotated_idx]
+        if buf is None or buf.shape != shape or buf.dtype != raw_frame.dtype:
+            buf = np.empty(shape, dtype=raw_frame.dtype)
+            self._annotated_bufs[self._annotated_idx] = buf
+        if raw_frame.ndim == 2:
+            cv2.cvtColor(raw_frame, cv2.COLOR_GRAY2BGR, dst=buf)
+        else:
+            np.copyto(buf, raw_frame)
+        return buf
+
+    def _downscale_for_display(self, frame):
+        """Resizes the frame into a reusable buffer when it exceeds display_width.
+
+        Frames already at or below the target width are returned unchanged. The
+        output size is only recomputed when the source shape changes.
+        """
+        if not self.display_width:
+            return frame
+
+        h, w = frame.shape[:2]
+        if w <= self.display_width:
+            return frame
+
+        if self._resize_src_shape != frame.shape:
+            w_out = int(self.display_width)
+            h_out = max(1, int(round(h * w_out / w)))
+            self._resize_buf = np.empty(
+                (h_out, w_out) + frame.shape[2:], dtype=frame.dtype
+            )
+            self._resize_src_shape = frame.shape
+
+        h_out, w_out = self._resize_buf.shape[:2]
+        cv2.resize(
+            frame, (w_out, h_out), dst=self._resize_buf, interpolation=cv2.INTER_AREA
+        )
+        return self._resize_buf
 
     def _draw_3d_box_on_frame(self, frame, detections):
         """Draws a 3D bounding box around each detected AprilTag."""
@@ -816,8 +1157,8 @@ class VisionProcessingThread(threading.Thread):
         queue_util_pct: float,
     ) -> None:
         """Emit throttled warnings when pipelines fall behind."""
-        now = time.time()
-        last_warn = self._latency_log_state.get("last_warn", 0.0)
+        now = time.monotonic()
+        last_warn = self._latency_log_state.get("last_warn", float("-inf"))
         if now - last_warn < 5.0:
             return
 
@@ -871,7 +1212,8 @@ class CameraAcquisitionThread(threading.Thread):
     def __init__(
         self, identifier, camera_type, orientation, app, jpeg_quality=85, camera_id=None,
         depth_enabled=False, resolution_json=None, framerate=None,
-        exposure_mode="auto", exposure_value=500, gain_mode="auto", gain_value=50
+        exposure_mode="auto", exposure_value=500, gain_mode="auto", gain_value=50,
+        display_max_dim=None, display_max_fps=None
     ):
         super().__init__()
         self.daemon = True
@@ -882,15 +1224,47 @@ class CameraAcquisitionThread(threading.Thread):
         self.driver = None
         self.frame_lock = threading.Lock()
         self.latest_display_frame_raw = None  # Raw frame for lazy encoding
-        self.raw_frame_lock = threading.Lock()
+        # Reference held on the pooled buffer backing the display frame, so it
+        # can be encoded outside frame_lock without being recycled underneath us
+        self._display_ref = None
+        self._encode_lock = threading.Lock()
+        # Notified whenever a new display frame is published, so stream clients
+        # wake once per frame instead of polling
+        self._display_cond = threading.Condition(self.frame_lock)
+        self._jpeg_encoder = JpegEncoder()
+        # Number of connected display stream clients; display frames are only
+        # prepared while at least one is watching
+        self._viewer_count = 0
+        self._viewer_lock = threading.Lock()
+        # (display_frame_seq, jpeg_bytes) so concurrent clients share one encode
+        self._cached_jpeg = (-1, None)
+        # Display frames whose longer side exceeds this are downscaled before the
+        # overlay is drawn, which also shrinks the JPEG encode
+        self.display_max_dim = display_max_dim
+        self._display_size = (None, None)  # (source shape, output (w, h) or None)
+        # Downscaled display buffers not currently published or being encoded
+        self._display_buffers = []
+        # Display frames are published at most this often; faster cameras skip
+        # the overlay (and any copy or resize) on frames no client would see
+        self._display_interval_ns = (
+            int(1_000_000_000 / display_max_fps) if display_max_fps else 0
+        )
+        # Only written by the acquisition thread; readers use try_acquire()
         self.latest_raw_frame = None
         self.processing_queues = {}
+        # Immutable snapshot of processing_queues for the acquisition loop,
+        # republished under queues_lock whenever a queue is added or removed
+        self._queue_targets = ()
         self.queues_lock = threading.Lock()
         self.stop_event = threading.Event()
+        # (fps text, inverse alpha, colour term, top_left, scratch) for the FPS
+        # overlay, rebuilt by the fps setter so the display path only reads it
+        self._fps_overlay_cache = None
         self.fps = 0.0
         # Initialize buffer pool with depth support if needed
         self.depth_enabled = depth_enabled
         self.buffer_pool = FrameBufferPool(name=self.identifier, enable_depth=depth_enabled)
+        self._frame_wrappers = RefCountedFramePool()
         self.jpeg_quality = jpeg_quality
         self._drop_states: Dict[int, Dict[str, float]] = {}
         self.display_frame_seq = 0
@@ -908,33 +1282,64 @@ class CameraAcquisitionThread(threading.Thread):
         self.config_update_event = threading.Event()
         self._orientation = orientation
         self._orientation_lock = threading.Lock()
+        # OpenCV's T-API is opt-in: it has to download into a fresh array and
+        # copy that into the pooled buffer, so it only pays off on some GPUs
+        self._use_ocl = (
+            app.config.get("OPENCV_USE_OPENCL", False) is True and _has_opencl()
+        )
+
+        # Raw frames are only cached while a calibration session is active; the
+        # calibration manager flips this flag when a session starts or ends
+        self._cache_raw_flag = False
+        self._calibration_manager = None
+        manager = getattr(app, "calibration_manager", None)
+        if manager is not None and camera_id is not None:
+            manager.register_listener(camera_id, self._on_calibration_session_change)
+            self._calibration_manager = manager
 
     def add_pipeline_queue(self, pipeline_id, frame_queue):
         """Adds a pipeline's frame queue to the list of queues to receive frames."""
         with self.queues_lock:
             self.processing_queues[pipeline_id] = frame_queue
+            self._drop_states.setdefault(
+                pipeline_id, {"last_log": 0.0, "consecutive": 0}
+            )
+            self._publish_queue_targets()
 
     def remove_pipeline_queue(self, pipeline_id):
         """Removes a pipeline's frame queue from the list of queues."""
         with self.queues_lock:
             self.processing_queues.pop(pipeline_id, None)
+            self._drop_states.pop(pipeline_id, None)
+            self._publish_queue_targets()
+
+    def _publish_queue_targets(self) -> None:
+        """Rebuilds the (pipeline_id, queue, max_size, drop_state, int_qsize) snapshot.
 
-    def _reset_drop_state(self, pipeline_id: int) -> None:
-        state = self._drop_states.get(pipeline_id)
-        if state:
-            state["consecutive"] = 0
+        maxsize is fixed once a queue is created, so it is resolved here rather
+        than per frame, along with whether qsize() is known to return an int and
+        can skip _coerce_int. Caller holds queues_lock.
+        """
+        self._queue_targets = tuple(
+            (
+                pipeline_id,
+                frame_queue,
+                _coerce_int(getattr(frame_queue, "maxsize", 0)) or 0,
+                self._drop_states[pipeline_id],
+                type(frame_queue) in (queue.Queue, FrameQueue),
+            )
+            for pipeline_id, frame_queue in self.processing_queues.items()
+        )
 
     def _handle_pipeline_drop(
-        self, pipeline_id: int, frame_queue, queue_size: int, queue_max_size: int
+        self,
+        pipeline_id: int,
+        state: Dict[str, float],
+        queue_size: int,
+        max_size: int,
     ) -> None:
-        state = self._drop_states.setdefault(
-            pipeline_id, {"last_log": 0.0, "consecutive": 0}
-        )
         state["consecutive"] += 1
-        now = time.time()
-        max_size = (
-            queue_max_size or _coerce_int(getattr(frame_queue, "maxsize", 0)) or 0
-        )
+        now = time.monotonic()
         utilization_pct = 0.0
         if max_size:
             utilization_pct = min(float(queue_size) / max_size, 1.0) * 100.0
@@ -965,34 +1370,47 @@ class CameraAcquisitionThread(threading.Thread):
                     f"[{self.identifier}] Orientation update signaled: {new_orientation}"
                 )
 
-    def _should_cache_raw_frame(self):
-        """Returns True when raw frames should be cached for calibration workflows."""
-        manager = getattr(self.app, "calibration_manager", None)
-        if manager is None or self.camera_db_id is None:
-            return False
-        return manager.get_session(self.camera_db_id) is not None
+    def _on_calibration_session_change(self, active):
+        """Calibration listener: caches raw frames only while a session is active."""
+        self._cache_raw_flag = bool(active)
 
     def get_display_frame(self):
         """Encodes and returns the latest display frame as JPEG bytes.
 
         This performs lazy encoding - JPEG compression only happens when a client
         requests the frame, avoiding wasteful encoding when no clients are connected.
+        The result is cached per display_frame_seq, so every connected client
+        shares a single encode of each frame. The frame is pinned with a reference
+        while it is compressed so frame_lock is only held to read the latest frame.
 
         Returns:
             bytes: JPEG-encoded frame, or None if no frame is available
         """
         with self.frame_lock:
-            if self.latest_display_frame_raw is None:
+            frame = self.latest_display_frame_raw
+            if frame is None:
                 return None
+            seq = self.display_frame_seq
+            cached_seq, cached_jpeg = self._cached_jpeg
+            if cached_seq == seq:
+                return cached_jpeg
+            display_ref = self._display_ref
+            if display_ref is not None:
+                display_ref.acquire()
 
-            ret, buffer = cv2.imencode(
-                ".jpg",
-                self.latest_display_frame_raw,
-                [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality],
-            )
-            if ret:
-                return buffer.tobytes()
-            return None
+        try:
+            with self._encode_lock:
+                # Another client may have encoded this frame while we waited
+                cached_seq, cached_jpeg = self._cached_jpeg
+                if cached_seq == seq:
+                    return cached_jpeg
+                jpeg = self._jpeg_encoder.encode(frame, self.jpeg_quality)
+                if jpeg is not None:
+                    self._cached_jpeg = (seq, jpeg)
+                return jpeg
+        finally:
+            if display_ref is not None:
+                display_ref.release()
 
     def run(self):
         """The main loop for the camera acquisition thread."""
@@ -1031,11 +1449,17 @@ class CameraAcquisitionThread(threading.Thread):
                 if not self.stop_event.is_set():
                     self.stop_event.wait(5.0)
 
-        # Clean up the ref-counted frame
-        with self.raw_frame_lock:
-            if self.latest_raw_frame is not None:
-                self.latest_raw_frame.release()
-                self.latest_raw_frame = None
+        if self._calibration_manager is not None:
+            self._calibration_manager.unregister_listener(
+                self.camera_db_id, self._on_calibration_session_change
+            )
+
+        # Clean up the ref-counted frames
+        raw_frame = self.latest_raw_frame
+        self.latest_raw_frame = None
+        if raw_frame is not None:
+            raw_frame.release()
+        self._clear_display_frame()
 
         print(f"Acquisition thread for {self.identifier} has stopped.")
 
@@ -1070,15 +1494,42 @@ class CameraAcquisitionThread(threading.Thread):
             first_color_frame = first_frame_data
             first_depth_frame = None
 
-        oriented_first_frame = self._apply_orientation(first_color_frame, orientation)
-        oriented_first_depth = self._apply_orientation(first_depth_frame, orientation) if first_depth_frame is not None else None
-        self.buffer_pool.initialize(oriented_first_frame, depth_frame=oriented_first_depth)
-
-        start_time, frame_count = time.time(), 0
-
-        while not self.stop_event.is_set():
+        # Borrowed driver frames bypass the pool, so it is only sized when needed
+        borrow_frames = self._can_borrow_frames(orientation, depth_is_enabled)
+        if not borrow_frames:
+            oriented_first_frame = self._apply_orientation(first_color_frame, orientation)
+            oriented_first_depth = self._apply_orientation(first_depth_frame, orientation) if first_depth_frame is not None else None
+            self.buffer_pool.initialize(
+                oriented_first_frame,
+                num_buffers=self._working_set_size(),
+                depth_frame=oriented_first_depth,
+            )
+        # Bound once so each frame hands the pool methods straight to RefCountedFrame
+        release_color_buffer = self.buffer_pool.release_buffer
+        release_depth_buffer = self.buffer_pool.release_depth_buffer
+
+        # Per-frame callables resolved once; the loop body runs at camera rate, so
+        # repeated attribute and global lookups are a measurable share of it
+        stop_requested = self.stop_event.is_set
+        config_updated = self.config_update_event.is_set
+        get_frame = self.driver.get_frame
+        get_frame_borrowed = self.driver.get_frame_borrowed
+        skip_frame = self.driver.skip_frame
+        perf_counter = time.perf_counter
+        monotonic_ns = time.monotonic_ns
+        record_drop = metrics_registry.record_drop
+        record_queue_depths = metrics_registry.record_queue_depths
+        identifier = self.identifier
+        wrap_frame = self._frame_wrappers.wrap
+
+        # FPS window bookkeeping in integer nanoseconds on the monotonic clock
+        start_ns, frame_count = monotonic_ns(), 0
+        display_interval_ns = self._display_interval_ns
+        next_display_ns = 0
+
+        while not stop_requested():
             # Check for configuration updates via event (non-blocking)
-            if self.config_update_event.is_set():
+            if config_updated():
                 self.config_update_event.clear()
                 with self._orientation_lock:
                     new_orientation = self._orientation
@@ -1087,14 +1538,45 @@ class CameraAcquisitionThread(threading.Thread):
                         f"[{self.identifier}] Orientation changed to {new_orientation}. Re-initializing resources."
                     )
                     orientation = new_orientation
+                    borrow_frames = self._can_borrow_frames(
+                        orientation, depth_is_enabled
+                    )
                     # Re-initialize buffer pool if orientation changes frame size
                     test_frame = self._apply_orientation(
                         first_color_frame.copy(), orientation
                     )
                     test_depth = self._apply_orientation(first_depth_frame.copy(), orientation) if first_depth_frame is not None else None
-                    self.buffer_pool.initialize(test_frame, depth_frame=test_depth)
+                    self.buffer_pool.initialize(
+                        test_frame,
+                        num_buffers=self._working_set_size(),
+                        depth_frame=test_depth,
+                    )
+
+            if (
+                not self._queue_targets
+                and not self._viewer_count
+                and not self._cache_raw_flag
+                and self.latest_raw_frame is None
+                and self.latest_display_frame_raw is None
+            ):
+                # Nothing consumes frames: keep the camera drained and the FPS
+                # current, but let the driver drop each frame undecoded
+                if not skip_frame():
+                    print(f"Lost frame from {self.identifier}, attempting to reconnect.")
+                    break
+                frame_count += 1
+                now_ns = monotonic_ns()
+                elapsed_ns = now_ns - start_ns
+                if elapsed_ns >= 1_000_000_000:
+                    self.fps = frame_count * 1e9 / elapsed_ns
+                    frame_count = 0
+                    start_ns = now_ns
+                continue
 
-            frame_data = self.driver.get_frame()
+            if borrow_frames:
+                frame_data, release_borrowed = get_frame_borrowed()
+            else:
+                frame_data = get_frame()
 
             # Handle both single frame and tuple (color, depth) returns
             if depth_is_enabled:
@@ -1109,184 +1591,455 @@ class CameraAcquisitionThread(threading.Thread):
                 raw_color_frame = frame_data
                 raw_depth_frame = None
 
-            # Apply orientation to the frames right after capture
-            oriented_frame = self._apply_orientation(raw_color_frame, orientation)
-            oriented_depth = self._apply_orientation(raw_depth_frame, orientation) if raw_depth_frame is not None else None
-
-            # Get buffer(s) from pool
-            buffer_data = self.buffer_pool.get_buffer()
-            if depth_is_enabled:
-                if buffer_data == (None, None):
-                    # Buffer pool exhausted - drain queues to prevent buildup and memory leaks
-                    print(
-                        f"[{self.identifier}] Buffer pool exhausted, draining queues to prevent memory buildup"
-                    )
-                    self._drain_processing_queues()
-                    continue
-                pooled_buffer, pooled_depth_buffer = buffer_data
+            if borrow_frames:
+                # The driver handed over memory we may keep: wrap it directly and
+                # skip the pool buffer and copy entirely. A 180 degree rotation
+                # keeps the shape, so it is applied in place.
+                if orientation == 180:
+                    cv2.flip(raw_color_frame, -1, dst=raw_color_frame)
+                ref_counted_frame = wrap_frame(raw_color_frame, release_borrowed)
             else:
-                if buffer_data is None:
-                    # Buffer pool exhausted - drain queues to prevent buildup and memory leaks
-                    print(
-                        f"[{self.identifier}] Buffer pool exhausted, draining queues to prevent memory buildup"
+                # Get buffer(s) from pool
+                buffer_data = self.buffer_pool.get_buffer()
+                if depth_is_enabled:
+                    if buffer_data == (None, None):
+                        # Buffer pool exhausted - drain queues to prevent buildup and memory leaks
+                        print(
+                            f"[{self.identifier}] Buffer pool exhausted, draining queues to prevent memory buildup"
+                        )
+                        self._drain_processing_queues()
+                        continue
+                    pooled_buffer, pooled_depth_buffer = buffer_data
+                else:
+                    if buffer_data is None:
+                        # Buffer pool exhausted - drain queues to prevent buildup and memory leaks
+                        print(
+                            f"[{self.identifier}] Buffer pool exhausted, draining queues to prevent memory buildup"
+                        )
+                        self._drain_processing_queues()
+                        continue
+                    pooled_buffer = buffer_data
+                    pooled_depth_buffer = None
+
+                # Apply orientation right after capture, writing straight into the
+                # pooled buffer(s) for pipelines so no intermediate frame is allocated
+                self._apply_orientation(raw_color_frame, orientation, dst=pooled_buffer)
+                if pooled_depth_buffer is not None and raw_depth_frame is not None:
+                    self._apply_orientation(
+                        raw_depth_frame, orientation, dst=pooled_depth_buffer
                     )
-                    self._drain_processing_queues()
-                    continue
-                pooled_buffer = buffer_data
-                pooled_depth_buffer = None
-
-            # Copy the oriented frame(s) into the buffer(s) for pipelines
-            np.copyto(pooled_buffer, oriented_frame)
-            if pooled_depth_buffer is not None and oriented_depth is not None:
-                np.copyto(pooled_depth_buffer, oriented_depth)
-
-            # Create release callback that handles both buffers
-            def release_callback(color_buf):
-                self.buffer_pool.release_buffer(color_buf, pooled_depth_buffer)
-
-            ref_counted_frame = RefCountedFrame(
-                pooled_buffer,
-                release_callback=release_callback,
-                depth_buffer=pooled_depth_buffer,
-                depth_release_callback=None  # Handled by main release_callback
-            )
+
+                ref_counted_frame = wrap_frame(
+                    pooled_buffer,
+                    release_color_buffer,
+                    depth_buffer=pooled_depth_buffer,
+                    depth_release_callback=release_depth_buffer,
+                )
 
             # Acquire initial reference for the acquisition thread to ensure buffer is released
             # even if all queues are full or display frame encoding fails
             ref_counted_frame.acquire()
 
             try:
-                # Store ref-counted frame for raw frame access (eliminates copy #1)
-                should_cache_raw = self._should_cache_raw_frame()
-                with self.raw_frame_lock:
-                    # Release previous frame if it exists
-                    if self.latest_raw_frame is not None:
-                        self.latest_raw_frame.release()
-                        self.latest_raw_frame = None
-                    # Store new frame with reference only when calibration requires it
-                    if should_cache_raw:
-                        ref_counted_frame.acquire()
-                        self.latest_raw_frame = ref_counted_frame
-
-                # Distribute frame to pipeline queues
-                with self.queues_lock:
-                    queue_targets = list(self.processing_queues.items())
-
-                for pipeline_id, frame_queue in queue_targets:
+                # Publish the ref-counted frame for calibration capture. This is a
+                # plain reference swap; nothing is touched unless calibration is
+                # active or a previously cached frame still needs releasing.
+                if self._cache_raw_flag:
                     ref_counted_frame.acquire()
-                    queue_max_size = (
-                        _coerce_int(getattr(frame_queue, "maxsize", 0)) or 0
-                    )
-                    queue_size_before = _coerce_int(frame_queue.qsize())
-                    if queue_size_before is not None:
-                        metrics_registry.record_queue_depth(
-                            camera_identifier=self.identifier,
-                            pipeline_id=pipeline_id,
-                            queue_size=queue_size_before,
-                            queue_max_size=queue_max_size,
+                    prev_raw_frame = self.latest_raw_frame
+                    self.latest_raw_frame = ref_counted_frame
+                    if prev_raw_frame is not None:
+                        prev_raw_frame.release()
+                elif self.latest_raw_frame is not None:
+                    prev_raw_frame = self.latest_raw_frame
+                    self.latest_raw_frame = None
+                    prev_raw_frame.release()
+
+                # Distribute frame to pipeline queues. The snapshot is replaced
+                # wholesale on add/remove, so a plain attribute read is enough.
+                queue_targets = self._queue_targets
+
+                # Reserve one reference per queue up front; the rare failed put
+                # gives its reference back individually
+                if queue_targets:
+                    ref_counted_frame.acquire_n(len(queue_targets))
+
+                queue_depths = {}
+                for (
+                    pipeline_id,
+                    frame_queue,
+                    queue_max_size,
+                    drop_state,
+                    int_qsize,
+                ) in queue_targets:
+                    if isinstance(frame_queue, FrameQueue):
+                        # Evict-and-insert under the queue's single lock
+                        old_frame = frame_queue.put_latest(ref_counted_frame)
+                        ref_counted_frame.mark_enqueued(pipeline_id, perf_counter())
+                        if old_frame is None:
+                            drop_state["consecutive"] = 0
+                        else:
+                            old_frame.release()
+                            record_drop(
+                                camera_identifier=identifier,
+                                pipeline_id=pipeline_id,
+                                queue_size=queue_max_size,
+                                queue_max_size=queue_max_size,
+                            )
+                            self._handle_pipeline_drop(
+                                pipeline_id, drop_state, queue_max_size, queue_max_size
+                            )
+                        # Monitoring-only read: len() of the underlying deque is
+                        # atomic, so this skips a second trip through the mutex
+                        queue_depths[pipeline_id] = (
+                            len(frame_queue.queue),
+                            queue_max_size,
                         )
+                        continue
+
                     try:
                         frame_queue.put_nowait(ref_counted_frame)
-                        enqueue_timestamp = time.perf_counter()
+                        enqueue_timestamp = perf_counter()
                         ref_counted_frame.mark_enqueued(pipeline_id, enqueue_timestamp)
-                        queue_size_after = _coerce_int(frame_queue.qsize())
-                        if queue_size_after is not None:
-                            metrics_registry.record_queue_depth(
-                                camera_identifier=self.identifier,
-                                pipeline_id=pipeline_id,
-                                queue_size=queue_size_after,
-                                queue_max_size=queue_max_size,
-                            )
-                        self._reset_drop_state(pipeline_id)
+                        drop_state["consecutive"] = 0
                     except queue.Full:
+                        queue_size_at_drop = (
+                            frame_queue.qsize()
+                            if int_qsize
+                            else _coerce_int(frame_queue.qsize())
+                        )
                         # Queue is full - drop the oldest frame and add the new one
                         # This ensures consumers always have the most recent frames
                         try:
                             old_frame = frame_queue.get_nowait()
-                            old_frame.release()  # Release the old frame
                         except queue.Empty:
-                            pass  # Queue was drained by another thread
+                            old_frame = None  # Queue was drained by another thread
 
                         # Now try to add the new frame again
                         try:
                             frame_queue.put_nowait(ref_counted_frame)
-                            enqueue_timestamp = time.perf_counter()
+                            enqueue_timestamp = perf_counter()
                             ref_counted_frame.mark_enqueued(pipeline_id, enqueue_timestamp)
                         except queue.Full:
                             # Still full (shouldn't happen), release the new frame
                             ref_counted_frame.release()
 
-                        metrics_registry.record_drop(
-                            camera_identifier=self.identifier,
+                        # Release the old frame only once the slot is refilled, so
+                        # the buffer pool lock is not taken between get and put
+                        if old_frame is not None:
+                            old_frame.release()
+
+                        record_drop(
+                            camera_identifier=identifier,
                             pipeline_id=pipeline_id,
-                            queue_size=queue_size_before,
+                            queue_size=queue_size_at_drop,
                             queue_max_size=queue_max_size,
                         )
                         self._handle_pipeline_drop(
                             pipeline_id,
-                            frame_queue,
-                            queue_size_before if queue_size_before is not None else 0,
+                            drop_state,
+                            queue_size_at_drop if queue_size_at_drop is not None else 0,
                             queue_max_size,
                         )
 
-                # Prepare display frame (store raw frame for lazy encoding)
-                # Use get_modifiable_view to avoid unnecessary copy when possible
-                display_frame, is_direct = ref_counted_frame.get_modifiable_view()
-                display_frame_with_overlay = self._prepare_display_frame(display_frame)
-
-                # Store the raw frame instead of encoding immediately (lazy encoding)
-                with self.frame_lock:
-                    self.latest_display_frame_raw = display_frame_with_overlay
-                    self.display_frame_seq += 1
-                    self.latest_display_frame_timestamp = time.perf_counter()
+                    # Only the post-enqueue depth matters for monitoring
+                    queue_size_after = (
+                        frame_queue.qsize()
+                        if int_qsize
+                        else _coerce_int(frame_queue.qsize())
+                    )
+                    if queue_size_after is not None:
+                        queue_depths[pipeline_id] = (queue_size_after, queue_max_size)
+
+                # One metrics call per frame rather than two per pipeline
+                record_queue_depths(identifier, queue_depths)
+
+                # The overlay, any copy and the display pin are only needed while
+                # a stream client is watching
+                if self._viewer_count:
+                    if display_interval_ns:
+                        display_now_ns = monotonic_ns()
+                        if display_now_ns >= next_display_ns:
+                            # Advance on a fixed cadence so frame jitter does not
+                            # drag the stream below the target rate
+                            next_display_ns += display_interval_ns
+                            if next_display_ns <= display_now_ns:
+                                # Fell behind, e.g. a viewer just connected
+                                next_display_ns = display_now_ns + display_interval_ns
+                            self._publish_display_frame(ref_counted_frame)
+                    else:
+                        self._publish_display_frame(ref_counted_frame)
+                elif self.latest_display_frame_raw is not None:
+                    # Last viewer left: hand a pinned display buffer back
+                    self._clear_display_frame()
             finally:
                 # Release initial reference - this ensures buffer is returned to pool
                 # when all consumers (pipelines + display) have finished with it
                 ref_counted_frame.release()
 
             frame_count += 1
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= 1.0:
-                self.fps = frame_count / elapsed_time
+            now_ns = monotonic_ns()
+            elapsed_ns = now_ns - start_ns
+            if elapsed_ns >= 1_000_000_000:
+                self.fps = frame_count * 1e9 / elapsed_ns
                 frame_count = 0
-                start_time = time.time()
+                start_ns = now_ns
+
+    def _publish_display_frame(self, ref_counted_frame):
+        """Draws the FPS overlay and publishes the frame for lazy JPEG encoding."""
+        src = ref_counted_frame.data
+        size = self._display_output_size(src.shape)
+        display_ref = None
+        if size is not None:
+            # Downscale into a recycled display buffer; the pooled frame is left
+            # untouched, and the display buffer is pinned while published or
+            # being encoded, then handed back to the free list
+            display_frame = self._resize_display_frame(src, size)
+            display_ref = RefCountedFrame(display_frame, self._display_buffers.append)
+            display_ref.acquire()
+        else:
+            # Use get_modifiable_view to avoid unnecessary copy when possible
+            display_frame, is_direct = ref_counted_frame.get_modifiable_view()
+            # When the overlay is drawn into the pooled buffer, keep a reference
+            # so the buffer is not reused while it is the display frame.
+            if is_direct:
+                ref_counted_frame.acquire()
+                display_ref = ref_counted_frame
+        display_frame_with_overlay = self._prepare_display_frame(display_frame)
+
+        # Store the raw frame instead of encoding immediately (lazy encoding).
+        with self.frame_lock:
+            prev_display_ref = self._display_ref
+            self._display_ref = display_ref
+            self.latest_display_frame_raw = display_frame_with_overlay
+            self.display_frame_seq += 1
+            self.latest_display_frame_timestamp = time.perf_counter()
+            self._display_cond.notify_all()
+        if prev_display_ref is not None:
+            prev_display_ref.release()
+
+    def _resize_display_frame(self, src, size):
+        """Downscales ``src`` to ``size`` (w, h) into a recycled display buffer."""
+        dst = self._take_display_buffer(src, size)
+        # Always on the CPU: a T-API resize can only be downloaded into a new
+        # array, which would cost an allocation and a second copy per frame
+        return cv2.resize(src, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+    def _take_display_buffer(self, src, size):
+        """Returns a free display buffer for a ``size`` (w, h) resize of ``src``.
+
+        Buffers of another shape, left over from a resolution or orientation
+        change, are dropped.
+        """
+        shape = (size[1], size[0]) + src.shape[2:]
+        while self._display_buffers:
+            buf = self._display_buffers.pop()
+            if buf.shape == shape and buf.dtype == src.dtype:
+                return buf
+        return np.empty(shape, dtype=src.dtype)
+
+    def _display_output_size(self, shape):
+        """Returns the (w, h) display frames are downscaled to, or None for full size.
+
+        The result is only recomputed when the source shape changes.
+        """
+        cached_shape, size = self._display_size
+        if cached_shape == shape:
+            return size
+
+        size = None
+        h, w = shape[:2]
+        if self.display_max_dim and max(h, w) > self.display_max_dim:
+            scale = self.display_max_dim / max(h, w)
+            size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+        self._display_size = (shape, size)
+        return size
+
+    def _clear_display_frame(self):
+        """Drops the display frame and releases the buffer pinned for it."""
+        with self.frame_lock:
+            display_ref = self._display_ref
+            self._display_ref = None
+            self.latest_display_frame_raw = None
+        if display_ref is not None:
+            display_ref.release()
+
+    def wait_for_display_frame(self, last_seq, timeout=None):
+        """Blocks until a display frame newer than ``last_seq`` is published.
+
+        Args:
+            last_seq (int): The display_frame_seq the caller last handled.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            int: The current display_frame_seq, equal to ``last_seq`` on timeout.
+        """
+        with self._display_cond:
+            self._display_cond.wait_for(
+                lambda: self.display_frame_seq != last_seq, timeout
+            )
+            return self.display_frame_seq
+
+    def add_viewer(self):
+        """Registers a display stream client; display frames are prepared while any are connected."""
+        with self._viewer_lock:
+            self._viewer_count += 1
+
+    def remove_viewer(self):
+        """Unregisters a display stream client added with add_viewer()."""
+        with self._viewer_lock:
+            self._viewer_count = max(0, self._viewer_count - 1)
+
+    def _can_borrow_frames(self, orientation, depth_is_enabled):
+        """True when driver frames can be used as-is instead of copied into the pool."""
+        return (
+            (not orientation or orientation == 180)
+            and not depth_is_enabled
+            and self.driver.supports_borrowed_frames()
+        )
+
+    def _working_set_size(self):
+        """Number of pooled buffers in use at steady state.
+
+        One per queue slot and one per pipeline mid-processing, plus the
+        acquisition, display and calibration references.
+        """
+        in_flight = 0
+        for _, _, max_size, _, _ in self._queue_targets:
+            in_flight += (max_size or 1) + 1
+        return in_flight + 3
 
     def _drain_processing_queues(self):
         """Drains old frames from processing queues when buffer pool is exhausted.
-        This prevents queue buildup and releases buffer pool resources."""
-        with self.queues_lock:
-            for q in self.processing_queues.values():
-                drained_count = 0
-                # Drain up to 2 frames from each queue (non-blocking)
-                while drained_count < 2:
+        This prevents queue buildup and releases buffer pool resources.
+
+        Like the fan-out, this runs on the acquisition thread and reads the
+        immutable queue snapshot instead of taking queues_lock.
+        """
+        for _, q, _, _, _ in self._queue_targets:
+            # Drain up to 2 frames from each queue (non-blocking)
+            if isinstance(q, FrameQueue):
+                old_frames = q.drain(2)
+            else:
+                old_frames = []
+                while len(old_frames) < 2:
                     try:
-                        old_frame = q.get_nowait()
-                        old_frame.release()  # Release the ref-counted frame
-                        drained_count += 1
+                        old_frames.append(q.get_nowait())
                     except queue.Empty:
                         break
-                if drained_count > 0:
-                    print(
-                        f"[{self.identifier}] Drained {drained_count} old frames from queue"
-                    )
+            for old_frame in old_frames:
+                old_frame.release()  # Release the ref-counted frame
+            drained_count = len(old_frames)
+            if drained_count > 0:
+                print(
+                    f"[{self.identifier}] Drained {drained_count} old frames from queue"
+                )
 
-    def _apply_orientation(self, frame, orientation):
-        if orientation == 90:
-            return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        elif orientation == 180:
-            return cv2.rotate(frame, cv2.ROTATE_180)
-        elif orientation == 270:
-            return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        return frame
+    def _apply_orientation(self, frame, orientation, dst=None):
+        """Rotates a frame by the configured orientation.
+
+        When ``dst`` is given the result is written into it (it must already have
+        the rotated shape) and ``dst`` is returned; otherwise a new array is
+        returned, or the frame itself for 0 degrees.
+        """
+        rotate_code = _ROTATE_CODES.get(orientation)
+        if rotate_code is None:
+            if dst is None:
+                return frame
+            np.copyto(dst, frame)
+            return dst
+
+        if dst is None:
+            return cv2.rotate(frame, rotate_code)
+        if self._use_ocl:
+            # Pipelines consume numpy arrays, so the rotated UMat is downloaded
+            # into the pooled buffer straight away
+            rotated = cv2.rotate(cv2.UMat(frame), rotate_code).get()
+        else:
+            rotated = cv2.rotate(frame, rotate_code, dst=dst)
+        if rotated is not dst:
+            # OpenCV allocates a new array when dst does not match the rotated
+            # shape; copyto raises in that case just like the unrotated path
+            np.copyto(dst, rotated)
+        return dst
+
+    @property
+    def fps(self):
+        """Capture rate measured over the last one-second window."""
+        return self._fps
+
+    @fps.setter
+    def fps(self, value):
+        # The overlay is recomposed here, once per FPS update, and only when the
+        # displayed text changes
+        self._fps = value
+        text = _format_fps(value)
+        cache = self._fps_overlay_cache
+        if cache is None or cache[0] != text:
+            self._fps_overlay_cache = self._render_fps_overlay(text)
 
     def _prepare_display_frame(self, frame):
-        """Applies an FPS overlay to a frame."""
-        text = f"FPS: {self.fps:.2f}"
-        cv2.putText(
-            frame, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2
-        )
+        """Applies an FPS overlay to a frame.
+
+        The overlay coverage is composed when the FPS value is updated; each frame
+        just blends it into a small region of the frame, through a scratch buffer
+        so no temporaries are allocated per frame.
+        """
+        _, inv_alpha, color_term, gray_term, (x, y), scratch = self._fps_overlay_cache
+
+        roi = frame[y : y + inv_alpha.shape[0], x : x + inv_alpha.shape[1]]
+        roi_h, roi_w = roi.shape[:2]
+        if roi_h and roi_w:
+            inv_alpha = inv_alpha[:roi_h, :roi_w]
+            color_term = color_term[:roi_h, :roi_w]
+            scratch = scratch[:roi_h, :roi_w]
+            if roi.ndim == 2:
+                # Single-channel frames are drawn in the colour's luma, so the
+                # text stays visible instead of taking its (zero) blue component
+                inv_alpha, color_term = inv_alpha[..., 0], gray_term[:roi_h, :roi_w]
+                scratch = scratch[..., 0]
+            np.multiply(roi, inv_alpha, out=scratch)
+            np.add(scratch, color_term, out=scratch)
+            np.copyto(roi, scratch, casting="unsafe")
         return frame
 
+    @staticmethod
+    def _render_fps_overlay(fps_text):
+        """Composes the FPS text from the glyph atlas into blend terms.
+
+        Returns:
+            tuple: (fps text, inverse alpha, premultiplied colour, premultiplied
+            luma for single-channel frames, top-left corner, float32 blend
+            scratch buffer)
+        """
+        parts = [_FPS_LABEL] + list(fps_text)
+        width = sum(_FPS_GLYPHS[part][1] for part in parts) + 4 * _FPS_PAD
+        coverage = None
+        x = 0
+        for part in parts:
+            glyph, advance = _FPS_GLYPHS[part]
+            if coverage is None:
+                coverage = np.zeros((glyph.shape[0], width), dtype=np.uint8)
+            region = coverage[:, x : x + glyph.shape[1]]
+            np.maximum(region, glyph[:, : region.shape[1]], out=region)
+            x += advance
+        alpha = coverage[..., None].astype(np.float32) / 255.0
+        # +0.5 so the unsafe cast back to uint8 rounds instead of truncating
+        color_term = alpha * np.array(_FPS_COLOR, dtype=np.float32) + 0.5
+        gray_term = alpha[..., 0] * np.float32(_FPS_LUMA) + 0.5
+        top_left = (
+            _FPS_TEXT_ORIGIN[0] - _FPS_PAD,
+            _FPS_TEXT_ORIGIN[1] - _FPS_TEXT_HEIGHT - _FPS_PAD,
+        )
+        return (
+            fps_text,
+            1.0 - alpha,
+            color_term,
+            gray_term,
+            top_left,
+            np.empty_like(color_term),
+        )
+
     def stop(self):
         """Signals the thread to stop."""
         self.stop_event.set()
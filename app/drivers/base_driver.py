@@ -43,6 +43,41 @@ class BaseDriver(ABC):
         """
         pass
 
+    def get_frame_borrowed(self):
+        """Retrieves a frame whose memory the caller may keep without copying.
+
+        Only called when supports_borrowed_frames() returns True. The default
+        reads a fresh frame with get_frame(), which the caller owns outright.
+
+        Returns:
+            tuple: (frame, release_fn) where release_fn (which may be None) hands
+                   the memory back to the driver once the caller is done with it.
+                   frame is None if no frame could be read.
+        """
+        return self.get_frame(), None
+
+    def skip_frame(self):
+        """Waits for the next frame and discards it.
+
+        Called instead of get_frame() while nothing consumes frames, so drivers
+        can skip decoding and colour conversion. The default reads a full frame.
+
+        Returns:
+            bool: True if a frame arrived, False if the connection appears lost
+        """
+        frame = self.get_frame()
+        if isinstance(frame, tuple):
+            frame = frame[0]
+        return frame is not None
+
+    def supports_borrowed_frames(self):
+        """Indicates whether get_frame_borrowed() can hand out frames zero-copy.
+
+        Returns:
+            bool: True if frames can be retained by the caller, False otherwise
+        """
+        return False
+
     def supports_depth(self):
         """Indicates whether this driver supports depth data.
 
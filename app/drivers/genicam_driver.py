@@ -1,7 +1,10 @@
 import threading
+import time
 import cv2
+import numpy as np
 import os
 from .base_driver import BaseDriver
+from ..hw.accel import _has_opencv_cuda
 
 # Attempt to import Harvesters and GenICam API
 try:
@@ -16,6 +19,34 @@ except ImportError:  # pragma: no cover
 _harvester = None
 _harvester_lock = threading.Lock()
 
+# Image acquirers of connected drivers, keyed by serial number and guarded by
+# _harvester_lock. Node map reads and writes borrow these rather than opening a
+# second acquirer, which costs a full GenTL device open.
+_active_acquirers = {}
+
+# Temporary acquirers opened for node access to a camera that is not streaming are
+# parked here for a while instead of being destroyed, so consecutive UI requests
+# share one device open. Keyed by serial number as (ia, parked_at) and guarded by
+# _harvester_lock; connect() adopts a parked acquirer. A single sweeper timer,
+# armed only while something is parked, destroys acquirers that stayed idle.
+_IDLE_ACQUIRER_TTL_S = 60.0
+_idle_acquirers = {}
+_idle_sweeper = None
+
+# Device enumeration runs h.update(), a slow GenTL call. Results are shared by all
+# callers for a short time so concurrent discovery and reconnect attempts do not
+# each trigger their own update.
+_DEVICE_LIST_TTL_S = 1.0
+_device_list_cache = {"ts": None, "devices": []}
+_device_list_cache_lock = threading.Lock()
+
+# Building a node map costs several binding calls per node (hundreds of nodes on
+# a typical camera), so a freshly built map is reused for repeated page loads.
+# Entries are keyed by serial number and dropped when a node is written.
+_NODE_MAP_TTL_S = 1.5
+_node_map_cache = {}
+_node_map_cache_lock = threading.Lock()
+
 
 def _get_harvester():
     """
@@ -38,7 +69,12 @@ def _reset_harvester():
     This is useful when the CTI path changes or for cleanup.
     """
     global _harvester
+    _invalidate_device_list_cache()
+    _invalidate_node_map_cache()
     with _harvester_lock:
+        _active_acquirers.clear()
+        # Resetting the Harvester destroys every acquirer it created
+        _idle_acquirers.clear()
         if _harvester is not None:
             try:
                 _harvester.reset()
@@ -48,7 +84,59 @@ def _reset_harvester():
                 _harvester = None
 
 
+def _invalidate_device_list_cache():
+    """Forces the next device listing to query the Harvester again."""
+    with _device_list_cache_lock:
+        _device_list_cache["ts"] = None
+        _device_list_cache["devices"] = []
+
+
+def _arm_idle_sweeper(delay):
+    """Starts the idle acquirer sweeper. Must be called with _harvester_lock held."""
+    global _idle_sweeper
+    _idle_sweeper = threading.Timer(delay, _sweep_idle_acquirers)
+    _idle_sweeper.daemon = True
+    _idle_sweeper.start()
+
+
+def _sweep_idle_acquirers():
+    """Destroys parked acquirers idle for _IDLE_ACQUIRER_TTL_S and re-arms for the rest."""
+    global _idle_sweeper
+    now = time.monotonic()
+    with _harvester_lock:
+        expired = [
+            (identifier, ia)
+            for identifier, (ia, parked_at) in _idle_acquirers.items()
+            if now - parked_at >= _IDLE_ACQUIRER_TTL_S
+        ]
+        for identifier, _ in expired:
+            del _idle_acquirers[identifier]
+        if _idle_acquirers:
+            oldest = min(parked_at for _, parked_at in _idle_acquirers.values())
+            _arm_idle_sweeper(oldest + _IDLE_ACQUIRER_TTL_S - now)
+        else:
+            _idle_sweeper = None
+    for identifier, ia in expired:
+        try:
+            ia.destroy()
+        except Exception as e:
+            print(f"Error closing idle ImageAcquirer for {identifier}: {e}")
+
+
+def _invalidate_node_map_cache(identifier=None):
+    """Drops the cached node map of one device, or of all devices."""
+    with _node_map_cache_lock:
+        if identifier is None:
+            _node_map_cache.clear()
+        else:
+            _node_map_cache.pop(identifier, None)
+
+
 # --- GenICam Constants ---
+# Accepted spellings for boolean node writes (compared after strip().lower())
+_BOOL_TRUE_TOKENS = frozenset(("true", "1", "yes", "on"))
+_BOOL_FALSE_TOKENS = frozenset(("false", "0", "no", "off"))
+
 if genapi:
     SUPPORTED_INTERFACE_TYPES = {
         genapi.EInterfaceType.intfIInteger: "integer",
@@ -64,6 +152,29 @@ else:
     READABLE_ACCESS_MODES = set()
     WRITABLE_ACCESS_MODES = set()
 
+# Raw get_access_mode() value -> writable, so update_node converts each distinct
+# value to an EAccessMode once rather than on every write
+_writable_by_raw_access = {}
+
+
+def _is_writable_access(raw_access_mode):
+    """True if a raw node access mode allows writes."""
+    writable = _writable_by_raw_access.get(raw_access_mode)
+    if writable is None:
+        writable = genapi.EAccessMode(raw_access_mode) in WRITABLE_ACCESS_MODES
+        _writable_by_raw_access[raw_access_mode] = writable
+    return writable
+
+
+# Bayer pattern (the PFNC pixel format prefix, e.g. "BayerRG" of "BayerRG12")
+# mapped to its bilinear and edge-aware OpenCV demosaic codes.
+_BAYER_CODES = {
+    "BayerRG": (cv2.COLOR_BayerRG2BGR, cv2.COLOR_BayerRG2BGR_EA),
+    "BayerBG": (cv2.COLOR_BayerBG2BGR, cv2.COLOR_BayerBG2BGR_EA),
+    "BayerGR": (cv2.COLOR_BayerGR2BGR, cv2.COLOR_BayerGR2BGR_EA),
+    "BayerGB": (cv2.COLOR_BayerGB2BGR, cv2.COLOR_BayerGB2BGR_EA),
+}
+
 
 class GenICamDriver(BaseDriver):
     """
@@ -74,6 +185,27 @@ class GenICamDriver(BaseDriver):
         super().__init__(camera_db_data)
         self.ia = None  # Image Acquirer instance
 
+        # Edge-aware demosaicing is sharper at object borders but slower than the
+        # default bilinear interpolation.
+        if isinstance(camera_db_data, dict):
+            high_quality = camera_db_data.get("high_quality_demosaic", False)
+        else:
+            high_quality = getattr(camera_db_data, "high_quality_demosaic", False)
+        self._demosaic_variant = 1 if high_quality is True else 0
+
+        # The CUDA demosaic kernels only implement bilinear interpolation, so
+        # edge-aware conversion always stays on the CPU
+        self._use_cuda = self._demosaic_variant == 0 and _has_opencv_cuda()
+        self._gpu_raw = None
+        self._gpu_bgr = None
+        # BGR buffers handed out by get_frame_borrowed() come back here once the
+        # caller releases them and are converted into again
+        self._free_buffers = []
+        # Raw sensor plane copied out of the acquirer buffer; it is converted
+        # before the next fetch, so a single buffer is reused across frames
+        self._raw_buf = None
+        self._raw_host_mem = None  # Page-locked allocation backing _raw_buf on CUDA
+
     def connect(self):
         h = _get_harvester()
         if not h:
@@ -83,9 +215,15 @@ class GenICamDriver(BaseDriver):
 
         with _harvester_lock:
             try:
-                # The identifier for GenICam is the camera's serial number.
-                self.ia = h.create({"serial_number": self.identifier})
+                # The identifier for GenICam is the camera's serial number. An
+                # acquirer left open by a recent node access is adopted as-is.
+                idle = _idle_acquirers.pop(self.identifier, None)
+                if idle is not None:
+                    self.ia = idle[0]
+                else:
+                    self.ia = h.create({"serial_number": self.identifier})
                 self.ia.start()
+                _active_acquirers[self.identifier] = self.ia
                 print(f"Successfully connected to GenICam camera {self.identifier}")
             except Exception as e:
                 # If creation fails, clean up and re-raise.
@@ -99,6 +237,9 @@ class GenICamDriver(BaseDriver):
     def disconnect(self):
         if self.ia:
             print(f"Disconnecting GenICam camera {self.identifier}")
+            with _harvester_lock:
+                if _active_acquirers.get(self.identifier) is self.ia:
+                    del _active_acquirers[self.identifier]
             try:
                 self.ia.stop()
                 self.ia.destroy()
@@ -108,6 +249,39 @@ class GenICamDriver(BaseDriver):
                 self.ia = None
 
     def get_frame(self):
+        return self._read_frame()
+
+    def get_frame_borrowed(self):
+        # list.pop/append are atomic, so buffers can be released from any thread
+        try:
+            dst = self._free_buffers.pop()
+        except IndexError:
+            dst = None
+        frame = self._read_frame(dst)
+        if frame is None:
+            if dst is not None:
+                self._free_buffers.append(dst)
+            return None, None
+        # OpenCV allocates a new array when dst does not fit the converted frame
+        # (e.g. after a resolution change); the stale buffer is simply dropped
+        return frame, self._free_buffers.append
+
+    def supports_borrowed_frames(self):
+        return True
+
+    def skip_frame(self):
+        # The buffer is requeued untouched, skipping the copy and demosaic
+        if not self.ia:
+            return False
+        try:
+            with self.ia.fetch(timeout=2.0):
+                return True
+        except Exception as e:
+            print(f"Frame acquisition failed for GenICam {self.identifier}: {e}")
+            return False
+
+    def _read_frame(self, dst=None):
+        """Fetches a frame and converts it to BGR, into ``dst`` when it fits."""
         if not self.ia:
             return None
 
@@ -115,16 +289,27 @@ class GenICamDriver(BaseDriver):
             # Use a timeout to prevent blocking indefinitely if the camera stops sending frames.
             with self.ia.fetch(timeout=2.0) as buffer:
                 component = buffer.payload.components[0]
-                img = component.data.reshape(component.height, component.width)
-
-                # Convert frame to BGR format for consistency with OpenCV.
-                if "Bayer" in component.data_format:
-                    # Example for BayerRG; the specific conversion might need to be configurable.
-                    return cv2.cvtColor(img, cv2.COLOR_BayerRG2BGR)
-                elif len(img.shape) == 2:  # Grayscale image
-                    return cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
-                else:
-                    return img  # Assume it's already in a compatible format (e.g., BGR)
+                data_format = component.data_format
+                # Copy only the single-channel raw plane while holding the buffer,
+                # so it is requeued to the acquirer before the 3x larger colour
+                # conversion runs
+                img = self._copy_raw_plane(
+                    component.data.reshape(component.height, component.width)
+                )
+
+            # Convert Bayer frames to BGR format for consistency with OpenCV.
+            if "Bayer" in data_format:
+                if self._use_cuda:
+                    return self._demosaic_cuda(
+                        img, self._demosaic_code(data_format), dst
+                    )
+                return cv2.cvtColor(img, self._demosaic_code(data_format), dst)
+            # Mono sensors skip BGR expansion; consumers that need colour convert
+            # themselves. The raw buffer is reused, so hand out a copy.
+            if dst is not None and dst.shape == img.shape and dst.dtype == img.dtype:
+                np.copyto(dst, img)
+                return dst
+            return img.copy()
         except (genapi.TimeoutException, genapi.LogicalErrorException) as e:
             print(
                 f"Frame acquisition timeout for GenICam {self.identifier}: {e}. Connection may be lost."
@@ -135,6 +320,64 @@ class GenICamDriver(BaseDriver):
             print(f"Unexpected error fetching GenICam frame for {self.identifier}: {e}")
             return None
 
+    def _copy_raw_plane(self, plane):
+        """Copies the raw plane into the reusable raw buffer, re-allocating it
+        only when the frame format changes mid-stream."""
+        raw = self._raw_buf
+        if raw is None or raw.shape != plane.shape or raw.dtype != plane.dtype:
+            raw = self._raw_buf = self._alloc_raw_buffer(plane)
+        np.copyto(raw, plane)
+        return raw
+
+    def _alloc_raw_buffer(self, plane):
+        """
+        Allocates the raw plane buffer. When demosaicing on CUDA it is page-locked
+        so the per-frame upload is a direct DMA transfer rather than a staged copy.
+        """
+        self._raw_host_mem = None
+        if self._use_cuda and plane.dtype in (np.uint8, np.uint16):
+            try:
+                mat_type = cv2.CV_8UC1 if plane.dtype == np.uint8 else cv2.CV_16UC1
+                host_mem = cv2.cuda_HostMem(
+                    plane.shape[0],
+                    plane.shape[1],
+                    mat_type,
+                    cv2.cuda.HostMem_PAGE_LOCKED,
+                )
+                raw = host_mem.createMatHeader()
+                if raw.shape == plane.shape and raw.dtype == plane.dtype:
+                    # The header does not own the memory, so keep the allocation
+                    self._raw_host_mem = host_mem
+                    return raw
+            except Exception as e:
+                print(f"Page-locked buffer unavailable for GenICam {self.identifier}: {e}")
+        return np.empty_like(plane)
+
+    def _demosaic_code(self, data_format):
+        """Returns the OpenCV conversion code for a Bayer pixel format."""
+        codes = _BAYER_CODES.get(data_format[:7], _BAYER_CODES["BayerRG"])
+        return codes[self._demosaic_variant]
+
+    def _demosaic_cuda(self, img, code, dst=None):
+        """
+        Demosaics a Bayer frame on the GPU, falling back to the CPU on failure.
+
+        The device buffers are allocated on first use and reused for every frame.
+        """
+        try:
+            if self._gpu_raw is None:
+                self._gpu_raw = cv2.cuda_GpuMat()
+                self._gpu_bgr = cv2.cuda_GpuMat()
+            self._gpu_raw.upload(img)
+            cv2.cuda.demosaicing(self._gpu_raw, code, self._gpu_bgr)
+            return self._gpu_bgr.download(dst)
+        except Exception as e:
+            print(f"CUDA demosaic failed for GenICam {self.identifier}, using CPU: {e}")
+            self._use_cuda = False
+            self._gpu_raw = None
+            self._gpu_bgr = None
+            return cv2.cvtColor(img, code, dst)
+
     @staticmethod
     def initialize(cti_path=None):
         """
@@ -188,6 +431,21 @@ class GenICamDriver(BaseDriver):
         if not h:
             return []
 
+        with _device_list_cache_lock:
+            ts = _device_list_cache["ts"]
+            if ts is not None and time.monotonic() - ts < _DEVICE_LIST_TTL_S:
+                return list(_device_list_cache["devices"])
+
+            devices = GenICamDriver._enumerate_devices(h)
+            if devices is not None:
+                _device_list_cache["ts"] = time.monotonic()
+                _device_list_cache["devices"] = devices
+                return list(devices)
+        return []
+
+    @staticmethod
+    def _enumerate_devices(h):
+        """Queries the Harvester for devices. Returns None if the update failed."""
         devices = []
         with _harvester_lock:
             try:
@@ -204,6 +462,7 @@ class GenICamDriver(BaseDriver):
                         )
             except Exception as e:
                 print(f"Error listing GenICam cameras: {e}")
+                return None
         return devices
 
     @staticmethod
@@ -223,40 +482,101 @@ class GenICamDriver(BaseDriver):
                 )
                 return None, f"Error creating ImageAcquirer for {identifier}: {error}"
 
+    @staticmethod
+    def _open_image_acquirer(identifier):
+        """
+        Returns an image acquirer for node access.
+
+        The acquirer of a connected driver is borrowed when there is one; otherwise
+        a parked acquirer is reused, or a temporary one is created.
+
+        Returns:
+            tuple: (ia, error, borrowed). Pass the acquirer back to
+            _release_image_acquirer() when done.
+        """
+        with _harvester_lock:
+            ia = _active_acquirers.get(identifier)
+            if ia is not None:
+                return ia, None, True
+            idle = _idle_acquirers.pop(identifier, None)
+        if idle is not None:
+            return idle[0], None, False
+        ia, error = GenICamDriver._create_image_acquirer(identifier)
+        return ia, error, False
+
+    @staticmethod
+    def _release_image_acquirer(identifier, ia, borrowed, reusable=True):
+        """
+        Hands back an acquirer from _open_image_acquirer().
+
+        Borrowed acquirers are left alone. Temporary ones are parked for reuse and
+        destroyed once idle for _IDLE_ACQUIRER_TTL_S, or straight away if they
+        failed and may no longer be usable.
+        """
+        if ia is None or borrowed:
+            return
+        parked = False
+        if reusable:
+            with _harvester_lock:
+                if identifier not in _idle_acquirers:
+                    _idle_acquirers[identifier] = (ia, time.monotonic())
+                    parked = True
+                    if _idle_sweeper is None:
+                        _arm_idle_sweeper(_IDLE_ACQUIRER_TTL_S)
+        if not parked:
+            ia.destroy()
+
     @staticmethod
     def get_node_map(identifier):
         """Retrieves the full node map for a specific GenICam device."""
         if not genapi:
             return [], "GenICam runtime (GenAPI) is not available on the server."
 
-        ia, error = GenICamDriver._create_image_acquirer(identifier)
+        with _node_map_cache_lock:
+            cached = _node_map_cache.get(identifier)
+        if cached is not None and time.monotonic() - cached[0] < _NODE_MAP_TTL_S:
+            return list(cached[1]), None
+
+        ia, error, borrowed = GenICamDriver._open_image_acquirer(identifier)
         if error:
             return [], error
 
+        reusable = True
         try:
             node_map = ia.remote_device.node_map
+            # Hoisted lookups for the per-node loop
+            supported_types = SUPPORTED_INTERFACE_TYPES
+            readable_modes = READABLE_ACCESS_MODES
+            writable_modes = WRITABLE_ACCESS_MODES
+            to_access_mode = genapi.EAccessMode
+            enumeration_type = genapi.EInterfaceType.intfIEnumeration
+            # Nodes share a handful of access modes, so each raw value is only
+            # converted to its enum once
+            access_modes = {}
             nodes = []
             for node_wrapper in node_map.nodes:
+                node = node_wrapper.node
                 try:
-                    interface_type = node_wrapper.node.principal_interface_type
+                    interface_type = node.principal_interface_type
                 except Exception:
                     continue
-                if interface_type not in SUPPORTED_INTERFACE_TYPES:
+                type_name = supported_types.get(interface_type)
+                if type_name is None:
                     continue
 
+                access_value = None
                 try:
-                    access_value = node_wrapper.node.get_access_mode()
-                    access_mode = genapi.EAccessMode(access_value)
+                    access_value = node.get_access_mode()
+                    access_mode = access_modes.get(access_value)
+                    if access_mode is None:
+                        access_mode = access_modes[access_value] = to_access_mode(
+                            access_value
+                        )
                 except (ValueError, TypeError):
                     access_mode = None
 
-                is_readable = (
-                    access_mode in READABLE_ACCESS_MODES if access_mode else False
-                )
-                is_writable = (
-                    access_mode in WRITABLE_ACCESS_MODES if access_mode else False
-                )
-                node = node_wrapper.node
+                is_readable = access_mode in readable_modes if access_mode else False
+                is_writable = access_mode in writable_modes if access_mode else False
                 display_name = str(getattr(node, "display_name", "") or "")
                 name = str(getattr(node, "name", "") or "")
                 description = str(
@@ -269,7 +589,7 @@ class GenICamDriver(BaseDriver):
                     "name": name,
                     "display_name": display_name or name,
                     "description": description.strip(),
-                    "interface_type": SUPPORTED_INTERFACE_TYPES[interface_type],
+                    "interface_type": type_name,
                     "access_mode": access_mode.name
                     if access_mode
                     else str(access_value),
@@ -279,12 +599,14 @@ class GenICamDriver(BaseDriver):
                     "choices": [],
                 }
 
+                # Reading a value is a register read on the device, so it is
+                # only attempted for readable nodes
                 if is_readable:
                     try:
                         node_info["value"] = str(node_wrapper.to_string())
                     except Exception as read_error:
                         print(f"Error reading node {name}: {read_error}")
-                if interface_type == genapi.EInterfaceType.intfIEnumeration:
+                if interface_type == enumeration_type:
                     try:
                         node_info["choices"] = [
                             str(symbol) for symbol in node_wrapper.symbolics
@@ -293,12 +615,14 @@ class GenICamDriver(BaseDriver):
                         print(f"Error retrieving enum values for {name}: {enum_error}")
                 nodes.append(node_info)
             nodes.sort(key=lambda item: item["display_name"].lower())
-            return nodes, None
+            with _node_map_cache_lock:
+                _node_map_cache[identifier] = (time.monotonic(), nodes)
+            return list(nodes), None
         except Exception as e:
+            reusable = False
             return [], f"Failed to retrieve node map: {e}"
         finally:
-            if ia:
-                ia.destroy()
+            GenICamDriver._release_image_acquirer(identifier, ia, borrowed, reusable)
 
     @staticmethod
     def update_node(identifier, node_name, value):
@@ -308,34 +632,42 @@ class GenICamDriver(BaseDriver):
         if not node_name:
             return False, "Node name is required.", 400, None
 
-        ia, error = GenICamDriver._create_image_acquirer(identifier)
+        ia, error, borrowed = GenICamDriver._open_image_acquirer(identifier)
         if error:
             return False, f"Unable to connect to the GenICam camera: {error}", 500, None
 
+        reusable = True
         try:
             node = ia.remote_device.node_map.get_node(node_name)
             if node is None:
                 return False, f"Node '{node_name}' not found.", 404, None
 
-            access_mode = genapi.EAccessMode(node.get_access_mode())
-            if access_mode not in WRITABLE_ACCESS_MODES:
+            if not _is_writable_access(node.get_access_mode()):
                 return False, f"Node '{node_name}' is not writable.", 400, None
             if value is None:
                 return False, "A value must be provided.", 400, None
 
+            # A write can change this node and others that depend on it (e.g.
+            # access modes and limits), so the cached map is stale from here on
+            _invalidate_node_map_cache(identifier)
+
             try:
                 if isinstance(node, genapi.IInteger):
                     node.set_value(int(value))
                 elif isinstance(node, genapi.IFloat):
                     node.set_value(float(value))
                 elif isinstance(node, genapi.IBoolean):
-                    norm_val = str(value).strip().lower()
-                    if norm_val in ("true", "1", "yes", "on"):
-                        node.set_value(True)
-                    elif norm_val in ("false", "0", "no", "off"):
-                        node.set_value(False)
+                    if isinstance(value, bool):
+                        # JSON payloads usually carry a real boolean already
+                        node.set_value(value)
                     else:
-                        return False, f"'{value}' is not a valid boolean.", 400, None
+                        norm_val = str(value).strip().lower()
+                        if norm_val in _BOOL_TRUE_TOKENS:
+                            node.set_value(True)
+                        elif norm_val in _BOOL_FALSE_TOKENS:
+                            node.set_value(False)
+                        else:
+                            return False, f"'{value}' is not a valid boolean.", 400, None
                 else:
                     node.from_string(str(value))
             except Exception as set_error:
@@ -346,29 +678,17 @@ class GenICamDriver(BaseDriver):
                     None,
                 )
 
-            # The node value is read back after setting it to confirm the change.
-            # This requires re-establishing a connection in this stateless model.
-            ia.destroy()
-            ia = None
-
-            # Re-acquire to read the value back.
-            ia_read, error_read = GenICamDriver._create_image_acquirer(identifier)
-            if error_read:
-                return True, "Node updated, but failed to verify new state.", 200, None
-
+            # The node value is read back from the device to confirm the change;
+            # the node handle from the write is reused rather than looked up again
             try:
-                updated_node_wrapper = ia_read.remote_device.node_map.get_node(
-                    node_name
-                )
-                updated_value = str(updated_node_wrapper.to_string())
-                updated_node_info = {"name": node_name, "value": updated_value}
-                return True, "Node updated successfully.", 200, updated_node_info
-            finally:
-                if ia_read:
-                    ia_read.destroy()
+                updated_value = str(node.to_string())
+            except Exception:
+                return True, "Node updated, but failed to verify new state.", 200, None
+            updated_node_info = {"name": node_name, "value": updated_value}
+            return True, "Node updated successfully.", 200, updated_node_info
 
         except Exception as e:
+            reusable = False
             return False, f"Unexpected error while updating node: {e}", 500, None
         finally:
-            if ia:
-                ia.destroy()
+            GenICamDriver._release_image_acquirer(identifier, ia, borrowed, reusable)
@@ -1,6 +1,11 @@
+import time
+
 import cv2
 from .base_driver import BaseDriver
-from app.usb_device_info import find_camera_index_by_identifier
+from app.usb_device_info import (
+    find_camera_index_by_identifier,
+    set_camera_index_in_use,
+)
 
 
 class USBDriver(BaseDriver):
@@ -8,6 +13,9 @@ class USBDriver(BaseDriver):
         super().__init__(camera_db_data)
         self.cap = None
         self.resolved_index = None  # Stores the actual OpenCV index after resolution
+        self._stale_after_s = None  # Grab gap after which the queued frame is stale
+        self._last_grab = None
+        self._free_buffers = []  # Returned borrowed frames, decoded into again
 
     def connect(self):
         # Resolve stable identifier to current index
@@ -28,22 +36,73 @@ class USBDriver(BaseDriver):
             raise ConnectionError(
                 f"Failed to open USB camera at index {device_index} (identifier: {self.identifier})"
             )
+        self._configure_capture()
+        set_camera_index_in_use(device_index, True)
         print(
             f"Successfully connected to USB camera {self.identifier} at index {device_index}"
         )
 
+    def _configure_capture(self):
+        """
+        Requests MJPG from the camera and a single-frame driver buffer.
+
+        Most webcams default to uncompressed YUY2, which costs USB bandwidth and
+        an extra colour conversion pass. Cameras that do not support a property
+        ignore the request and keep their defaults.
+        """
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        # Keep at most one frame queued in the driver so reads return the newest one
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self._last_grab = None
+        self._stale_after_s = None
+        try:
+            buffer_size = float(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        except (TypeError, ValueError):
+            buffer_size = 0.0
+        if buffer_size == 1:
+            # The grabbed frame is always the newest; dropping it would only
+            # wait another frame period for the next one
+            return
+
+        # The backend did not apply BUFFERSIZE, so a frame that waited longer
+        # than two frame periods is treated as stale and skipped in get_frame()
+        try:
+            fps = float(self.cap.get(cv2.CAP_PROP_FPS))
+        except (TypeError, ValueError):
+            fps = 0.0
+        self._stale_after_s = 2.0 / fps if fps > 0 else None
+
     def disconnect(self):
         if self.cap:
             print(f"Disconnecting USB camera {self.identifier}")
             self.cap.release()
             self.cap = None
+            set_camera_index_in_use(self.resolved_index, False)
 
     def get_frame(self):
+        return self._read_frame()
+
+    def _read_frame(self, dst=None):
         if not self.cap or not self.cap.isOpened():
             # This indicates a lost connection. Returning None will signal the acquisition loop to reconnect.
             return None
 
-        ret, frame = self.cap.read()
+        # grab() only dequeues the frame; the decode happens in retrieve(), so a
+        # frame that queued while we were busy can be dropped without decoding it
+        stale = (
+            self._stale_after_s is not None
+            and self._last_grab is not None
+            and time.monotonic() - self._last_grab > self._stale_after_s
+        )
+        if not self.cap.grab():
+            return None
+        if stale:
+            self.cap.grab()
+        self._last_grab = time.monotonic()
+
+        # retrieve() decodes into dst in place when its shape and type still match
+        ret, frame = self.cap.retrieve() if dst is None else self.cap.retrieve(dst)
 
         if not ret or frame is None:
             # A failed read could also mean the camera was disconnected.
@@ -51,6 +110,27 @@ class USBDriver(BaseDriver):
 
         return frame
 
+    def skip_frame(self):
+        # grab() dequeues the frame without decoding it
+        if not self.cap or not self.cap.isOpened() or not self.cap.grab():
+            return False
+        self._last_grab = time.monotonic()
+        return True
+
+    def get_frame_borrowed(self):
+        # The decoded frame is handed over as-is; once released its array is
+        # decoded into again instead of allocating a new one per frame
+        dst = self._free_buffers.pop() if self._free_buffers else None
+        frame = self._read_frame(dst)
+        if frame is None:
+            if dst is not None:
+                self._free_buffers.append(dst)
+            return None, None
+        return frame, self._free_buffers.append
+
+    def supports_borrowed_frames(self):
+        return True
+
     @staticmethod
     def list_devices():
         """
@@ -85,6 +85,29 @@ def _has_rknn_toolkit() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _has_opencl() -> bool:
+    # OpenCV's T-API only dispatches to OpenCL when a device is present and
+    # enabled (OPENCV_OPENCL_DEVICE=disabled turns it off)
+    try:
+        import cv2
+
+        return bool(cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _has_opencv_cuda() -> bool:
+    # Only OpenCV builds compiled with the CUDA modules expose cv2.cuda kernels
+    try:
+        import cv2
+
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except Exception:
+        return False
+
+
 def get_available_onnx_providers() -> List[str]:
     providers: List[str] = []
     try:
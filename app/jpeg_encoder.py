@@ -0,0 +1,176 @@
+"""JPEG encoding for the MJPEG display streams.
+
+Encoders are picked in order of preference:
+
+1. NVJPEG (``pynvjpeg``) on machines with an NVIDIA GPU.
+2. PyTurboJPEG, encoding straight into a reusable output buffer using
+   libjpeg-turbo's SIMD paths.
+3. ``cv2.imencode``.
+"""
+
+import threading
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .hw.accel import _has_nvidia_gpu
+
+# Attempt to import PyTurboJPEG
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_GRAY, TJSAMP_422, TJSAMP_GRAY
+except ImportError:  # pragma: no cover
+    TurboJPEG = None
+
+# Attempt to import the NVJPEG bindings
+try:
+    from nvjpeg import NvJpeg
+except ImportError:  # pragma: no cover
+    NvJpeg = None
+
+# --- Module-level encoder handles ---
+# Loading libjpeg-turbo is relatively expensive and its handle is stateless per
+# call, so one is shared by every encoder.
+_turbojpeg = None
+_turbojpeg_loaded = False
+_turbojpeg_lock = threading.Lock()
+# An NVJPEG handle owns encoder state and a CUDA stream, so each encoder creates
+# its own on first use; this only remembers that creating one failed.
+_nvjpeg_failed = False
+_nvjpeg_lock = threading.Lock()
+
+
+def _create_nvjpeg():
+    """
+    Create an NVJPEG handle for a single encoder.
+
+    The handle owns the CUDA encoder state and staging buffers, so it must not
+    be shared between encoders that are driven from different threads.
+
+    Returns:
+        NvJpeg: A new handle, or None if NVJPEG or a GPU is not available.
+    """
+    global _nvjpeg_failed
+    if NvJpeg is None or _nvjpeg_failed or not _has_nvidia_gpu():
+        return None
+    try:
+        return NvJpeg()
+    except Exception as e:
+        with _nvjpeg_lock:
+            if not _nvjpeg_failed:
+                _nvjpeg_failed = True
+                print(f"NVJPEG unavailable, using CPU JPEG encoder: {e}")
+        return None
+
+
+def _get_turbojpeg():
+    """
+    Lazily load and return the shared TurboJPEG handle.
+
+    Returns:
+        TurboJPEG: The shared handle, or None if the library is not available.
+    """
+    global _turbojpeg, _turbojpeg_loaded
+    with _turbojpeg_lock:
+        if not _turbojpeg_loaded:
+            _turbojpeg_loaded = True
+            if TurboJPEG is not None:
+                try:
+                    _turbojpeg = TurboJPEG()
+                except Exception as e:
+                    # The Python package is installed but the native library is not
+                    print(f"TurboJPEG unavailable, using OpenCV JPEG encoder: {e}")
+        return _turbojpeg
+
+
+class JpegEncoder:
+    """Encodes BGR or grayscale frames to JPEG bytes.
+
+    The TurboJPEG output buffer is kept between calls and only re-allocated when
+    the frame shape changes. Each encoder owns its NVJPEG handle, created on the
+    first colour encode so encoders whose stream is never watched hold no GPU
+    state. An encoder instance is not thread-safe; the owner must serialize
+    calls to ``encode``.
+    """
+
+    def __init__(self):
+        self._nvjpeg = None
+        self._nvjpeg_checked = False
+        self._turbo = _get_turbojpeg()
+        self._dst = None
+        self._dst_shape = None
+
+    @property
+    def backend(self):
+        """Name of the backend used for colour frames.
+
+        Reports a CPU backend until the first colour frame has been encoded,
+        since the NVJPEG handle is only created then.
+        """
+        if self._nvjpeg is not None:
+            return "nvjpeg"
+        if self._turbo is not None:
+            return "turbojpeg"
+        return "opencv"
+
+    @property
+    def uses_turbojpeg(self):
+        """True when frames are encoded with libjpeg-turbo."""
+        return self._turbo is not None
+
+    def encode(self, frame, quality) -> Optional[bytes]:
+        """
+        Encodes a frame to JPEG.
+
+        Args:
+            frame (numpy.ndarray): A BGR (HxWx3) or grayscale (HxW) uint8 image.
+            quality (int): JPEG quality (1-100).
+
+        Returns:
+            bytes: The encoded JPEG, or None if encoding failed.
+        """
+        if not self._nvjpeg_checked and frame.ndim == 3:
+            self._nvjpeg_checked = True
+            self._nvjpeg = _create_nvjpeg()
+
+        if self._nvjpeg is not None and frame.ndim == 3:
+            try:
+                return bytes(self._nvjpeg.encode(frame, quality))
+            except Exception as e:
+                print(f"NVJPEG encode failed, falling back to CPU encoder: {e}")
+                self._nvjpeg = None
+
+        if self._turbo is not None:
+            try:
+                return self._encode_turbo(frame, quality)
+            except Exception as e:
+                print(f"TurboJPEG encode failed, falling back to OpenCV: {e}")
+                self._turbo = None
+                self._dst = None
+
+        ret, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if ret:
+            return buffer.tobytes()
+        return None
+
+    def _encode_turbo(self, frame, quality):
+        if frame.ndim == 2:
+            pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+        else:
+            pixel_format, subsample = TJPF_BGR, TJSAMP_422
+
+        frame = np.ascontiguousarray(frame)
+        if self._dst_shape != frame.shape:
+            self._dst = bytearray(
+                self._turbo.buffer_size(frame, jpeg_subsample=subsample)
+            )
+            self._dst_shape = frame.shape
+
+        _, n_bytes = self._turbo.encode(
+            frame,
+            quality=quality,
+            pixel_format=pixel_format,
+            jpeg_subsample=subsample,
+            dst=self._dst,
+        )
+        return bytes(memoryview(self._dst)[:n_bytes])
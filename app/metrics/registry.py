@@ -340,6 +340,36 @@ class MetricsRegistry:
         )
         metrics.record_queue(time.time(), queue_size)
 
+    def record_queue_depths(
+        self,
+        camera_identifier: str,
+        depths: Dict[int, Tuple[int, int]],
+    ) -> None:
+        """Record queue depths for several pipelines of one camera at once.
+
+        ``depths`` maps pipeline_id to ``(queue_size, queue_max_size)``. All
+        samples share one timestamp and the registry lock is taken once.
+        """
+        if not self.enabled or not depths:
+            return
+        timestamp = time.time()
+        with self._lock:
+            samples = [
+                (
+                    self._get_or_create_pipeline_locked(
+                        camera_identifier=camera_identifier,
+                        pipeline_id=pipeline_id,
+                        pipeline_type="unknown",
+                        queue_max_size=queue_max_size,
+                    ),
+                    queue_size,
+                )
+                for pipeline_id, (queue_size, queue_max_size) in depths.items()
+                if isinstance(queue_size, (int, float))
+            ]
+        for metrics, queue_size in samples:
+            metrics.record_queue(timestamp, queue_size)
+
     def record_latencies(
         self,
         camera_identifier: str,
@@ -395,21 +425,35 @@ class MetricsRegistry:
         pipeline_type: str,
         queue_max_size: int,
     ) -> PipelineMetrics:
-        key = (camera_identifier, pipeline_id)
         with self._lock:
-            pipeline = self._pipelines.get(key)
-            if pipeline is None:
-                pipeline = PipelineMetrics(
-                    camera_identifier=camera_identifier,
-                    pipeline_id=pipeline_id,
-                    pipeline_type=pipeline_type,
-                    queue_max_size=queue_max_size,
-                    window_seconds=self.window_seconds,
-                    fps_window_seconds=self.fps_window_seconds,
-                )
-                self._pipelines[key] = pipeline
-            else:
-                pipeline.update_metadata(pipeline_type, queue_max_size)
+            return self._get_or_create_pipeline_locked(
+                camera_identifier=camera_identifier,
+                pipeline_id=pipeline_id,
+                pipeline_type=pipeline_type,
+                queue_max_size=queue_max_size,
+            )
+
+    def _get_or_create_pipeline_locked(
+        self,
+        camera_identifier: str,
+        pipeline_id: int,
+        pipeline_type: str,
+        queue_max_size: int,
+    ) -> PipelineMetrics:
+        key = (camera_identifier, pipeline_id)
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            pipeline = PipelineMetrics(
+                camera_identifier=camera_identifier,
+                pipeline_id=pipeline_id,
+                pipeline_type=pipeline_type,
+                queue_max_size=queue_max_size,
+                window_seconds=self.window_seconds,
+                fps_window_seconds=self.fps_window_seconds,
+            )
+            self._pipelines[key] = pipeline
+        else:
+            pipeline.update_metadata(pipeline_type, queue_max_size)
         return pipeline
 
 
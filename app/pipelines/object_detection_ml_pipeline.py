@@ -86,6 +86,12 @@ def _resolve_path(config: Dict, base_dir: str, key: str) -> Optional[str]:
     return None
 
 
+def _to_rgb(frame: np.ndarray) -> np.ndarray:
+    # Mono cameras deliver single-channel frames
+    code = cv2.COLOR_GRAY2RGB if frame.ndim == 2 else cv2.COLOR_BGR2RGB
+    return cv2.cvtColor(frame, code)
+
+
 def _letterbox_image(
     image: np.ndarray, img_size: int
 ) -> Tuple[np.ndarray, float, Tuple[float, float]]:
@@ -277,7 +283,7 @@ class OnnxYoloBackend(DetectionBackend):
         self.input_name = self.session.get_inputs()[0].name
 
     def predict(self, frame: np.ndarray) -> List[Detection]:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = _to_rgb(frame)
         resized, scale, pad = _letterbox_image(rgb, self.img_size)
         tensor = resized.astype(np.float32) / 255.0
         tensor = np.transpose(tensor, (2, 0, 1))
@@ -397,7 +403,7 @@ class TFLiteBackend(DetectionBackend):
         return interpreter
 
     def _prepare_input(self, frame: np.ndarray) -> Tuple[np.ndarray, Dict[str, object]]:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = _to_rgb(frame)
         resized, scale, pad = _letterbox_image(rgb, self.img_size)
         tensor = resized.astype(np.float32) / 255.0
         tensor = np.expand_dims(tensor, axis=0)
@@ -495,7 +501,7 @@ class RKNNBackend(DetectionBackend):
             raise RuntimeError("Failed to initialise RKNN runtime.")
 
     def predict(self, frame: np.ndarray) -> List[Detection]:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = _to_rgb(frame)
         resized, scale, pad = _letterbox_image(rgb, self.img_size)
         tensor = resized.astype(np.float32) / 255.0
         tensor = np.expand_dims(tensor, axis=0)
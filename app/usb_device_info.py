@@ -6,15 +6,131 @@ and extract stable identifiers (Vendor ID, Product ID, Serial Number, etc.)
 that persist across USB port changes.
 """
 
+import os
 import sys
+import threading
 import cv2
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 
+# Highest OpenCV index scanned when a platform API cannot list devices directly
+_MAX_CAMERA_INDEX = 10
 
-def get_usb_cameras_with_info() -> List[Dict[str, str]]:
+# VIDIOC_QUERYCAP request and capability flags from linux/videodev2.h
+_VIDIOC_QUERYCAP = 0x80685600
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+# OpenCV indices currently held open by a USB driver. Probing them would open a
+# device a second time while an acquisition thread is streaming from it.
+_indices_in_use = set()
+_indices_in_use_lock = threading.Lock()
+
+
+def set_camera_index_in_use(index: int, in_use: bool) -> None:
+    """Records whether a USB driver currently holds the device at ``index`` open."""
+    with _indices_in_use_lock:
+        if in_use:
+            _indices_in_use.add(index)
+        else:
+            _indices_in_use.discard(index)
+
+
+def _candidate_indices() -> List[int]:
+    """
+    OpenCV indices worth probing. On Linux, indices without a /dev/videoN node
+    are skipped outright instead of waiting for OpenCV to fail to open them.
+    """
+    if sys.platform.startswith("linux"):
+        return [
+            i for i in range(_MAX_CAMERA_INDEX) if os.path.exists(f"/dev/video{i}")
+        ]
+    return list(range(_MAX_CAMERA_INDEX))
+
+
+def _v4l2_can_capture(device_path: str) -> bool:
+    """
+    True if a V4L2 device node can be opened and reports video capture support.
+
+    A VIDIOC_QUERYCAP ioctl answers this without the format negotiation and
+    buffer setup that opening the device with OpenCV goes through.
+    """
+    import fcntl
+    import struct
+
+    try:
+        fd = os.open(device_path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+    try:
+        # struct v4l2_capability is 104 bytes; the capability words follow the
+        # driver, card and bus_info strings
+        buf = bytearray(104)
+        fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+    capabilities, device_caps = struct.unpack_from("=II", buf, 84)
+    if capabilities & _V4L2_CAP_DEVICE_CAPS:
+        # Capabilities of this node rather than of the whole physical device
+        capabilities = device_caps
+    return bool(capabilities & _V4L2_CAP_VIDEO_CAPTURE)
+
+
+def _default_probe_backend() -> int:
+    """Capture backend that opens fastest for probing on this platform."""
+    if sys.platform == "win32":
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY
+
+
+def _probe_camera_indices(
+    indices: List[int], api_preference: Optional[int] = None
+) -> List[int]:
+    """
+    Returns the indices that OpenCV can open, probing them concurrently.
+
+    Opening a capture device is dominated by driver I/O and backend negotiation,
+    so the probes run in parallel threads rather than one after another.
+    """
+    if not indices:
+        return []
+    if api_preference is None:
+        api_preference = _default_probe_backend()
+
+    # A device a running camera holds open is known to work; leave it alone
+    with _indices_in_use_lock:
+        in_use = {index for index in indices if index in _indices_in_use}
+    to_probe = [index for index in indices if index not in in_use]
+    if not to_probe:
+        return list(indices)
+
+    def probe(index):
+        cap = cv2.VideoCapture(index, api_preference)
+        try:
+            return cap.isOpened()
+        finally:
+            cap.release()
+
+    with ThreadPoolExecutor(max_workers=len(to_probe)) as executor:
+        opened = list(executor.map(probe, to_probe))
+    available = in_use.union(index for index, ok in zip(to_probe, opened) if ok)
+    return [index for index in indices if index in available]
+
+
+def get_usb_cameras_with_info(verify: bool = True) -> List[Dict[str, str]]:
     """
     Enumerate USB cameras and return them with stable unique identifiers.
 
+    Args:
+        verify: Open each device to confirm it is accessible. Where the OS lists
+            devices without OpenCV (Linux), this can be skipped by callers that
+            are about to open the device themselves anyway.
+
     Returns a list of dictionaries with keys:
     - 'cv_index': OpenCV camera index (int as string)
     - 'identifier': Stable unique identifier for the camera
@@ -27,7 +143,7 @@ def get_usb_cameras_with_info() -> List[Dict[str, str]]:
     if sys.platform == "win32":
         return _get_usb_cameras_windows()
     elif sys.platform.startswith("linux"):
-        return _get_usb_cameras_linux()
+        return _get_usb_cameras_linux(verify)
     elif sys.platform == "darwin":
         return _get_usb_cameras_macos()
     else:
@@ -46,17 +162,8 @@ def _get_usb_cameras_windows() -> List[Dict[str, str]]:
 
     cameras = []
 
-    # First, get all available OpenCV camera indices
-    cv_cameras = {}  # Maps index to basic camera info
-    for i in range(10):
-        cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)  # Use DirectShow on Windows
-        if cap.isOpened():
-            # Try to get the camera backend name
-            backend_name = (
-                cap.getBackendName() if hasattr(cap, "getBackendName") else "unknown"
-            )
-            cv_cameras[i] = {"index": i, "backend": backend_name}
-            cap.release()
+    # First, get all available OpenCV camera indices (DirectShow on Windows)
+    cv_cameras = _probe_camera_indices(_candidate_indices(), cv2.CAP_DSHOW)
 
     if not cv_cameras:
         return []
@@ -93,7 +200,7 @@ def _get_usb_cameras_windows() -> List[Dict[str, str]]:
         # Match USB devices to OpenCV indices
         # This is approximate since Windows doesn't provide direct mapping
         # We'll create identifiers for all found USB cameras
-        for idx, (cv_idx, cv_info) in enumerate(cv_cameras.items()):
+        for idx, cv_idx in enumerate(cv_cameras):
             if idx < len(usb_devices):
                 device = usb_devices[idx]
                 identifier = _create_identifier(
@@ -133,7 +240,7 @@ def _get_usb_cameras_windows() -> List[Dict[str, str]]:
     return cameras
 
 
-def _get_usb_cameras_linux() -> List[Dict[str, str]]:
+def _get_usb_cameras_linux(verify: bool = True) -> List[Dict[str, str]]:
     """Linux-specific USB camera enumeration using v4l2 and sysfs."""
     try:
         import pyudev
@@ -146,6 +253,7 @@ def _get_usb_cameras_linux() -> List[Dict[str, str]]:
     context = pyudev.Context()
 
     # Find all video4linux devices
+    candidates = []
     for device in context.list_devices(subsystem="video4linux"):
         # Get the video device path (e.g., /dev/video0)
         device_path = device.device_node
@@ -158,12 +266,26 @@ def _get_usb_cameras_linux() -> List[Dict[str, str]]:
         except ValueError:
             continue
 
-        # Try to open with OpenCV to verify it's accessible
-        cap = cv2.VideoCapture(cv_index)
-        if not cap.isOpened():
-            cap.release()
+        # Skip metadata-only nodes, which UVC cameras expose next to the capture
+        # node, without opening them
+        capabilities = device.get("ID_V4L_CAPABILITIES")
+        if capabilities is not None and ":capture:" not in capabilities:
+            continue
+        candidates.append((cv_index, device_path, device))
+
+    if verify:
+        # Query each node directly to verify it is accessible and can capture
+        accessible = {
+            cv_index
+            for cv_index, device_path, _ in candidates
+            if _v4l2_can_capture(device_path)
+        }
+    else:
+        accessible = {cv_index for cv_index, _, _ in candidates}
+
+    for cv_index, device_path, device in candidates:
+        if cv_index not in accessible:
             continue
-        cap.release()
 
         # Get USB device info by traversing up the device tree
         usb_device = device
@@ -214,12 +336,7 @@ def _get_usb_cameras_macos() -> List[Dict[str, str]]:
     cameras = []
 
     # First, get all available OpenCV camera indices
-    cv_cameras = {}
-    for i in range(10):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            cv_cameras[i] = {"index": i}
-            cap.release()
+    cv_cameras = _probe_camera_indices(_candidate_indices())
 
     if not cv_cameras:
         return []
@@ -240,7 +357,7 @@ def _get_usb_cameras_macos() -> List[Dict[str, str]]:
             camera_data = data.get("SPCameraDataType", [])
 
             # Map cameras to OpenCV indices (best effort)
-            for idx, cv_idx in enumerate(cv_cameras.keys()):
+            for idx, cv_idx in enumerate(cv_cameras):
                 if idx < len(camera_data):
                     cam = camera_data[idx]
                     name = cam.get("_name", f"USB Camera {cv_idx}")
@@ -298,12 +415,7 @@ def _get_usb_cameras_macos_ioreg() -> List[Dict[str, str]]:
     cameras = []
 
     # Get all available OpenCV camera indices
-    cv_cameras = {}
-    for i in range(10):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            cv_cameras[i] = {"index": i}
-            cap.release()
+    cv_cameras = _probe_camera_indices(_candidate_indices())
 
     if not cv_cameras:
         return []
@@ -366,7 +478,7 @@ def _get_usb_cameras_macos_ioreg() -> List[Dict[str, str]]:
                     in_video_device = False
 
         # Match USB devices to OpenCV indices (best effort, in order)
-        for idx, cv_idx in enumerate(cv_cameras.keys()):
+        for idx, cv_idx in enumerate(cv_cameras):
             if idx < len(usb_devices):
                 device = usb_devices[idx]
                 vid = device.get("vendor_id", "")
@@ -464,21 +576,24 @@ def _get_usb_cameras_fallback() -> List[Dict[str, str]]:
     This method doesn't provide stable identifiers across USB port changes.
     """
     cameras = []
-    for i in range(10):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            cameras.append(
-                {
-                    "cv_index": str(i),
-                    "identifier": f"usb:index:{i}",
-                    "name": f"USB Camera {i}",
-                    "vendor_id": "",
-                    "product_id": "",
-                    "serial_number": "",
-                    "usb_path": "",
-                }
-            )
-            cap.release()
+    if sys.platform.startswith("linux"):
+        indices = [
+            i for i in _candidate_indices() if _v4l2_can_capture(f"/dev/video{i}")
+        ]
+    else:
+        indices = _probe_camera_indices(_candidate_indices())
+    for i in indices:
+        cameras.append(
+            {
+                "cv_index": str(i),
+                "identifier": f"usb:index:{i}",
+                "name": f"USB Camera {i}",
+                "vendor_id": "",
+                "product_id": "",
+                "serial_number": "",
+                "usb_path": "",
+            }
+        )
     return cameras
 
 
@@ -550,7 +665,18 @@ def find_camera_index_by_identifier(identifier: str) -> Optional[int]:
     Returns:
         The current OpenCV camera index, or None if not found
     """
-    cameras = get_usb_cameras_with_info()
+    # Index-based identifiers name the device node directly, so on Linux a
+    # stat of /dev/videoN answers the lookup without enumerating every device
+    if identifier.startswith("usb:index:") and sys.platform.startswith("linux"):
+        try:
+            index = int(identifier[len("usb:index:") :])
+        except ValueError:
+            return None
+        return index if os.path.exists(f"/dev/video{index}") else None
+
+    # The caller opens the returned index itself, which doubles as the
+    # accessibility check, so devices are not opened here as well
+    cameras = get_usb_cameras_with_info(verify=False)
 
     for camera in cameras:
         if camera["identifier"] == identifier:
@@ -9,6 +9,10 @@ Environment Variables:
     DATABASE_URL: SQLAlchemy database URI
     HOST: Server host address (default: 0.0.0.0)
     PORT: Server port (default: 8080)
+    OPENCV_NUM_THREADS: Worker threads per OpenCV call (default: 1, 0 keeps
+        OpenCV's own default)
+    OPENCV_USE_OPENCL: Route frame rotation through OpenCV's OpenCL T-API
+        (0 or 1, default: 0)
 """
 
 import os
@@ -40,6 +44,12 @@ class Config:
     PIPELINE_QUEUE_HIGH_UTILIZATION_PCT = float(os.environ.get('PIPELINE_QUEUE_HIGH_UTILIZATION_PCT', 80))
     PIPELINE_LATENCY_WARN_MS = float(os.environ.get('PIPELINE_LATENCY_WARN_MS', 150))
     METRICS_REFRESH_INTERVAL_MS = int(os.environ.get('METRICS_REFRESH_INTERVAL_MS', 2000))
+    # Every camera and pipeline already runs on its own thread; letting each
+    # OpenCV call fan out to a pool sized to all cores oversubscribes the CPU
+    OPENCV_NUM_THREADS = int(os.environ.get('OPENCV_NUM_THREADS', 1))
+    # The T-API round trip (upload, kernel, download into a new array, copy into
+    # the pooled buffer) only beats the CPU path on some integrated GPUs
+    OPENCV_USE_OPENCL = os.environ.get('OPENCV_USE_OPENCL', '0').lower() in ('1', 'true', 'yes')
 
 
 class DevelopmentConfig(Config):
@@ -19,7 +19,15 @@ Examples:
     FLASK_DEBUG=1 python run.py
 """
 
-from app import create_app
+import os
+
+# OpenMP and OpenBLAS size their pools when numpy and OpenCV are first imported,
+# so the per-call thread count is capped here, before the app imports them.
+# Parallelism comes from the per-camera and per-pipeline threads instead.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
+from app import create_app  # noqa: E402
 
 app = create_app()
 
@@ -63,3 +63,16 @@ def test_cannot_instantiate_abstract_base_driver(mock_camera_data):
     assert "disconnect" in error_str
     assert "get_frame" in error_str
     assert "list_devices" in error_str
+
+
+def test_get_frame_borrowed_defaults_to_get_frame(mock_camera_data):
+    """
+    Tests that drivers without a zero-copy path still hand out frames,
+    with no release callback.
+    """
+    driver = ConcreteDriver(mock_camera_data)
+    frame = object()
+    driver.get_frame = MagicMock(return_value=frame)
+
+    assert driver.get_frame_borrowed() == (frame, None)
+    driver.get_frame.assert_called_once_with()
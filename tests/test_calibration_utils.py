@@ -95,6 +95,24 @@ def test_session_management(manager):
     assert session is None
 
 
+def test_session_listeners(manager):
+    """Listeners get the current state on registration and every start/end."""
+    states = []
+    params = {"rows": 6, "cols": 9, "square_size": 25}
+    manager.register_listener(1, states.append)
+    assert states == [False]
+
+    manager.start_session(1, "Chessboard", params)
+    manager.start_session(2, "Chessboard", params)  # Other cameras are ignored
+    manager.end_session(1)
+    manager.end_session(1)  # Ending a missing session does not notify
+    assert states == [False, True, False]
+
+    manager.unregister_listener(1, states.append)
+    manager.start_session(1, "Chessboard", params)
+    assert states == [False, True, False]
+
+
 def test_chessboard_calibration_flow(manager, mocker):
     """Test the full chessboard calibration flow by mocking the detector."""
     camera_id = 2
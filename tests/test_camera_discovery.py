@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-from app.camera_discovery import discover_cameras, get_driver
+from app.camera_discovery import DRIVER_REGISTRY, discover_cameras, get_driver
 from app.drivers.usb_driver import USBDriver
 from app.drivers.genicam_driver import GenICamDriver
 from app.drivers.oakd_driver import OAKDDriver
@@ -107,6 +107,13 @@ def test_get_driver_oakd():
     assert isinstance(driver, OAKDDriver)
 
 
+def test_driver_registry_is_read_only():
+    """The driver registry maps every camera type and cannot be mutated."""
+    assert set(DRIVER_REGISTRY) == {"USB", "GenICam", "OAK-D", "RealSense"}
+    with pytest.raises(TypeError):
+        DRIVER_REGISTRY["Other"] = USBDriver
+
+
 def test_get_driver_unknown_type():
     """Test that get_driver raises a ValueError for an unknown camera type."""
     mock_cam_data = MagicMock()
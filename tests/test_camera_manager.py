@@ -58,8 +58,10 @@ def mock_pipeline(mock_app):
 def manage_active_threads():
     """Fixture to clear the active_camera_threads global before and after each test."""
     camera_manager.active_camera_threads.clear()
+    camera_manager._publish_camera_threads()
     yield
     camera_manager.active_camera_threads.clear()
+    camera_manager._publish_camera_threads()
 
 
 @pytest.fixture
@@ -255,16 +257,25 @@ def test_start_all_camera_threads(
     )
 
 
-@patch("app.camera_manager.stop_camera_thread")
-def test_stop_all_camera_threads(mock_stop_single):
-    """Global shutdown should iterate over tracked cameras."""
-    camera_manager.active_camera_threads = {"cam1": 1, "cam2": 2, "cam3": 3}
+def test_stop_all_camera_threads():
+    """Global shutdown signals every camera before waiting on any of them."""
+    events = []
+    camera_manager.active_camera_threads = {}
+    for identifier in ("cam1", "cam2", "cam3"):
+        acq = MagicMock()
+        acq.stop.side_effect = lambda i=identifier: events.append(("stop", i))
+        acq.join.side_effect = lambda timeout, i=identifier: events.append(("join", i))
+        acq.is_alive.return_value = False
+        camera_manager.active_camera_threads[identifier] = {
+            "acquisition": acq,
+            "processing_threads": {},
+        }
 
     camera_manager.stop_all_camera_threads()
 
-    mock_stop_single.assert_has_calls(
-        [call("cam1"), call("cam2"), call("cam3")], any_order=True
-    )
+    assert [kind for kind, _ in events] == ["stop"] * 3 + ["join"] * 3
+    assert {i for _, i in events} == {"cam1", "cam2", "cam3"}
+    assert not camera_manager.active_camera_threads
 
 
 def test_get_camera_pipeline_results(camera_config):
@@ -278,6 +289,7 @@ def test_get_camera_pipeline_results(camera_config):
         "acquisition": MagicMock(),
         "processing_threads": {101: mock_proc_thread1, 102: mock_proc_thread2},
     }
+    camera_manager._publish_camera_threads()
 
     results = camera_manager.get_camera_pipeline_results(camera_config["identifier"])
 
@@ -297,6 +309,7 @@ def test_is_camera_thread_running(camera_config, mock_threads):
         "acquisition": mock_threads["acquisition"].return_value,
         "processing_threads": {},
     }
+    camera_manager._publish_camera_threads()
 
     assert camera_manager.is_camera_thread_running(camera_config["identifier"]) is True
 
@@ -304,6 +317,28 @@ def test_is_camera_thread_running(camera_config, mock_threads):
     assert camera_manager.is_camera_thread_running(camera_config["identifier"]) is False
 
 
+def test_active_camera_threads_snapshot_is_read_only(
+    camera_config, mock_app, mock_threads
+):
+    """Readers get an immutable snapshot that later writes do not touch."""
+    camera_manager.start_camera_thread(camera_config, mock_app)
+    snapshot = camera_manager.get_active_camera_threads()
+    thread_group = snapshot[camera_config["identifier"]]
+
+    with pytest.raises(TypeError):
+        thread_group["processing_threads"][999] = MagicMock()
+
+    camera_manager.remove_pipeline_from_camera(camera_config["identifier"], 101)
+
+    assert 101 in thread_group["processing_threads"]
+    latest = camera_manager.get_active_camera_threads()
+    assert 101 not in latest[camera_config["identifier"]]["processing_threads"]
+
+    camera_manager.stop_camera_thread(camera_config["identifier"])
+    assert camera_config["identifier"] in snapshot
+    assert not camera_manager.get_active_camera_threads()
+
+
 def test_is_camera_thread_running_not_present():
     """Status checks should return False for unknown cameras."""
     assert camera_manager.is_camera_thread_running("non_existent_cam") is False
@@ -1,8 +1,9 @@
 import pytest
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 import numpy as np
 
-from app import camera_stream
+from app import camera_manager, camera_stream
 from app.models import Camera
 
 
@@ -19,14 +20,19 @@ def mock_camera(app):
 @pytest.fixture
 def mock_active_threads(mock_camera):
     """
-    Mocks the active_camera_threads global dictionary and provides mock thread objects.
-    This fixture patches the dictionary where it's looked up (in the camera_stream module).
+    Mocks the camera thread registry snapshot and provides mock thread objects.
     """
     mock_acq_thread = MagicMock()
     mock_acq_thread.is_alive.return_value = True
     # Mock the raw frame for lazy encoding (must be a numpy array for cv2.imencode)
     mock_acq_thread.latest_display_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
     mock_acq_thread.jpeg_quality = 85
+    # Display frames are encoded by the thread itself
+    mock_acq_thread.get_display_frame.side_effect = lambda: (
+        None
+        if mock_acq_thread.latest_display_frame_raw is None
+        else b"\xff\xd8display\xff\xd9"
+    )
     # latest_raw_frame is now a RefCountedFrame, create a mock for it
     mock_ref_frame = MagicMock()
     mock_ref_frame.get_writable_copy.return_value = np.zeros((10, 10), dtype=np.uint8)
@@ -37,6 +43,12 @@ def mock_active_threads(mock_camera):
     # Mock the raw processed frame for lazy encoding (must be a numpy array for cv2.imencode)
     mock_proc_thread.latest_processed_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
     mock_proc_thread.jpeg_quality = 75
+    # Processed frames are encoded by the thread itself
+    mock_proc_thread.get_processed_frame.side_effect = lambda: (
+        None
+        if mock_proc_thread.latest_processed_frame_raw is None
+        else b"\xff\xd8processed\xff\xd9"
+    )
 
     threads_dict = {
         mock_camera.identifier: {
@@ -45,10 +57,12 @@ def mock_active_threads(mock_camera):
         }
     }
 
-    with patch.dict(
-        camera_stream.active_camera_threads, threads_dict, clear=True
-    ) as mocked_dict:
-        yield {"dict": mocked_dict, "acq": mock_acq_thread, "proc": mock_proc_thread}
+    with patch.object(
+        camera_manager,
+        "_camera_threads_snapshot",
+        MappingProxyType(threads_dict),
+    ):
+        yield {"acq": mock_acq_thread, "proc": mock_proc_thread}
 
 
 # --- Tests for get_camera_feed ---
@@ -69,6 +83,33 @@ def test_get_camera_feed_success(mock_camera, mock_active_threads):
     assert b"Content-Type: image/jpeg" in frame
 
 
+def test_get_camera_feed_yields_shared_jpeg_without_copy(
+    mock_camera, mock_active_threads
+):
+    """The encoded frame is yielded as its own chunk rather than concatenated."""
+    jpeg = b"\xff\xd8shared\xff\xd9"
+    mock_active_threads["acq"].get_display_frame.side_effect = lambda: jpeg
+    feed_generator = camera_stream.get_camera_feed(mock_camera)
+
+    assert next(feed_generator) == b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+    assert next(feed_generator) is jpeg
+    assert next(feed_generator) == b"\r\n"
+    feed_generator.close()
+
+
+def test_get_camera_feed_registers_viewer(mock_camera, mock_active_threads):
+    """The feed counts as a viewer from its first frame until it is closed."""
+    acq = mock_active_threads["acq"]
+    feed_generator = camera_stream.get_camera_feed(mock_camera)
+
+    next(feed_generator)
+    acq.add_viewer.assert_called_once()
+    acq.remove_viewer.assert_not_called()
+
+    feed_generator.close()
+    acq.remove_viewer.assert_called_once()
+
+
 def test_get_camera_feed_thread_not_running(mock_camera):
     """Test the feed generator when the camera thread is not active."""
     # The mock_active_threads fixture is not used, so the dict is empty
@@ -83,9 +124,11 @@ def test_get_camera_feed_thread_dies(mock_camera, mock_active_threads):
     """Test the feed generator when the thread dies during streaming."""
     feed_generator = camera_stream.get_camera_feed(mock_camera)
 
-    # The first yield should work fine
+    # The first part should work fine: header, JPEG, trailer
     frame = next(feed_generator)
     assert b"--frame" in frame
+    next(feed_generator)
+    assert next(feed_generator) == b"\r\n"
 
     # Now, we simulate the thread dying
     mock_active_threads["acq"].is_alive.return_value = False
@@ -152,9 +195,11 @@ def test_get_processed_camera_feed_thread_dies(mock_active_threads):
     pipeline_id = 101
     feed_generator = camera_stream.get_processed_camera_feed(pipeline_id)
 
-    # The first yield should work fine
+    # The first part should work fine: header, JPEG, trailer
     frame = next(feed_generator)
     assert b"--frame" in frame
+    next(feed_generator)
+    assert next(feed_generator) == b"\r\n"
 
     # Now, we simulate the thread dying
     mock_active_threads["proc"].is_alive.return_value = False
@@ -176,6 +221,10 @@ def test_get_processed_camera_feed_generator_exit(mock_active_threads):
     except Exception as e:
         pytest.fail(f"GeneratorExit was not handled correctly: {e}")
 
+    proc = mock_active_threads["proc"]
+    proc.add_viewer.assert_called_once()
+    proc.remove_viewer.assert_called_once()
+
 
 def test_get_processed_camera_feed_no_frame(mock_active_threads):
     """Test the processed feed generator when the thread is alive but there's no frame."""
@@ -202,12 +251,26 @@ def test_get_latest_raw_frame_success(mock_camera, mock_active_threads):
 
     frame_copy = camera_stream.get_latest_raw_frame(mock_camera.identifier)
 
-    # Check that get_writable_copy was called
+    # Check that a reference was held around get_writable_copy
+    ref_frame_mock.try_acquire.assert_called_once()
     ref_frame_mock.get_writable_copy.assert_called_once()
+    ref_frame_mock.release.assert_called_once()
     # Check that the returned frame matches
     assert np.array_equal(frame_copy, expected_frame)
 
 
+def test_get_latest_raw_frame_already_recycled(mock_camera, mock_active_threads):
+    """A frame returned to the pool before it could be referenced is not copied."""
+    ref_frame_mock = mock_active_threads["acq"].latest_raw_frame
+    ref_frame_mock.try_acquire.return_value = False
+
+    frame = camera_stream.get_latest_raw_frame(mock_camera.identifier)
+
+    assert frame is None
+    ref_frame_mock.get_writable_copy.assert_not_called()
+    ref_frame_mock.release.assert_not_called()
+
+
 def test_get_latest_raw_frame_thread_not_running(mock_camera):
     """Test getting a raw frame when the camera thread is not active."""
     frame = camera_stream.get_latest_raw_frame(mock_camera.identifier)
@@ -225,61 +288,56 @@ def test_get_latest_raw_frame_is_none(mock_camera, mock_active_threads):
 def test_get_camera_feed_waits_for_frame(mock_camera, mock_active_threads):
     """
     Test the camera feed generator when it has to wait for a frame to become available.
-    This ensures the time.sleep line is covered.
+    The generator blocks on the thread's frame notification instead of polling.
     """
-    # The thread is alive for two loops, then dies.
-    mock_active_threads["acq"].is_alive.side_effect = [True, True, False]
+    acq = mock_active_threads["acq"]
+    acq.latest_display_frame_raw = None
+    acq.is_alive.return_value = True
 
-    # The frame is not available on the first loop (latest_display_frame_raw is None).
-    mock_active_threads["acq"].latest_display_frame_raw = None
+    def wait_for_display_frame(last_seq, timeout=None):
+        if last_seq < 0:
+            # Sequence 0 has no frame yet; publish one for the next wait
+            return 0
+        acq.latest_display_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
+        return last_seq + 1
 
-    feed_generator = camera_stream.get_camera_feed(mock_camera)
+    acq.wait_for_display_frame.side_effect = wait_for_display_frame
 
+    feed_generator = camera_stream.get_camera_feed(mock_camera)
     with patch("time.sleep") as mock_sleep:
-        # This side effect runs when time.sleep is called after the first empty loop.
-        def make_frame_available(duration):
-            # Set a new raw frame (numpy array) that will be encoded
-            mock_active_threads["acq"].latest_display_frame_raw = np.zeros(
-                (10, 10, 3), dtype=np.uint8
-            )
-
-        mock_sleep.side_effect = make_frame_available
-
-        # The generator should loop once, find no frame, sleep (and trigger the side effect),
-        # then loop again, find the new frame, and yield it.
         frame = next(feed_generator)
 
-        assert b"--frame" in frame
-        mock_sleep.assert_called_once_with(0.001)
+    assert b"--frame" in frame
+    mock_sleep.assert_not_called()
+    assert [c.args[0] for c in acq.wait_for_display_frame.call_args_list] == [-1, 0]
+    assert all(
+        c.kwargs["timeout"] == 1.0 for c in acq.wait_for_display_frame.call_args_list
+    )
+    feed_generator.close()
 
 
 def test_get_processed_camera_feed_waits_for_frame(mock_active_threads):
     """
     Test the processed feed generator when it has to wait for a frame.
-    This ensures the time.sleep line is covered.
+    The generator blocks on the thread's frame notification instead of polling.
     """
-    pipeline_id = 101
-    # The thread is alive for two loops, then dies.
-    mock_active_threads["proc"].is_alive.side_effect = [True, True, False]
+    proc = mock_active_threads["proc"]
+    proc.latest_processed_frame_raw = None
 
-    # The frame is not available on the first loop (latest_processed_frame_raw is None).
-    mock_active_threads["proc"].latest_processed_frame_raw = None
+    def wait_for_processed_frame(last_seq, timeout=None):
+        if last_seq < 0:
+            # Sequence 0 has no frame yet; publish one for the next wait
+            return 0
+        proc.latest_processed_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
+        return last_seq + 1
 
-    feed_generator = camera_stream.get_processed_camera_feed(pipeline_id)
+    proc.wait_for_processed_frame.side_effect = wait_for_processed_frame
 
+    feed_generator = camera_stream.get_processed_camera_feed(101)
     with patch("time.sleep") as mock_sleep:
-        # This side effect runs when time.sleep is called after the first empty loop.
-        def make_frame_available(duration):
-            # Set a new raw processed frame (numpy array) that will be encoded
-            mock_active_threads["proc"].latest_processed_frame_raw = np.zeros(
-                (10, 10, 3), dtype=np.uint8
-            )
-
-        mock_sleep.side_effect = make_frame_available
-
-        # The generator should loop once, find no frame, sleep (and trigger the side effect),
-        # then loop again, find the new frame, and yield it.
         frame = next(feed_generator)
 
-        assert b"--frame" in frame
-        mock_sleep.assert_called_once_with(0.001)
+    assert b"--frame" in frame
+    mock_sleep.assert_not_called()
+    assert [c.args[0] for c in proc.wait_for_processed_frame.call_args_list] == [-1, 0]
+    feed_generator.close()
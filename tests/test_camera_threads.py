@@ -1,6 +1,8 @@
 import pytest
+import itertools
 import numpy as np
 import queue
+import threading
 import time
 from unittest.mock import MagicMock, patch
 import cv2
@@ -9,7 +11,9 @@ import json
 
 from app.camera_threads import (
     RefCountedFrame,
+    RefCountedFramePool,
     FrameBufferPool,
+    FrameQueue,
     VisionProcessingThread,
     CameraAcquisitionThread,
 )
@@ -86,7 +90,7 @@ def test_ref_counted_frame_get_writable_copy():
 def test_frame_buffer_pool_initialization():
     """Verify that the pool is empty upon creation."""
     pool = FrameBufferPool()
-    assert pool._pool.empty()
+    assert not pool._pool
     assert pool._buffer_shape is None
     assert pool._allocated == 0
 
@@ -97,23 +101,71 @@ def test_frame_buffer_pool_initialize():
     sample_frame = np.zeros((480, 640, 3), dtype=np.uint8)
     pool.initialize(sample_frame, num_buffers=5)
 
-    assert pool._pool.qsize() == 5
+    assert len(pool._pool) == 5
     assert pool._allocated == 5
     assert pool._buffer_shape == sample_frame.shape
     assert pool._buffer_dtype == sample_frame.dtype
 
 
+def test_frame_buffer_pool_initialize_presizes_working_set():
+    """Pre-sizing above initial_buffers raises the shrink floor, capped at max_buffers."""
+    pool = FrameBufferPool(max_buffers=10, initial_buffers=5)
+    pool.initialize(np.zeros((4, 4), dtype=np.uint8), num_buffers=8)
+    assert pool._allocated == 8
+    assert pool._initial_buffers == 8
+
+    pool.initialize(np.zeros((8, 8), dtype=np.uint8), num_buffers=25)
+    assert pool._allocated == 10
+
+
+def test_frame_buffer_pool_counts_drops_at_limit_and_rate_limits_log():
+    """At max_buffers the pool refuses to allocate and logs at most once a second."""
+    pool = FrameBufferPool(max_buffers=1, initial_buffers=1)
+    pool.initialize(np.zeros((4, 4), dtype=np.uint8), num_buffers=1)
+    assert pool.get_buffer() is not None
+
+    with patch("builtins.print") as mock_print:
+        assert pool.get_buffer() is None
+        assert pool.get_buffer() is None
+
+    assert pool._allocated == 1
+    assert pool.exhausted_count == 2
+    mock_print.assert_called_once()
+
+
+def test_frame_buffer_pool_release_depth_buffer():
+    """Depth buffers released on their own go back to the depth pool."""
+    pool = FrameBufferPool(enable_depth=True)
+    pool.initialize(
+        np.zeros((4, 4, 3), dtype=np.uint8),
+        num_buffers=1,
+        depth_frame=np.zeros((4, 4), dtype=np.uint16),
+    )
+    color, depth = pool.get_buffer()
+    frame = RefCountedFrame(
+        color,
+        pool.release_buffer,
+        depth_buffer=depth,
+        depth_release_callback=pool.release_depth_buffer,
+    )
+    frame.acquire()
+    frame.release()
+
+    assert len(pool._pool) == 1
+    assert len(pool._depth_pool) == 1
+
+
 def test_frame_buffer_pool_initialize_reinitializes_on_shape_change():
     """Test that the pool is re-created if a frame with a different shape is provided."""
     pool = FrameBufferPool()
     # Initial setup
     pool.initialize(np.zeros((10, 10)), num_buffers=3)
-    assert pool._pool.qsize() == 3
+    assert len(pool._pool) == 3
     assert pool._buffer_shape == (10, 10)
 
     # Re-initialize with a different shape
     pool.initialize(np.zeros((20, 20)), num_buffers=5)
-    assert pool._pool.qsize() == 5
+    assert len(pool._pool) == 5
     assert pool._buffer_shape == (20, 20)
     assert pool._allocated == 5  # Should be reset
 
@@ -126,7 +178,7 @@ def test_frame_buffer_pool_initialize_does_not_reinitialize_on_same_shape():
 
     # Calling initialize again with the same shape should do nothing
     pool.initialize(np.zeros((10, 10)), num_buffers=3)
-    assert pool._pool.qsize() == 2  # Should not have been reset to 3
+    assert len(pool._pool) == 2  # Should not have been reset to 3
     assert pool._allocated == 3
 
 
@@ -137,7 +189,7 @@ def test_frame_buffer_pool_get_buffer_from_pool():
     pool.initialize(sample_frame, num_buffers=1)
 
     buffer = pool.get_buffer()
-    assert pool._pool.empty()
+    assert not pool._pool
     assert buffer.shape == sample_frame.shape
     assert buffer.dtype == sample_frame.dtype
 
@@ -150,7 +202,7 @@ def test_frame_buffer_pool_get_buffer_allocates_new():
 
     # Empty the pool
     _ = pool.get_buffer()
-    assert pool._pool.empty()
+    assert not pool._pool
 
     # Get another one, which should be newly allocated
     new_buffer = pool.get_buffer()
@@ -172,11 +224,11 @@ def test_frame_buffer_pool_release_buffer():
 
     # Empty the pool
     buffer = pool.get_buffer()
-    assert pool._pool.empty()
+    assert not pool._pool
 
     # Return it
     pool.release_buffer(buffer)
-    assert pool._pool.qsize() == 1
+    assert len(pool._pool) == 1
 
 
 def test_frame_buffer_pool_shrinking_on_idle():
@@ -203,7 +255,7 @@ def test_frame_buffer_pool_shrinking_on_idle():
         pool.release_buffer(buffer)
 
     # Pool should be full now
-    assert pool._pool.qsize() == 9
+    assert len(pool._pool) == 9
 
     # Wait for idle timeout
     time.sleep(1.1)
@@ -215,7 +267,7 @@ def test_frame_buffer_pool_shrinking_on_idle():
 
     # Pool should have shrunk back to initial_buffers
     assert pool._allocated == 5
-    assert pool._pool.qsize() == 5
+    assert len(pool._pool) == 5
 
 
 def test_frame_buffer_pool_no_shrink_below_high_water_mark():
@@ -376,7 +428,7 @@ def test_frame_buffer_pool_initialize_default_initial_buffers():
 
     # Should use initial_buffers
     assert pool._allocated == 7
-    assert pool._pool.qsize() == 7
+    assert len(pool._pool) == 7
 
 
 # --- Mocks and Fixtures for Thread Tests ---
@@ -443,6 +495,93 @@ def mock_pipeline(mock_app):
     return pipeline
 
 
+def test_ref_counted_frame_pool_recycles_released_wrappers():
+    """A fully released wrapper is handed out again around the next buffer."""
+    pool = RefCountedFramePool()
+    release_a, release_b = MagicMock(), MagicMock()
+    buf_a, buf_b = np.zeros(1), np.ones(1)
+
+    first = pool.wrap(buf_a, release_a)
+    first.acquire()
+    first.mark_enqueued(1, 5.0)
+    assert pool.wrap(buf_b, release_b) is not first  # still in use
+
+    first.release()
+    release_a.assert_called_once_with(buf_a)
+    assert not first.try_acquire()
+
+    second = pool.wrap(buf_b, release_b)
+    assert second is first
+    assert second.data is buf_b
+    assert second._ref_count == 0
+    assert second.pop_enqueue_timestamp(1) is None
+    second.acquire()
+    second.release()
+    release_b.assert_called_once_with(buf_b)
+    release_a.assert_called_once()
+
+
+# --- Tests for FrameQueue ---
+
+
+def test_frame_queue_put_latest_evicts_oldest_when_full():
+    """put_latest swaps the oldest item for the new one under one lock."""
+    q = FrameQueue(maxsize=2)
+    assert q.put_latest("a") is None
+    assert q.put_latest("b") is None
+    assert q.put_latest("c") == "a"
+    assert q.qsize() == 2
+    assert q.get_nowait() == "b"
+    assert q.get_nowait() == "c"
+
+
+def test_frame_queue_drain_returns_oldest_items():
+    """drain removes up to max_items in FIFO order and frees space for producers."""
+    q = FrameQueue(maxsize=3)
+    for item in ("a", "b", "c"):
+        q.put_nowait(item)
+
+    assert q.drain(2) == ["a", "b"]
+    assert q.drain() == ["c"]
+    assert q.drain(2) == []
+    q.put_nowait("d")  # Room again after draining
+    assert q.get_nowait() == "d"
+
+
+def test_frame_queue_get_with_depth():
+    """get_with_depth pops the oldest item and reports what is left."""
+    q = FrameQueue(maxsize=2)
+    q.put_nowait("a")
+    q.put_nowait("b")
+
+    assert q.get_with_depth(timeout=1) == ("a", 1)
+    assert q.get_with_depth() == ("b", 0)
+    with pytest.raises(queue.Empty):
+        q.get_with_depth(timeout=0.01)
+
+
+def test_acquisition_loop_replaces_oldest_frame_in_frame_queue(mock_driver):
+    """A full FrameQueue keeps the newest frame and releases the evicted one."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.driver = mock_driver
+    stale = MagicMock()
+    frame_queue = FrameQueue(maxsize=1)
+    frame_queue.put_nowait(stale)
+    thread.add_pipeline_queue(1, frame_queue)
+
+    with patch("app.camera_threads.metrics_registry") as mock_metrics:
+        thread._acquisition_loop()
+
+    stale.release.assert_called_once()
+    # Six frames went through a queue of one, so every enqueue evicted one
+    assert mock_metrics.record_drop.call_count == 6
+    newest = frame_queue.get_nowait()
+    assert isinstance(newest, RefCountedFrame)
+    assert frame_queue.empty()
+
+
 # --- Tests for VisionProcessingThread ---
 
 
@@ -578,8 +717,9 @@ def test_vision_processing_thread_run_loop(
     mock_rc_frame = MagicMock(spec=RefCountedFrame)
     mock_rc_frame.data = frame_data
 
-    # Put frame in queue and start thread
+    # Put frame in queue and start thread with a processed feed client attached
     frame_queue.put(mock_rc_frame)
+    thread.add_viewer()
     thread.start()
     time.sleep(0.2)  # Allow thread to process
 
@@ -607,6 +747,115 @@ def test_vision_processing_thread_run_loop(
     assert not thread.is_alive()
 
 
+def test_ref_counted_frame_acquire_n():
+    """acquire_n reserves several references that are released one by one."""
+    release_callback = MagicMock()
+    rc_frame = RefCountedFrame(np.zeros((4, 4), dtype=np.uint8), release_callback)
+    rc_frame.acquire_n(3)
+    assert rc_frame._ref_count == 3
+    for _ in range(3):
+        rc_frame.release()
+    release_callback.assert_called_once()
+
+
+def test_ref_counted_frame_try_acquire():
+    """try_acquire only succeeds while the frame is still referenced."""
+    release_callback = MagicMock()
+    frame = RefCountedFrame(np.zeros((2, 2), dtype=np.uint8), release_callback)
+
+    frame.acquire()
+    assert frame.try_acquire() is True
+    frame.release()
+    frame.release()
+    release_callback.assert_called_once()
+
+    # Once returned to the pool the frame can no longer be picked up
+    assert frame.try_acquire() is False
+    frame.release()
+    release_callback.assert_called_once()
+
+
+def test_get_processed_frame_downscales_to_display_width(mock_camera, mock_pipeline):
+    """Processed frames wider than display_width are resized before encoding."""
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=queue.Queue(),
+        display_width=64,
+    )
+    thread.latest_processed_frame_raw = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    encoded = thread.get_processed_frame()
+    decoded = cv2.imdecode(np.frombuffer(encoded, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape[:2] == (48, 64)
+
+    # The resize buffer is reused while the source shape is unchanged
+    resize_buf = thread._resize_buf
+    thread.get_processed_frame()
+    assert thread._resize_buf is resize_buf
+
+    # Frames already narrower than the target are encoded as-is
+    thread.latest_processed_frame_raw = np.zeros((30, 40, 3), dtype=np.uint8)
+    encoded = thread.get_processed_frame()
+    decoded = cv2.imdecode(np.frombuffer(encoded, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape[:2] == (30, 40)
+
+
+def test_get_processed_frame_shares_encode_until_next_frame(mock_camera, mock_pipeline):
+    """Repeated requests for the same processed frame return the cached JPEG."""
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=queue.Queue(),
+    )
+    thread.latest_processed_frame_raw = np.zeros((16, 16, 3), dtype=np.uint8)
+    thread.processed_frame_seq = 1
+
+    with patch.object(
+        thread._jpeg_encoder, "encode", wraps=thread._jpeg_encoder.encode
+    ) as mock_encode:
+        first = thread.get_processed_frame()
+        second = thread.get_processed_frame()
+        assert first is second
+        assert mock_encode.call_count == 1
+
+        thread.processed_frame_seq = 2
+        thread.get_processed_frame()
+        assert mock_encode.call_count == 2
+
+
+def test_wait_for_processed_frame_wakes_on_publish(mock_camera, mock_pipeline):
+    """Processed feed clients block until a newer frame is published."""
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=queue.Queue(),
+    )
+    assert thread.wait_for_processed_frame(0, timeout=0.01) == 0
+
+    def publish():
+        with thread.processed_frame_lock:
+            thread.processed_frame_seq += 1
+            thread._processed_cond.notify_all()
+
+    publisher = threading.Timer(0.05, publish)
+    publisher.start()
+    assert thread.wait_for_processed_frame(0, timeout=2.0) == 1
+    publisher.join()
+
+
 def test_vision_processing_thread_run_loop_empty_queue(mock_camera, mock_pipeline):
     """Test that the run loop handles an empty queue without crashing."""
     frame_queue = queue.Queue()
@@ -752,6 +1001,173 @@ def test_vision_processing_thread_run_loop_coloured_shape_pipeline(
     thread.join()
 
 
+def test_vision_processing_thread_single_slot_queue_does_not_warn(
+    mock_camera, mock_pipeline, mock_pipeline_instances
+):
+    """Draining a one-slot queue leaves it empty, so no saturation warning is logged."""
+    mock_pipeline.pipeline_type = "Coloured Shape"
+    frame_queue = FrameQueue(maxsize=1)
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=frame_queue,
+    )
+
+    mock_rc_frame = MagicMock(spec=RefCountedFrame)
+    mock_rc_frame.data = np.zeros((20, 20, 3), dtype=np.uint8)
+    mock_rc_frame.pop_enqueue_timestamp.return_value = None
+    mock_rc_frame.created_timestamp = None
+    frame_queue.put(mock_rc_frame)
+
+    with patch("app.camera_threads.logger") as mock_logger, patch.object(
+        thread, "_log_latency_if_needed", wraps=thread._log_latency_if_needed
+    ) as mock_log_check:
+        thread.start()
+        deadline = time.time() + 2.0
+        while not mock_rc_frame.release.called and time.time() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+        thread.join()
+
+    assert mock_log_check.call_args.kwargs["queue_util_pct"] == 0.0
+    mock_logger.warning.assert_not_called()
+
+
+def test_vision_processing_thread_skips_annotation_without_viewers(
+    mock_camera, mock_pipeline, mock_pipeline_instances
+):
+    """Without processed feed clients, results are published but no frame is annotated."""
+    mock_pipeline.pipeline_type = "Coloured Shape"
+    frame_queue = queue.Queue()
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=frame_queue,
+    )
+
+    mock_rc_frame = MagicMock(spec=RefCountedFrame)
+    mock_rc_frame.data = np.zeros((20, 20, 3), dtype=np.uint8)
+    frame_queue.put(mock_rc_frame)
+
+    with patch.object(thread, "_next_annotation_buffer") as mock_annotate:
+        thread.start()
+        deadline = time.time() + 2.0
+        while not mock_rc_frame.release.called and time.time() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+        thread.join()
+
+    mock_annotate.assert_not_called()
+    assert thread.get_latest_results()["detections"] == "coloured_shape_data"
+    assert thread.processed_frame_seq == 0
+    assert thread.get_processed_frame() is None
+
+
+def test_vision_processing_thread_reuses_two_annotation_buffers(
+    mock_camera, mock_pipeline, mock_pipeline_instances
+):
+    """Annotated frames alternate between two buffers instead of a copy per frame."""
+    mock_pipeline.pipeline_type = "Coloured Shape"
+    frame_queue = queue.Queue()
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=frame_queue,
+    )
+
+    for value in (1, 2, 3):
+        mock_rc_frame = MagicMock(spec=RefCountedFrame)
+        mock_rc_frame.data = np.full((20, 20, 3), value, dtype=np.uint8)
+        frame_queue.put(mock_rc_frame)
+
+    thread.add_viewer()
+    thread.start()
+    deadline = time.time() + 2.0
+    while thread.processed_frame_seq < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    thread.stop()
+    thread.join()
+
+    first, second = thread._annotated_bufs
+    assert first is not None and second is not None and first is not second
+    # The third frame reused the first buffer; the second frame is left intact
+    assert thread.latest_processed_frame_raw is first
+    assert np.all(first == 3)
+    assert np.all(second == 2)
+
+
+def test_annotation_buffer_expands_mono_frames(mock_camera, mock_pipeline):
+    """Single-channel frames are drawn on in BGR so overlays keep their colour."""
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=queue.Queue(),
+    )
+    mono = np.full((8, 8), 7, dtype=np.uint8)
+
+    buf = thread._next_annotation_buffer(mono)
+
+    assert buf.shape == (8, 8, 3)
+    assert np.all(buf == 7)
+
+
+def test_vision_processing_thread_reads_depth_from_frame_queue(
+    mock_camera, mock_pipeline, mock_pipeline_instances
+):
+    """With a FrameQueue the post-pop depth comes from the same locked get."""
+    mock_pipeline.pipeline_type = "Coloured Shape"
+    frame_queue = FrameQueue(maxsize=2)
+    thread = VisionProcessingThread(
+        identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        pipeline_type=mock_pipeline.pipeline_type,
+        pipeline_config_json=mock_pipeline.config,
+        camera_matrix_json=mock_camera.camera_matrix_json,
+        dist_coeffs_json=mock_camera.dist_coeffs_json,
+        frame_queue=frame_queue,
+    )
+    mock_rc_frame = MagicMock(spec=RefCountedFrame)
+    mock_rc_frame.data = np.zeros((20, 20, 3), dtype=np.uint8)
+    frame_queue.put(mock_rc_frame)
+
+    with (
+        patch("app.camera_threads.metrics_registry") as mock_metrics,
+        patch.object(frame_queue, "qsize", wraps=frame_queue.qsize) as mock_qsize,
+    ):
+        mock_metrics.latency_warn_ms = 0.0
+        mock_metrics.queue_high_utilization_pct = 0.0
+        thread.start()
+        deadline = time.time() + 2.0
+        while thread.processed_frame_seq < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        thread.stop()
+        thread.join()
+
+    mock_qsize.assert_not_called()
+    mock_metrics.record_queue_depth.assert_called_once_with(
+        camera_identifier=mock_camera.identifier,
+        pipeline_id=mock_pipeline.id,
+        queue_size=0,
+        queue_max_size=2,
+    )
+
+
 def test_vision_processing_thread_run_exits_if_no_pipeline(mock_camera, mock_pipeline):
     """Test that the run method exits immediately if the pipeline instance is None."""
     mock_pipeline.pipeline_type = "Invalid"
@@ -845,6 +1261,10 @@ def mock_driver():
     # (1 for pool init + 6 for loop iterations where 6th triggers FPS calc + 1 None to break)
     frames = [np.zeros((10, 10, 3), dtype=np.uint8) for _ in range(7)] + [None]
     driver.get_frame.side_effect = frames
+    # Exercise the pooled copy path by default
+    driver.supports_borrowed_frames.return_value = False
+    # Frames skipped without consumers come from the same sequence
+    driver.skip_frame.side_effect = lambda: driver.get_frame() is not None
     return driver
 
 
@@ -869,6 +1289,28 @@ def test_camera_acquisition_thread_init(mock_camera, mock_app):
     assert not thread.stop_event.is_set()
 
 
+def test_drain_processing_queues_does_not_take_queues_lock(mock_camera, mock_app):
+    """Draining on pool exhaustion releases queued frames from the snapshot."""
+    thread = CameraAcquisitionThread(
+        identifier=mock_camera.identifier,
+        camera_type=mock_camera.camera_type,
+        orientation=mock_camera.orientation,
+        app=mock_app,
+    )
+    q = FrameQueue(maxsize=2)
+    thread.add_pipeline_queue(1, q)
+    frames = [MagicMock(), MagicMock()]
+    for frame in frames:
+        q.put_nowait(frame)
+
+    with thread.queues_lock:
+        thread._drain_processing_queues()
+
+    assert q.empty()
+    for frame in frames:
+        frame.release.assert_called_once()
+
+
 def test_camera_acquisition_thread_add_remove_queues(mock_camera, mock_app):
     """Test adding and removing pipeline queues."""
     thread = CameraAcquisitionThread(
@@ -883,10 +1325,20 @@ def test_camera_acquisition_thread_add_remove_queues(mock_camera, mock_app):
     thread.add_pipeline_queue(101, q1)
     assert 101 in thread.processing_queues
     assert thread.processing_queues[101] == q1
+    assert thread._queue_targets == ((101, q1, 0, thread._drop_states[101], True),)
+
+    # Unknown queue types keep their qsize() results coerced
+    q2 = MagicMock(spec=queue.Queue)
+    q2.maxsize = 2
+    thread.add_pipeline_queue(102, q2)
+    assert thread._queue_targets[1] == (102, q2, 2, thread._drop_states[102], False)
+    thread.remove_pipeline_queue(102)
 
     # Remove the queue
     thread.remove_pipeline_queue(101)
     assert 101 not in thread.processing_queues
+    assert thread._queue_targets == ()
+    assert 101 not in thread._drop_states
 
 
 @patch("app.camera_threads.get_driver")
@@ -971,30 +1423,17 @@ def test_acquisition_loop(mock_get_driver, mock_driver, mock_camera, mock_app):
     # Add a consumer queue and mock its put method to check calls
     proc_q = MagicMock(spec=queue.Queue)
     thread.add_pipeline_queue(101, proc_q)
+    # A connected stream client makes the loop prepare display frames
+    thread.add_viewer()
 
     # Manually call the loop, mocking time to ensure FPS gets calculated
     # Provide time values that create elapsed_time >= 1.0 to trigger FPS calculation
-    # FPS is calculated when elapsed_time >= 1.0, so we need start_time=0, then times that eventually exceed 1.0
+    # FPS is calculated once a full second has elapsed, so start at 0 and eventually exceed 1s
     time_side_effects = [
-        0,
-        0.1,
-        0.2,
-        0.3,
-        0.4,
-        0.5,
-        1.1,
-        1.2,
-        1.3,
-        1.4,
-        1.5,
-        1.6,
-        1.7,
-        1.8,
-        1.9,
-        2.0,
-        2.1,
+        int(t * 1e9)
+        for t in (0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7)
     ]
-    with patch("time.time", side_effect=time_side_effects):
+    with patch("time.monotonic_ns", side_effect=time_side_effects):
         thread._acquisition_loop()
 
     # get_frame was called 8 times (1 for init + 6 good frames + 1 None which breaks the loop)
@@ -1004,9 +1443,8 @@ def test_acquisition_loop(mock_get_driver, mock_driver, mock_camera, mock_app):
     assert proc_q.put_nowait.call_count == 6
 
     # Check latest frames
-    with thread.raw_frame_lock:
-        # Raw frame caching is disabled without an active calibration session
-        assert thread.latest_raw_frame is None
+    # Raw frame caching is disabled without an active calibration session
+    assert thread.latest_raw_frame is None
     with thread.frame_lock:
         assert thread.latest_display_frame_raw is not None
 
@@ -1019,6 +1457,70 @@ def test_acquisition_loop(mock_get_driver, mock_driver, mock_camera, mock_app):
     assert thread.fps > 0
 
 
+def test_acquisition_loop_uses_borrowed_frames_without_copy(mock_app):
+    """At 0 degrees, borrowed driver frames are queued as-is and released to the driver."""
+    frames = [np.zeros((10, 10, 3), dtype=np.uint8) for _ in range(3)]
+    release_fn = MagicMock()
+    driver = MagicMock()
+    driver.supports_borrowed_frames.return_value = True
+    driver.get_frame.return_value = frames[0]
+    driver.get_frame_borrowed.side_effect = [
+        (frames[1], release_fn),
+        (frames[2], release_fn),
+        (None, None),
+    ]
+
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=mock_app
+    )
+    thread.driver = driver
+    proc_q = queue.Queue(maxsize=2)
+    thread.add_pipeline_queue(101, proc_q)
+    thread.add_viewer()
+
+    with patch.object(thread.buffer_pool, "get_buffer") as mock_get_buffer:
+        thread._acquisition_loop()
+        mock_get_buffer.assert_not_called()
+
+    queued = [proc_q.get_nowait(), proc_q.get_nowait()]
+    assert queued[0].data is frames[1]
+    assert queued[1].data is frames[2]
+
+    # Frames still held by the pipeline queue are not handed back to the driver
+    release_fn.assert_not_called()
+    queued[0].release()
+    queued[1].release()
+    assert release_fn.call_count == 1  # the newest frame is still the display frame
+    thread._display_ref.release()
+    assert release_fn.call_count == 2
+
+
+def test_acquisition_loop_flips_borrowed_frames_in_place_at_180(mock_app):
+    """At 180 degrees, borrowed frames are rotated in place instead of copied."""
+    first = np.zeros((4, 6, 3), dtype=np.uint8)
+    frame = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+    expected = frame[::-1, ::-1].copy()
+    driver = MagicMock()
+    driver.supports_borrowed_frames.return_value = True
+    driver.get_frame.return_value = first
+    driver.get_frame_borrowed.side_effect = [(frame, None), (None, None)]
+
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=180, app=mock_app
+    )
+    thread.driver = driver
+    proc_q = queue.Queue(maxsize=2)
+    thread.add_pipeline_queue(101, proc_q)
+
+    with patch.object(thread.buffer_pool, "get_buffer") as mock_get_buffer:
+        thread._acquisition_loop()
+        mock_get_buffer.assert_not_called()
+
+    queued = proc_q.get_nowait()
+    assert queued.data is frame
+    np.testing.assert_array_equal(queued.data, expected)
+
+
 @patch("app.camera_threads.get_driver")
 def test_acquisition_loop_caches_raw_frame_when_session_active(
     mock_get_driver, mock_driver, mock_camera, mock_app
@@ -1044,35 +1546,42 @@ def test_acquisition_loop_caches_raw_frame_when_session_active(
     thread.add_pipeline_queue(101, proc_q)
 
     time_side_effects = [
-        0,
-        0.1,
-        0.2,
-        0.3,
-        0.4,
-        0.5,
-        1.1,
-        1.2,
-        1.3,
-        1.4,
-        1.5,
-        1.6,
-        1.7,
-        1.8,
-        1.9,
-        2.0,
-        2.1,
+        int(t * 1e9)
+        for t in (0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7)
     ]
-    with patch("time.time", side_effect=time_side_effects):
+    with patch("time.monotonic_ns", side_effect=time_side_effects):
         thread._acquisition_loop()
 
-    with thread.raw_frame_lock:
-        assert thread.latest_raw_frame is not None
-        thread.latest_raw_frame.release()
-        thread.latest_raw_frame = None
+    assert thread.latest_raw_frame is not None
+    thread.latest_raw_frame.release()
+    thread.latest_raw_frame = None
 
     mock_app.calibration_manager.end_session(mock_camera.id)
 
 
+def test_cache_raw_flag_follows_calibration_session(mock_camera, mock_app):
+    """The raw-frame cache flag tracks calibration sessions without polling."""
+    manager = mock_app.calibration_manager
+    thread = CameraAcquisitionThread(
+        identifier=mock_camera.identifier,
+        camera_type=mock_camera.camera_type,
+        orientation=mock_camera.orientation,
+        app=mock_app,
+        camera_id=mock_camera.id,
+    )
+    assert thread._cache_raw_flag is False
+
+    manager.start_session(
+        mock_camera.id, "Chessboard", {"rows": 7, "cols": 9, "square_size": 0.025}
+    )
+    assert thread._cache_raw_flag is True
+
+    manager.end_session(mock_camera.id)
+    assert thread._cache_raw_flag is False
+
+    manager.unregister_listener(mock_camera.id, thread._on_calibration_session_change)
+
+
 def test_acquisition_loop_fails_first_frame():
     """Test that the acquisition loop exits if the first frame cannot be retrieved."""
     # Create a fresh driver mock for this specific test
@@ -1130,6 +1639,43 @@ def test_apply_orientation_none():
         assert np.array_equal(result, frame)
 
 
+@pytest.mark.parametrize("orientation, k", [(0, 0), (90, -1), (180, 2), (270, 1)])
+def test_apply_orientation_into_dst(orientation, k):
+    """Rotating into a pooled buffer writes the result in place."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    frame = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+    expected = np.ascontiguousarray(np.rot90(frame, k))
+    dst = np.empty_like(expected)
+
+    result = thread._apply_orientation(frame, orientation, dst=dst)
+
+    assert result is dst
+    assert np.array_equal(dst, expected)
+
+    # The OpenCL (T-API) path produces the same pixels in the same buffer
+    thread._use_ocl = True
+    dst_ocl = np.empty_like(expected)
+    assert thread._apply_orientation(frame, orientation, dst=dst_ocl) is dst_ocl
+    assert np.array_equal(dst_ocl, expected)
+
+
+def test_opencl_path_is_opt_in(mock_app):
+    """The T-API path stays off unless OPENCV_USE_OPENCL is set, even with OpenCL present."""
+    with patch("app.camera_threads._has_opencl", return_value=True):
+        default = CameraAcquisitionThread(
+            identifier="test", camera_type="USB", orientation=0, app=mock_app
+        )
+        with patch.dict(mock_app.config, {"OPENCV_USE_OPENCL": True}):
+            enabled = CameraAcquisitionThread(
+                identifier="test", camera_type="USB", orientation=0, app=mock_app
+            )
+
+    assert not default._use_ocl
+    assert enabled._use_ocl
+
+
 @patch("app.camera_threads.get_driver")
 def test_acquisition_loop_orientation_change(
     mock_get_driver, mock_driver, mock_camera, mock_app
@@ -1163,8 +1709,8 @@ def test_acquisition_loop_orientation_change(
         mock_driver.get_frame.side_effect = get_frame_side_effect
 
         # Provide time values to prevent StopIteration
-        time_side_effects = [0] + [0.1 * i for i in range(1, 20)]
-        with patch("time.time", side_effect=time_side_effects):
+        time_side_effects = [int(0.1e9 * i) for i in range(20)]
+        with patch("time.monotonic_ns", side_effect=time_side_effects):
             thread._acquisition_loop()
 
         # The pool should be initialized once at the start, and once after the config change
@@ -1205,6 +1751,25 @@ def test_acquisition_loop_handles_full_queue(mock_driver):
     assert release_count[0] > 0, "Buffers should be released when all queues are full"
 
 
+def test_acquisition_loop_releases_evicted_frame_after_refill(mock_driver):
+    """On a full queue the evicted frame is released only after the new one is queued."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.driver = mock_driver
+    frame_queue = queue.Queue(maxsize=1)
+    stale = MagicMock()
+    queued_at_release = []
+    stale.release.side_effect = lambda: queued_at_release.append(frame_queue.qsize())
+    frame_queue.put_nowait(stale)
+    thread.add_pipeline_queue(1, frame_queue)
+
+    thread._acquisition_loop()
+
+    stale.release.assert_called_once()
+    assert queued_at_release == [1]
+
+
 def test_acquisition_loop_reference_counting_correctness():
     """Test that reference counting is correct in all frame distribution scenarios."""
     # Create a driver that returns 3 frames then None
@@ -1230,18 +1795,24 @@ def test_acquisition_loop_reference_counting_correctness():
     acquire_calls = [0]
     release_calls = [0]
     original_acquire = RefCountedFrame.acquire
+    original_acquire_n = RefCountedFrame.acquire_n
     original_release = RefCountedFrame.release
 
     def tracked_acquire(self):
         acquire_calls[0] += 1
         return original_acquire(self)
 
+    def tracked_acquire_n(self, n):
+        acquire_calls[0] += n
+        return original_acquire_n(self, n)
+
     def tracked_release(self):
         release_calls[0] += 1
         return original_release(self)
 
     with (
         patch.object(RefCountedFrame, "acquire", tracked_acquire),
+        patch.object(RefCountedFrame, "acquire_n", tracked_acquire_n),
         patch.object(RefCountedFrame, "release", tracked_release),
     ):
         thread._acquisition_loop()
@@ -1278,6 +1849,8 @@ def test_acquisition_loop_empty_buffer_pool(mock_driver, mock_camera, mock_app):
     )
     thread.driver = mock_driver
     thread.buffer_pool.initialize(np.zeros((10, 10, 3), dtype=np.uint8))
+    # A consumer, so frames are taken through the pool rather than skipped
+    thread.add_pipeline_queue(1, FrameQueue(maxsize=1))
 
     # Temporarily make the pool return None
     with patch.object(thread.buffer_pool, "get_buffer", return_value=None):
@@ -1298,11 +1871,234 @@ def test_prepare_display_frame():
     thread.fps = 30.0
     frame = np.zeros((100, 100, 3), dtype=np.uint8)
 
+    expected = frame.copy()
+    cv2.putText(
+        expected, "FPS: 30.00", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2
+    )
+
     with patch("cv2.putText") as mock_put_text:
         processed_frame = thread._prepare_display_frame(frame)
-        mock_put_text.assert_called_once()
-        # Check that the text contains the FPS
-        text_arg = mock_put_text.call_args[0][1]
-        assert "FPS: 30.00" in text_arg
+        # Glyphs come from the pre-rendered atlas, not the text rasterizer
+        mock_put_text.assert_not_called()
         # Ensure the original frame is modified and returned
         assert id(processed_frame) == id(frame)
+    assert np.array_equal(frame, expected)
+
+
+def test_acquisition_loop_skips_display_frame_without_viewers(mock_driver):
+    """Without stream clients no display frame is prepared and none stays pinned."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.driver = mock_driver
+    stale_ref = MagicMock()
+    thread._display_ref = stale_ref
+    thread.latest_display_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    time_side_effects = [int(t * 1e9) for t in (0, 0.2, 0.4, 0.6, 0.8, 1.0, 1.2)]
+    with (
+        patch.object(thread, "_prepare_display_frame") as mock_prepare,
+        patch("time.monotonic_ns", side_effect=time_side_effects),
+    ):
+        thread._acquisition_loop()
+
+    mock_prepare.assert_not_called()
+    stale_ref.release.assert_called_once()
+    assert thread.latest_display_frame_raw is None
+    assert thread.display_frame_seq == 0
+    # FPS is still measured while nobody is watching
+    assert thread.fps > 0
+
+    thread.add_viewer()
+    thread.remove_viewer()
+    thread.remove_viewer()
+    assert thread._viewer_count == 0
+
+
+def test_acquisition_loop_skips_frames_without_consumers(mock_driver):
+    """With no pipelines, viewers or calibration, frames are dropped undecoded."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.driver = mock_driver
+
+    with (
+        patch.object(thread.buffer_pool, "get_buffer") as mock_get_buffer,
+        patch("time.monotonic_ns", side_effect=itertools.count(0, 200_000_000)),
+    ):
+        thread._acquisition_loop()
+
+    # One full frame sizes the pool; the rest are skipped until the stream ends
+    assert mock_driver.skip_frame.call_count == 7
+    mock_get_buffer.assert_not_called()
+    assert thread.fps > 0
+
+
+def test_acquisition_loop_rate_limits_display_frames(mock_driver):
+    """With display_max_fps set, only frames on the display cadence are published."""
+    thread = CameraAcquisitionThread(
+        identifier="test",
+        camera_type="USB",
+        orientation=0,
+        app=MagicMock(),
+        display_max_fps=10,
+    )
+    thread.driver = mock_driver
+    thread.add_viewer()
+
+    # Every clock read advances 20 ms: two reads per frame, so 40 ms per frame
+    with patch("time.monotonic_ns", side_effect=itertools.count(0, 20_000_000)):
+        thread._acquisition_loop()
+
+    # Six frames over ~240 ms at a 100 ms cadence
+    assert thread.display_frame_seq == 3
+    thread._clear_display_frame()
+
+
+def test_publish_display_frame_downscales_to_max_dim():
+    """Large frames are resized for display without pinning the pooled buffer."""
+    thread = CameraAcquisitionThread(
+        identifier="test",
+        camera_type="USB",
+        orientation=0,
+        app=MagicMock(),
+        display_max_dim=100,
+    )
+    frame = RefCountedFrame(np.zeros((150, 200, 3), dtype=np.uint8), MagicMock())
+    frame.acquire()
+
+    thread._publish_display_frame(frame)
+
+    display_buf = thread.latest_display_frame_raw
+    assert display_buf.shape == (75, 100, 3)
+    assert thread._display_ref is not frame
+    assert frame._ref_count == 1
+
+    # Once replaced, the display buffer is recycled for the next resize
+    thread._publish_display_frame(frame)
+    assert thread._display_buffers == [display_buf]
+    thread._publish_display_frame(frame)
+    assert thread.latest_display_frame_raw is display_buf
+
+    # Frames that already fit are published at full size
+    small = RefCountedFrame(np.zeros((60, 80, 3), dtype=np.uint8), MagicMock())
+    small.acquire()
+    thread._publish_display_frame(small)
+    assert thread.latest_display_frame_raw.shape == (60, 80, 3)
+
+
+def test_resize_display_frame_writes_recycled_buffer_with_opencl_enabled():
+    """Display resizes go straight into the recycled buffer, even with OpenCL enabled."""
+    thread = CameraAcquisitionThread(
+        identifier="test",
+        camera_type="USB",
+        orientation=0,
+        app=MagicMock(),
+        display_max_dim=100,
+    )
+    src = np.random.randint(0, 255, (150, 200, 3), dtype=np.uint8)
+    expected = cv2.resize(src, (100, 75), interpolation=cv2.INTER_AREA)
+
+    thread._use_ocl = True
+    buf = np.empty((75, 100, 3), dtype=np.uint8)
+    thread._display_buffers.append(buf)
+    with patch("app.camera_threads.cv2.UMat") as mock_umat:
+        result = thread._resize_display_frame(src, (100, 75))
+
+    mock_umat.assert_not_called()
+    assert result is buf
+    assert np.array_equal(result, expected)
+
+
+def test_wait_for_display_frame_wakes_on_publish():
+    """Stream clients block until a newer display frame is published."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    # Nothing new yet: the wait times out and reports the unchanged sequence
+    assert thread.wait_for_display_frame(0, timeout=0.01) == 0
+
+    frame = RefCountedFrame(np.zeros((10, 10, 3), dtype=np.uint8), MagicMock())
+    frame.acquire_n(3)  # Held by pipelines, so the display gets a copy
+    publisher = threading.Timer(0.05, thread._publish_display_frame, args=(frame,))
+    publisher.start()
+    assert thread.wait_for_display_frame(0, timeout=2.0) == 1
+    publisher.join()
+
+
+def test_get_display_frame_caches_jpeg_per_sequence():
+    """Repeated requests for the same display frame reuse one encode."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.latest_display_frame_raw = np.zeros((10, 10, 3), dtype=np.uint8)
+    thread.display_frame_seq = 1
+
+    with patch.object(
+        thread._jpeg_encoder, "encode", side_effect=[b"first", b"second"]
+    ) as mock_encode:
+        assert thread.get_display_frame() == b"first"
+        assert thread.get_display_frame() == b"first"
+        assert mock_encode.call_count == 1
+
+        # A new frame invalidates the cache
+        thread.display_frame_seq = 2
+        assert thread.get_display_frame() == b"second"
+        assert mock_encode.call_count == 2
+
+
+def test_prepare_display_frame_reuses_rendered_overlay():
+    """The composed FPS text is cached until the text changes and matches cv2.putText."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="USB", orientation=0, app=MagicMock()
+    )
+    thread.fps = 29.97
+    frame = np.random.default_rng(0).integers(0, 255, (120, 200, 3), dtype=np.uint8)
+    expected = frame.copy()
+    cv2.putText(
+        expected, "FPS: 29.97", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2
+    )
+
+    thread._prepare_display_frame(frame)
+    assert np.array_equal(frame, expected)
+
+    with patch.object(
+        CameraAcquisitionThread,
+        "_render_fps_overlay",
+        wraps=CameraAcquisitionThread._render_fps_overlay,
+    ) as mock_render:
+        thread._prepare_display_frame(np.zeros((120, 200, 3), dtype=np.uint8))
+        thread.fps = 29.971
+        thread._prepare_display_frame(np.zeros((120, 200, 3), dtype=np.uint8))
+        mock_render.assert_not_called()
+
+        # A sub-0.01 change that rounds to different text is redrawn
+        thread.fps = 29.975
+        mock_render.assert_called_once_with("29.98")
+        mock_render.reset_mock()
+
+        thread.fps = 120.45
+        frame = np.zeros((120, 200), dtype=np.uint8)
+        thread._prepare_display_frame(frame)
+        mock_render.assert_called_once()
+
+    expected = np.zeros((120, 200), dtype=np.uint8)
+    cv2.putText(
+        expected, "FPS: 120.45", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150,), 2
+    )
+    assert np.array_equal(frame, expected)
+
+
+def test_prepare_display_frame_draws_visible_text_on_gray_frames():
+    """Mono frames get the FPS text in the colour's luma rather than black."""
+    thread = CameraAcquisitionThread(
+        identifier="test", camera_type="GenICam", orientation=0, app=MagicMock()
+    )
+    thread.fps = 30.0
+    frame = np.full((100, 100), 128, dtype=np.uint8)
+
+    thread._prepare_display_frame(frame)
+
+    # Fully covered glyph pixels carry the luma of green, well above the background
+    assert frame.max() == 150
+    assert frame.min() >= 128
\ No newline at end of file
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 import sys
 import cv2
+import numpy as np
 from importlib import reload
 
 from app.models import Camera
@@ -144,6 +145,135 @@ def test_connection_and_frames(genicam_mocks, mock_camera_data):
     mock_ia.stop.assert_called_once()
 
 
+def test_get_frame_converts_after_releasing_buffer(genicam_mocks, mock_camera_data):
+    """The raw plane is copied out so demosaicing runs after the buffer is requeued."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver(mock_camera_data)
+    driver.ia = MagicMock()
+    events = []
+    raw = np.arange(16, dtype=np.uint8)
+    component = MagicMock(data=raw, width=4, height=4, data_format="BayerRG8")
+    fetch_ctx = driver.ia.fetch.return_value
+    fetch_ctx.__enter__.return_value.payload.components = [component]
+    fetch_ctx.__exit__.side_effect = lambda *args: events.append("requeued")
+
+    def fake_cvt(img, code, dst=None):
+        events.append("converted")
+        return np.zeros(img.shape + (3,), dtype=img.dtype)
+
+    with patch("cv2.cvtColor", side_effect=fake_cvt):
+        frame = driver.get_frame()
+
+    assert events == ["requeued", "converted"]
+    assert frame.shape == (4, 4, 3)
+
+
+def test_get_frame_borrowed_recycles_released_buffers(genicam_mocks, mock_camera_data):
+    """Borrowed frames are converted into buffers handed back through release.
+
+    The raw plane is copied into one reusable buffer as well.
+    """
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver(mock_camera_data)
+    driver.ia = MagicMock()
+    component = MagicMock(
+        data=np.zeros(16, dtype=np.uint8), width=4, height=4, data_format="BayerRG8"
+    )
+    driver.ia.fetch.return_value.__enter__.return_value.payload.components = [
+        component
+    ]
+
+    assert driver.supports_borrowed_frames()
+    first, release = driver.get_frame_borrowed()
+    assert first.shape == (4, 4, 3)
+    release(first)
+
+    raw_buf = driver._raw_buf
+    second, _ = driver.get_frame_borrowed()
+    assert second is first
+    assert driver._raw_buf is raw_buf
+
+    # A failed fetch keeps the free buffer for the next frame
+    release(second)
+    driver.ia.fetch.side_effect = RuntimeError("lost")
+    assert driver.get_frame_borrowed() == (None, None)
+    assert driver._free_buffers == [second]
+
+
+def test_mono_frames_stay_single_channel(genicam_mocks, mock_camera_data):
+    """Mono pixel formats are handed out without BGR expansion."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver(mock_camera_data)
+    driver.ia = MagicMock()
+    component = MagicMock(
+        data=np.arange(16, dtype=np.uint8), width=4, height=4, data_format="Mono8"
+    )
+    driver.ia.fetch.return_value.__enter__.return_value.payload.components = [
+        component
+    ]
+
+    first, release = driver.get_frame_borrowed()
+    assert first.shape == (4, 4)
+    assert first is not driver._raw_buf
+    release(first)
+
+    second, _ = driver.get_frame_borrowed()
+    assert second is first
+    assert np.array_equal(second, np.arange(16, dtype=np.uint8).reshape(4, 4))
+
+
+def test_raw_buffer_is_page_locked_for_cuda(genicam_mocks):
+    """With CUDA demosaicing the raw plane is staged in page-locked host memory."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver({"identifier": "SN1"})
+    driver._use_cuda = True
+    pinned = np.empty((4, 6), dtype=np.uint8)
+    host_mem = MagicMock()
+    host_mem.createMatHeader.return_value = pinned
+    plane = np.arange(24, dtype=np.uint8).reshape(4, 6)
+
+    with patch("cv2.cuda_HostMem", return_value=host_mem, create=True), patch(
+        "cv2.cuda.HostMem_PAGE_LOCKED", 1, create=True
+    ):
+        raw = driver._copy_raw_plane(plane)
+
+    assert raw is pinned
+    assert np.array_equal(raw, plane)
+    assert driver._raw_host_mem is host_mem
+
+
+def test_demosaic_code_follows_pixel_format(genicam_mocks):
+    """The Bayer pattern comes from the pixel format; edge-aware codes are opt-in."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver({"identifier": "SN1"})
+    assert driver._demosaic_code("BayerBG8") == cv2.COLOR_BayerBG2BGR
+    assert driver._demosaic_code("BayerGR12") == cv2.COLOR_BayerGR2BGR
+
+    hq_driver = GenICamDriver({"identifier": "SN2", "high_quality_demosaic": True})
+    assert hq_driver._demosaic_code("BayerRG8") == cv2.COLOR_BayerRG2BGR_EA
+    assert hq_driver._demosaic_code("BayerGB10") == cv2.COLOR_BayerGB2BGR_EA
+
+
+def test_cuda_demosaic_falls_back_to_cpu_on_failure(genicam_mocks):
+    """A failing CUDA demosaic disables the GPU path and converts on the CPU."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    driver = GenICamDriver({"identifier": "SN1"})
+    driver._use_cuda = True
+    img = np.zeros((4, 4), dtype=np.uint8)
+
+    with patch("cv2.cuda_GpuMat", side_effect=RuntimeError("no device"), create=True):
+        frame = driver._demosaic_cuda(img, cv2.COLOR_BayerRG2BGR)
+
+    assert frame.shape == (4, 4, 3)
+    assert driver._use_cuda is False
+
+
 def test_static_methods(genicam_mocks):
     """Tests the static methods like initialize and list_devices."""
     from app.drivers.genicam_driver import GenICamDriver
@@ -158,6 +288,26 @@ def test_static_methods(genicam_mocks):
     assert len(GenICamDriver.list_devices()) == 1
 
 
+def test_list_devices_shares_recent_enumeration(genicam_mocks):
+    """Calls within the TTL reuse one h.update(); invalidation forces a new one."""
+    from app.drivers import genicam_driver
+    from app.drivers.genicam_driver import GenICamDriver
+
+    mock_h = genicam_mocks["h"]
+    mock_h.device_info_list = [MagicMock(serial_number="SN123", model="TestModel")]
+
+    first = GenICamDriver.list_devices()
+    second = GenICamDriver.list_devices()
+
+    assert first == second
+    assert len(first) == 1
+    mock_h.update.assert_called_once()
+
+    genicam_driver._invalidate_device_list_cache()
+    GenICamDriver.list_devices()
+    assert mock_h.update.call_count == 2
+
+
 def test_node_map_and_update(genicam_mocks):
     """Tests the complex node map retrieval and update logic."""
     from app.drivers.genicam_driver import GenICamDriver
@@ -194,6 +344,192 @@ def test_node_map_and_update(genicam_mocks):
     mock_node.set_value.assert_called_once_with(42)
 
 
+def test_node_map_skips_reads_of_unreadable_nodes(genicam_mocks):
+    """Write-only nodes are listed without a device read; bad access modes are tolerated."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    mock_h = genicam_mocks["h"]
+    genapi = genicam_mocks["genapi"]
+
+    def bad_access_mode():
+        raise ValueError("unknown")
+
+    write_only = MagicMock(
+        node=MagicMock(
+            principal_interface_type=genapi.EInterfaceType.intfIInteger,
+            get_access_mode=lambda: "WO",
+            display_name="B",
+        )
+    )
+    broken = MagicMock(
+        node=MagicMock(
+            principal_interface_type=genapi.EInterfaceType.intfIFloat,
+            get_access_mode=bad_access_mode,
+            display_name="A",
+        )
+    )
+    mock_h.create.return_value.remote_device.node_map.nodes = [write_only, broken]
+
+    nodes, error = GenICamDriver.get_node_map("SN123")
+
+    assert error is None
+    assert [n["display_name"] for n in nodes] == ["A", "B"]
+    assert nodes[0]["access_mode"] == "None"
+    write_only.to_string.assert_not_called()
+    broken.to_string.assert_not_called()
+
+
+def test_node_map_is_cached_until_a_node_is_written(genicam_mocks):
+    """Repeated node map requests reuse the last build until a node is updated."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    mock_h = genicam_mocks["h"]
+    genapi = genicam_mocks["genapi"]
+    mock_ia = mock_h.create.return_value
+    mock_ia.remote_device.node_map.nodes = [
+        MagicMock(
+            node=MagicMock(
+                principal_interface_type=genapi.EInterfaceType.intfIInteger,
+                get_access_mode=lambda: "RW",
+                display_name="Gain",
+            )
+        )
+    ]
+
+    first, _ = GenICamDriver.get_node_map("SN123")
+    second, _ = GenICamDriver.get_node_map("SN123")
+    assert first == second and len(first) == 1
+    mock_h.create.assert_called_once()
+
+    mock_node = MockIInteger()
+    mock_node.get_access_mode.return_value = "RW"
+    mock_ia.remote_device.node_map.get_node.return_value = mock_node
+    mock_node.to_string.return_value = "2"
+    ok, _, _, updated = GenICamDriver.update_node("SN123", "Gain", "2")
+    assert ok and updated == {"name": "Gain", "value": "2"}
+    mock_ia.remote_device.node_map.get_node.assert_called_once_with("Gain")
+
+    mock_ia.remote_device.node_map.nodes = []
+    nodes, _ = GenICamDriver.get_node_map("SN123")
+    assert nodes == []
+
+
+def test_node_access_borrows_connected_acquirer(genicam_mocks, mock_camera_data):
+    """Node reads and writes reuse a connected driver's acquirer without destroying it."""
+    from app.drivers.genicam_driver import GenICamDriver
+
+    mock_h = genicam_mocks["h"]
+    live_ia = MagicMock()
+    mock_h.create.return_value = live_ia
+    driver = GenICamDriver(mock_camera_data)
+    driver.connect()
+    mock_h.create.reset_mock()
+
+    live_ia.remote_device.node_map.nodes = []
+    nodes, error = GenICamDriver.get_node_map("SN12345")
+    assert error is None and nodes == []
+
+    mock_node = MockIInteger()
+    mock_node.get_access_mode.return_value = "RW"
+    live_ia.remote_device.node_map.get_node.return_value = mock_node
+    success, _, status, _ = GenICamDriver.update_node("SN12345", "Gain", "3")
+    assert success is True and status == 200
+
+    mock_h.create.assert_not_called()
+    live_ia.destroy.assert_not_called()
+
+    driver.disconnect()
+    mock_h.create.return_value = MagicMock()
+    GenICamDriver.get_node_map("SN12345")
+    mock_h.create.assert_called_once()
+
+
+def test_temporary_acquirer_is_parked_and_reused(genicam_mocks, mock_camera_data):
+    """Node access on an idle camera reuses one acquirer, which connect() adopts."""
+    from app.drivers import genicam_driver
+    from app.drivers.genicam_driver import GenICamDriver
+
+    mock_h = genicam_mocks["h"]
+    temp_ia = MagicMock()
+    temp_ia.remote_device.node_map.nodes = []
+    mock_h.create.return_value = temp_ia
+
+    with patch("app.drivers.genicam_driver.threading.Timer") as mock_timer:
+        GenICamDriver.get_node_map("SN12345")
+        genicam_driver._invalidate_node_map_cache()
+        GenICamDriver.get_node_map("SN12345")
+
+    mock_h.create.assert_called_once()
+    temp_ia.destroy.assert_not_called()
+    mock_timer.return_value.start.assert_called_once()
+
+    # The camera starts streaming on the parked acquirer
+    driver = GenICamDriver(mock_camera_data)
+    driver.connect()
+    assert driver.ia is temp_ia
+    mock_h.create.assert_called_once()
+
+    # The pending sweep finds nothing parked and leaves the acquirer alone
+    with patch("app.drivers.genicam_driver.threading.Timer"):
+        genicam_driver._sweep_idle_acquirers()
+    temp_ia.destroy.assert_not_called()
+    assert genicam_driver._idle_sweeper is None
+
+
+def test_idle_acquirers_share_one_sweeper(genicam_mocks):
+    """Parked acquirers share one timer that destroys them once idle for the TTL."""
+    from app.drivers import genicam_driver
+    from app.drivers.genicam_driver import GenICamDriver, _IDLE_ACQUIRER_TTL_S
+
+    first_ia, second_ia = MagicMock(), MagicMock()
+    with patch("app.drivers.genicam_driver.threading.Timer") as mock_timer, patch(
+        "app.drivers.genicam_driver.time.monotonic", return_value=100.0
+    ):
+        GenICamDriver._release_image_acquirer("SN1", first_ia, borrowed=False)
+        GenICamDriver._release_image_acquirer("SN2", second_ia, borrowed=False)
+        # Many releases still arm a single timer
+        GenICamDriver._release_image_acquirer("SN1", MagicMock(), borrowed=False)
+    assert mock_timer.call_count == 1
+    assert mock_timer.call_args.args[0] == _IDLE_ACQUIRER_TTL_S
+
+    # SN2 was used again later, so only SN1 has expired when the sweep runs
+    genicam_driver._idle_acquirers["SN2"] = (second_ia, 130.0)
+    with patch("app.drivers.genicam_driver.threading.Timer") as mock_timer, patch(
+        "app.drivers.genicam_driver.time.monotonic",
+        return_value=100.0 + _IDLE_ACQUIRER_TTL_S,
+    ):
+        genicam_driver._sweep_idle_acquirers()
+    first_ia.destroy.assert_called_once()
+    second_ia.destroy.assert_not_called()
+    assert mock_timer.call_args.args[0] == 30.0
+
+    with patch("app.drivers.genicam_driver.threading.Timer") as mock_timer, patch(
+        "app.drivers.genicam_driver.time.monotonic",
+        return_value=130.0 + _IDLE_ACQUIRER_TTL_S,
+    ):
+        genicam_driver._sweep_idle_acquirers()
+    second_ia.destroy.assert_called_once()
+    mock_timer.assert_not_called()
+    assert not genicam_driver._idle_acquirers
+    assert genicam_driver._idle_sweeper is None
+
+
+def test_writable_access_is_converted_once_per_raw_mode(genicam_mocks):
+    """Each raw access mode goes through EAccessMode once; later checks hit the memo."""
+    from app.drivers import genicam_driver
+
+    with patch.object(
+        genicam_mocks["genapi"],
+        "EAccessMode",
+        MagicMock(side_effect=genicam_mocks["genapi"].EAccessMode),
+    ) as mock_access_mode:
+        assert genicam_driver._is_writable_access("RW")
+        assert genicam_driver._is_writable_access("RW")
+        assert not genicam_driver._is_writable_access("RO")
+
+    assert mock_access_mode.call_count == 2
+
+
 def test_full_coverage_of_all_branches(genicam_mocks, mock_camera_data):
     """A final test to hit all remaining uncovered branches."""
     from app.drivers.genicam_driver import GenICamDriver
@@ -253,6 +589,8 @@ def test_full_coverage_of_all_branches(genicam_mocks, mock_camera_data):
     mock_ia.remote_device.node_map.get_node.return_value = mock_bool_node
     GenICamDriver.update_node("id", "node", "true")
     mock_bool_node.set_value.assert_called_with(True)
+    GenICamDriver.update_node("id", "node", False)
+    mock_bool_node.set_value.assert_called_with(False)
 
     mock_h.create.side_effect = [mock_ia, mock_ia]
     mock_string_node = MockIString()
@@ -0,0 +1,113 @@
+import numpy as np
+import cv2
+from unittest.mock import MagicMock, patch
+
+from app import jpeg_encoder
+from app.jpeg_encoder import JpegEncoder
+
+
+def test_encode_falls_back_to_opencv_without_turbojpeg():
+    """Without libjpeg-turbo the encoder produces a decodable JPEG via OpenCV."""
+    with patch("app.jpeg_encoder._get_turbojpeg", return_value=None):
+        encoder = JpegEncoder()
+
+    frame = np.full((24, 32, 3), 128, dtype=np.uint8)
+    encoded = encoder.encode(frame, 85)
+
+    assert not encoder.uses_turbojpeg
+    assert isinstance(encoded, bytes)
+    decoded = cv2.imdecode(np.frombuffer(encoded, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == frame.shape
+
+
+def test_encode_with_turbojpeg_reuses_output_buffer():
+    """The TurboJPEG output buffer is sized once per frame shape and reused."""
+    turbo = MagicMock()
+    turbo.buffer_size.return_value = 64
+
+    def fake_encode(frame, quality, pixel_format, jpeg_subsample, dst):
+        dst[:4] = b"\xff\xd8\xff\xd9"
+        return dst, 4
+
+    turbo.encode.side_effect = fake_encode
+
+    with patch("app.jpeg_encoder._get_turbojpeg", return_value=turbo), patch.multiple(
+        jpeg_encoder,
+        TJPF_BGR=0,
+        TJPF_GRAY=1,
+        TJSAMP_422=2,
+        TJSAMP_GRAY=3,
+        create=True,
+    ):
+        encoder = JpegEncoder()
+        frame = np.zeros((10, 10, 3), dtype=np.uint8)
+        first = encoder.encode(frame, 80)
+        second = encoder.encode(frame, 80)
+
+    assert first == second == b"\xff\xd8\xff\xd9"
+    turbo.buffer_size.assert_called_once()
+    assert turbo.encode.call_count == 2
+    assert turbo.encode.call_args.kwargs["quality"] == 80
+
+
+def test_encode_turbojpeg_failure_falls_back_to_opencv():
+    """A failing TurboJPEG encode disables it and falls back to OpenCV."""
+    turbo = MagicMock()
+    turbo.buffer_size.side_effect = RuntimeError("boom")
+
+    with patch("app.jpeg_encoder._get_turbojpeg", return_value=turbo), patch.multiple(
+        jpeg_encoder,
+        TJPF_BGR=0,
+        TJPF_GRAY=1,
+        TJSAMP_422=2,
+        TJSAMP_GRAY=3,
+        create=True,
+    ):
+        encoder = JpegEncoder()
+        encoded = encoder.encode(np.zeros((8, 8, 3), dtype=np.uint8), 75)
+
+    assert encoded is not None
+    assert not encoder.uses_turbojpeg
+
+
+def test_encode_prefers_nvjpeg_for_colour_frames():
+    """NVJPEG handles colour frames; grayscale frames use the CPU encoders."""
+    nvjpeg = MagicMock()
+    nvjpeg.encode.return_value = b"\xff\xd8gpu\xff\xd9"
+
+    with patch(
+        "app.jpeg_encoder._create_nvjpeg", return_value=nvjpeg
+    ) as mock_create, patch("app.jpeg_encoder._get_turbojpeg", return_value=None):
+        encoder = JpegEncoder()
+
+        # The handle is only created once a colour frame is encoded
+        gray = encoder.encode(np.zeros((8, 8), dtype=np.uint8), 70)
+        mock_create.assert_not_called()
+        assert encoder.backend == "opencv"
+
+        colour = encoder.encode(np.zeros((8, 8, 3), dtype=np.uint8), 70)
+        encoder.encode(np.zeros((8, 8, 3), dtype=np.uint8), 70)
+
+    assert gray.startswith(b"\xff\xd8")
+    assert colour == b"\xff\xd8gpu\xff\xd9"
+    assert encoder.backend == "nvjpeg"
+    mock_create.assert_called_once()
+    assert nvjpeg.encode.call_count == 2
+
+
+def test_each_encoder_gets_its_own_nvjpeg_handle():
+    """NVJPEG handles are not shared, since each owns a CUDA stream and encoder state."""
+    with patch("app.jpeg_encoder.NvJpeg") as mock_nvjpeg_cls, patch(
+        "app.jpeg_encoder._has_nvidia_gpu", return_value=True
+    ), patch("app.jpeg_encoder._nvjpeg_failed", False):
+        mock_nvjpeg_cls.side_effect = lambda: MagicMock()
+        first = JpegEncoder()
+        second = JpegEncoder()
+        mock_nvjpeg_cls.assert_not_called()
+
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        first.encode(frame, 70)
+        second.encode(frame, 70)
+
+    assert first._nvjpeg is not None and second._nvjpeg is not None
+    assert first._nvjpeg is not second._nvjpeg
@@ -78,6 +78,22 @@ def test_metrics_registry_snapshot_contains_pipeline(metrics_app):
     )
 
 
+def test_metrics_registry_records_queue_depths_batch(metrics_app):
+    """A batched depth update should land on every pipeline in the mapping."""
+    metrics_registry.register_pipeline("cam-1", 1, "AprilTag", 2)
+
+    metrics_registry.record_queue_depths("cam-1", {1: (1, 2), 2: (2, 4)})
+
+    snapshot = metrics_registry.get_snapshot()
+    depths = {
+        pipeline["pipeline_id"]: pipeline["queue"]
+        for pipeline in snapshot["pipelines"]
+    }
+    assert depths[1]["current_depth"] == 1
+    assert depths[2]["current_depth"] == 2
+    assert depths[2]["max_size"] == 4
+
+
 def test_metrics_summary_endpoint(metrics_app, metrics_client):
     """API endpoint should serve the current metrics snapshot."""
     with metrics_app.app_context():
@@ -1,4 +1,6 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from app import usb_device_info
 from app.usb_device_info import (
     find_camera_index_by_identifier,
     _create_identifier,
@@ -87,6 +89,20 @@ def test_find_camera_index_by_identifier(mock_get_cameras):
     assert index is None
 
 
+@patch("app.usb_device_info.sys.platform", "linux")
+@patch("app.usb_device_info.get_usb_cameras_with_info")
+def test_find_camera_index_by_index_identifier_checks_device_node(mock_get_cameras):
+    """On Linux, index identifiers resolve from /dev/videoN without enumerating."""
+    with patch("app.usb_device_info.os.path.exists", return_value=True) as exists:
+        assert find_camera_index_by_identifier("usb:index:3") == 3
+    exists.assert_called_once_with("/dev/video3")
+
+    with patch("app.usb_device_info.os.path.exists", return_value=False):
+        assert find_camera_index_by_identifier("usb:index:3") is None
+
+    mock_get_cameras.assert_not_called()
+
+
 @patch("app.usb_device_info.sys.platform", "win32")
 @patch("app.usb_device_info._get_usb_cameras_windows")
 def test_get_usb_cameras_with_info_windows(mock_windows):
@@ -121,3 +137,121 @@ def test_get_usb_cameras_with_info_linux(mock_linux):
 
     get_usb_cameras_with_info()
     mock_linux.assert_called_once()
+
+
+@patch("app.usb_device_info.cv2.VideoCapture")
+def test_probe_camera_indices_opens_in_parallel(mock_capture):
+    """Every candidate index is probed, released, and open ones returned in order."""
+    opened = {0: True, 1: False, 2: True}
+
+    def make_capture(index, api_preference):
+        cap = MagicMock()
+        cap.isOpened.return_value = opened[index]
+        return cap
+
+    mock_capture.side_effect = make_capture
+
+    result = usb_device_info._probe_camera_indices([0, 1, 2], 200)
+
+    assert result == [0, 2]
+    assert mock_capture.call_count == 3
+    assert all(call.args[1] == 200 for call in mock_capture.call_args_list)
+
+
+@patch("app.usb_device_info.cv2.VideoCapture")
+def test_probe_camera_indices_skips_indices_in_use(mock_capture):
+    """Indices held open by a running camera are reported without reopening them."""
+    mock_capture.return_value.isOpened.return_value = False
+    usb_device_info.set_camera_index_in_use(1, True)
+    try:
+        result = usb_device_info._probe_camera_indices([0, 1, 2], 200)
+    finally:
+        usb_device_info.set_camera_index_in_use(1, False)
+
+    assert result == [1]
+    assert [call.args[0] for call in mock_capture.call_args_list] == [0, 2]
+
+
+@patch("app.usb_device_info.sys.platform", "linux")
+@patch("app.usb_device_info.os.path.exists")
+def test_candidate_indices_linux_skips_missing_device_nodes(mock_exists):
+    """On Linux only indices backed by a /dev/videoN node are probed."""
+    mock_exists.side_effect = lambda path: path in ("/dev/video0", "/dev/video2")
+
+    assert usb_device_info._candidate_indices() == [0, 2]
+
+
+def test_linux_lookup_skips_probe_and_metadata_nodes():
+    """Identifier lookups list capture nodes from udev without opening them."""
+    capture = MagicMock(device_node="/dev/video0", subsystem="usb", parent=None)
+    capture.get.side_effect = lambda key, default=None: {
+        "ID_V4L_CAPABILITIES": ":capture:",
+        "ID_VENDOR_ID": "046D",
+        "ID_MODEL_ID": "0825",
+        "ID_SERIAL_SHORT": "ABC",
+    }.get(key, default)
+    metadata = MagicMock(device_node="/dev/video1")
+    metadata.get.side_effect = lambda key, default=None: (
+        ":" if key == "ID_V4L_CAPABILITIES" else default
+    )
+    pyudev = MagicMock()
+    pyudev.Context.return_value.list_devices.return_value = [capture, metadata]
+
+    with patch.dict("sys.modules", {"pyudev": pyudev}), patch(
+        "app.usb_device_info._probe_camera_indices"
+    ) as mock_probe:
+        cameras = usb_device_info._get_usb_cameras_linux(verify=False)
+
+    mock_probe.assert_not_called()
+    assert [c["cv_index"] for c in cameras] == ["0"]
+    assert cameras[0]["identifier"] == "usb:046D:0825:ABC"
+
+
+def test_linux_listing_verifies_with_querycap():
+    """Device listings verify capture nodes with an ioctl instead of opening them."""
+    capture = MagicMock(device_node="/dev/video0", subsystem="usb")
+    capture.get.side_effect = lambda key, default=None: (
+        ":capture:" if key == "ID_V4L_CAPABILITIES" else default
+    )
+    busy = MagicMock(device_node="/dev/video2", subsystem="usb")
+    busy.get.side_effect = capture.get.side_effect
+    pyudev = MagicMock()
+    pyudev.Context.return_value.list_devices.return_value = [capture, busy]
+
+    with patch.dict("sys.modules", {"pyudev": pyudev}), patch(
+        "app.usb_device_info._v4l2_can_capture",
+        side_effect=lambda path: path == "/dev/video0",
+    ), patch("app.usb_device_info._probe_camera_indices") as mock_probe:
+        cameras = usb_device_info._get_usb_cameras_linux(verify=True)
+
+    mock_probe.assert_not_called()
+    assert [c["cv_index"] for c in cameras] == ["0"]
+
+
+def test_v4l2_can_capture_reads_node_capabilities():
+    """The per-node device_caps word decides capture support when present."""
+    import struct
+
+    def fake_ioctl(fd, request, buf, caps=(0x80000000 | 0x1, 0x00800000)):
+        assert request == usb_device_info._VIDIOC_QUERYCAP
+        struct.pack_into("=II", buf, 84, *caps)
+
+    with patch("app.usb_device_info.os.open", return_value=7), patch(
+        "app.usb_device_info.os.close"
+    ) as mock_close, patch("fcntl.ioctl", side_effect=fake_ioctl):
+        # A metadata node of a capture device: only device_caps tells them apart
+        assert not usb_device_info._v4l2_can_capture("/dev/video1")
+    mock_close.assert_called_once_with(7)
+
+    with patch("app.usb_device_info.os.open", return_value=7), patch(
+        "app.usb_device_info.os.close"
+    ), patch(
+        "fcntl.ioctl",
+        side_effect=lambda fd, request, buf: fake_ioctl(
+            fd, request, buf, caps=(0x80000001, 0x1)
+        ),
+    ):
+        assert usb_device_info._v4l2_can_capture("/dev/video0")
+
+    with patch("app.usb_device_info.os.open", side_effect=PermissionError):
+        assert not usb_device_info._v4l2_can_capture("/dev/video0")
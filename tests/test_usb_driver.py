@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
+import cv2
 import numpy as np
 
 from app.drivers.usb_driver import USBDriver
@@ -39,6 +40,27 @@ def test_connect_success(mock_video_capture, mock_find_index, usb_driver):
     mock_video_capture.assert_called_once_with(0)
     assert usb_driver.cap is mock_cap_instance
     assert usb_driver.resolved_index == 0
+    mock_cap_instance.set.assert_any_call(
+        cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")
+    )
+    mock_cap_instance.set.assert_any_call(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+
+@pytest.mark.parametrize(
+    "buffer_size, expected_stale_after_s",
+    [(1.0, None), (4.0, 2.0 / 30.0), (0.0, 2.0 / 30.0)],
+)
+def test_stale_frame_skip_only_armed_when_buffersize_ignored(
+    usb_driver, buffer_size, expected_stale_after_s
+):
+    """Stale-frame skipping is only needed when the one-frame buffer was not applied."""
+    usb_driver.cap = MagicMock()
+    props = {cv2.CAP_PROP_BUFFERSIZE: buffer_size, cv2.CAP_PROP_FPS: 30.0}
+    usb_driver.cap.get.side_effect = props.get
+
+    usb_driver._configure_capture()
+
+    assert usb_driver._stale_after_s == expected_stale_after_s
 
 
 @patch("app.drivers.usb_driver.find_camera_index_by_identifier")
@@ -148,7 +170,8 @@ def test_get_frame_success(usb_driver):
     mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
     usb_driver.cap = MagicMock()
     usb_driver.cap.isOpened.return_value = True
-    usb_driver.cap.read.return_value = (True, mock_frame)
+    usb_driver.cap.grab.return_value = True
+    usb_driver.cap.retrieve.return_value = (True, mock_frame)
 
     # Act
     frame = usb_driver.get_frame()
@@ -157,12 +180,45 @@ def test_get_frame_success(usb_driver):
     assert np.array_equal(frame, mock_frame)
 
 
+def test_get_frame_borrowed_hands_over_read_buffer(usb_driver):
+    """USB frames are lent to the caller without a copy."""
+    mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    usb_driver.cap = MagicMock()
+    usb_driver.cap.isOpened.return_value = True
+    usb_driver.cap.grab.return_value = True
+    usb_driver.cap.retrieve.return_value = (True, mock_frame)
+
+    assert usb_driver.supports_borrowed_frames()
+    frame, release_fn = usb_driver.get_frame_borrowed()
+
+    assert frame is mock_frame
+    usb_driver.cap.retrieve.assert_called_once_with()
+    assert release_fn is not None
+
+
+def test_get_frame_borrowed_decodes_into_released_frame(usb_driver):
+    """A released borrowed frame is passed back to retrieve() as its output array."""
+    mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    usb_driver.cap = MagicMock()
+    usb_driver.cap.isOpened.return_value = True
+    usb_driver.cap.grab.return_value = True
+    usb_driver.cap.retrieve.side_effect = lambda *args: (True, args[0] if args else mock_frame)
+
+    frame, release_fn = usb_driver.get_frame_borrowed()
+    release_fn(frame)
+    second, _ = usb_driver.get_frame_borrowed()
+
+    assert second is mock_frame
+    usb_driver.cap.retrieve.assert_called_with(mock_frame)
+
+
 def test_get_frame_read_failure(usb_driver):
     """Test getting a frame when the read fails."""
     # Arrange
     usb_driver.cap = MagicMock()
     usb_driver.cap.isOpened.return_value = True
-    usb_driver.cap.read.return_value = (False, None)
+    usb_driver.cap.grab.return_value = True
+    usb_driver.cap.retrieve.return_value = (False, None)
 
     # Act
     frame = usb_driver.get_frame()
@@ -171,6 +227,49 @@ def test_get_frame_read_failure(usb_driver):
     assert frame is None
 
 
+def test_get_frame_grab_failure(usb_driver):
+    """A failed grab returns None without decoding anything."""
+    usb_driver.cap = MagicMock()
+    usb_driver.cap.isOpened.return_value = True
+    usb_driver.cap.grab.return_value = False
+
+    assert usb_driver.get_frame() is None
+    usb_driver.cap.retrieve.assert_not_called()
+
+
+def test_get_frame_skips_stale_frame(usb_driver):
+    """After falling behind, the queued frame is grabbed and dropped undecoded."""
+    mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    usb_driver.cap = MagicMock()
+    usb_driver.cap.isOpened.return_value = True
+    usb_driver.cap.grab.return_value = True
+    usb_driver.cap.retrieve.return_value = (True, mock_frame)
+    usb_driver._stale_after_s = 0.1
+
+    times = [10.0, 10.05, 10.05, 10.5, 10.5]
+    with patch("app.drivers.usb_driver.time.monotonic", side_effect=times):
+        usb_driver.get_frame()
+        usb_driver.get_frame()
+        assert usb_driver.cap.grab.call_count == 2
+        usb_driver.get_frame()
+
+    assert usb_driver.cap.grab.call_count == 4
+    assert usb_driver.cap.retrieve.call_count == 3
+
+
+def test_skip_frame_grabs_without_decoding(usb_driver):
+    """Skipped frames are dequeued with grab() and never retrieved."""
+    usb_driver.cap = MagicMock()
+    usb_driver.cap.isOpened.return_value = True
+    usb_driver.cap.grab.return_value = True
+
+    assert usb_driver.skip_frame() is True
+    usb_driver.cap.retrieve.assert_not_called()
+
+    usb_driver.cap.grab.return_value = False
+    assert usb_driver.skip_frame() is False
+
+
 def test_get_frame_not_connected(usb_driver):
     """Test getting a frame when not connected."""
     # Arrange